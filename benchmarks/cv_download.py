@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Benchmark: CV download latency with a cold and a warm PDF cache.
+
+"cold" deletes the rendered file before each request, which is what every
+download used to cost; "warm" serves the file rendered for this version.
+
+    python benchmarks/cv_download.py
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'leumasp.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import RequestFactory, override_settings  # noqa: E402
+
+from leumas.views.cv import download_cv, get_cv_path  # noqa: E402
+
+REQUESTS = 50
+
+
+def download():
+    response = download_cv(RequestFactory().get('/download-cv/'))
+    b''.join(response.streaming_content)
+    response.close()
+
+
+def cold():
+    get_cv_path().unlink(missing_ok=True)
+    download()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir, override_settings(CV_CACHE_DIR=cache_dir):
+        print(f'{"":8}{"ms/request":>12}')
+        for name, func in (('cold', cold), ('warm', download)):
+            seconds = timeit.timeit(func, number=REQUESTS)
+            print(f'{name:8}{seconds / REQUESTS * 1e3:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark: render time of the four views built on index.html.
+
+"cold" clears the cache before every render, so each section is rendered
+from scratch as it was before fragment caching; "warm" reuses the cached
+fragments. index and about are measured without their full-page cache so
+only the template work is timed.
+
+    python benchmarks/index_render.py [renders]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'leumasp.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+SCRATCH = tempfile.mkdtemp()
+settings.DEBUG = False
+settings.ALLOWED_HOSTS = ['testserver']
+settings.DATABASES['default'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': os.path.join(SCRATCH, 'benchmark.sqlite3'),
+}
+django.setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from leumas.models import BlogPost  # noqa: E402
+from leumas.views import ContactSuccessView, ContactView, about, index  # noqa: E402
+
+VIEWS = {
+    'index': index.__wrapped__,
+    'about': about.__wrapped__,
+    'contact': ContactView.as_view(),
+    'success': ContactSuccessView.as_view(),
+}
+
+
+def render(view):
+    request = RequestFactory().get('/', HTTP_ACCEPT='text/html,image/webp,*/*')
+    response = view(request)
+    # Class-based views return a lazy TemplateResponse
+    return response.render() if hasattr(response, 'render') else response
+
+
+def cold(view):
+    cache.clear()
+    render(view)
+
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    call_command('migrate', verbosity=0)
+    for i in range(4):
+        BlogPost.objects.create(
+            title=f'Post {i}', slug=f'post-{i}', category='Benchmark',
+            excerpt='Excerpt', content='Body', is_published=True,
+        )
+
+    print(f'{"":10}{"cold ms":>10}{"warm ms":>10}{"speedup":>10}')
+    for name, view in VIEWS.items():
+        cold_seconds = timeit.timeit(lambda: cold(view), number=renders) / renders
+        render(view)
+        warm_seconds = timeit.timeit(lambda: render(view), number=renders) / renders
+        print(f'{name:10}{cold_seconds * 1e3:>10.2f}{warm_seconds * 1e3:>10.2f}'
+              f'{cold_seconds / warm_seconds:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark: DRF's stdlib JSONRenderer against the orjson renderer.
+
+Renders a serialized BlogPostSerializer payload of 10, 100 and 1000 rows.
+Only the encoding step is timed; serialization is done once up front.
+
+    python benchmarks/json_renderer.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'leumasp.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from leumas.models import BlogPost, Tag  # noqa: E402
+from leumas.renderers import ORJSONRenderer  # noqa: E402
+from leumas.serializers import BlogPostSerializer  # noqa: E402
+
+SIZES = [10, 100, 1000]
+RUNS = 200
+
+
+def build_payload(rows):
+    """Serialize unsaved posts so the benchmark needs no database"""
+    now = timezone.now()
+    tags = [Tag(id=i, name=f"Tag {i}", slug=f"tag-{i}") for i in range(3)]
+    posts = []
+    for i in range(rows):
+        post = BlogPost(
+            id=i + 1, title=f"Post {i} — café notes", slug=f"post-{i}",
+            category="Benchmarks", excerpt="An excerpt " * 10,
+            published_date=now, updated_date=now, views_count=i, reading_time=4,
+            meta_description="Description",
+        )
+        # Stand in for the prefetch cache that tags.all() reads
+        post._prefetched_objects_cache = {'tags': tags}
+        posts.append(post)
+    return BlogPostSerializer(posts, many=True).data
+
+
+def main():
+    print(f"{'rows':>6} {'stdlib ms':>10} {'orjson ms':>10} {'speedup':>8}")
+    for rows in SIZES:
+        data = build_payload(rows)
+        assert JSONRenderer().render(data) == ORJSONRenderer().render(data)
+        stdlib = timeit.timeit(lambda: JSONRenderer().render(data), number=RUNS) / RUNS * 1000
+        fast = timeit.timeit(lambda: ORJSONRenderer().render(data), number=RUNS) / RUNS * 1000
+        print(f"{rows:>6} {stdlib:>10.3f} {fast:>10.3f} {stdlib / fast:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-request cost of MetricsMiddleware.
+
+Times a trivial view called directly and through the middleware, in the
+default in-memory mode and with PROMETHEUS_MULTIPROC_DIR set (mmap files,
+as under gunicorn). The difference is the overhead every request pays.
+
+    python benchmarks/metrics_overhead.py [--multiprocess]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'leumasp.settings')
+if '--multiprocess' in sys.argv:
+    # Must be set before prometheus_client creates any metric
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp()
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.urls import resolve  # noqa: E402
+
+from leumas.middleware import MetricsMiddleware  # noqa: E402
+
+REQUESTS = 20000
+
+
+def view(request):
+    return HttpResponse(b'ok')
+
+
+def main():
+    request = RequestFactory().get('/blogs')
+    request.resolver_match = resolve('/blogs')
+    middleware = MetricsMiddleware(view)
+    mode = 'multiprocess' if 'PROMETHEUS_MULTIPROC_DIR' in os.environ else 'in-memory'
+
+    bare = timeit.timeit(lambda: view(request), number=REQUESTS) / REQUESTS
+    measured = timeit.timeit(lambda: middleware(request), number=REQUESTS) / REQUESTS
+    print(f'{mode}: view {bare * 1e6:.1f} us, with metrics {measured * 1e6:.1f} us, '
+          f'overhead {(measured - bare) * 1e6:.1f} us/request')
+
+
+if __name__ == '__main__':
+    main()
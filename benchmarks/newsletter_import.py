@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark: time and peak memory of a streaming subscriber import.
+
+Generates a CSV of N addresses (default 1,000,000) and imports it into a
+scratch SQLite database. Peak Python memory should stay flat as N grows,
+because only one batch is held at a time.
+
+    python benchmarks/newsletter_import.py [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'leumasp.settings')
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+SCRATCH = tempfile.mkdtemp()
+# DEBUG keeps every query's SQL, which would dominate the memory profile
+settings.DEBUG = False
+settings.DATABASES['default'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': os.path.join(SCRATCH, 'benchmark.sqlite3'),
+}
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+
+from leumas.newsletter import import_subscribers, read_emails  # noqa: E402
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    call_command('migrate', verbosity=0)
+    path = os.path.join(SCRATCH, 'subscribers.csv')
+    with open(path, 'w') as csv_file:
+        csv_file.write('email\n')
+        for i in range(rows):
+            csv_file.write(f'subscriber{i}@example.com\n')
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(path, newline='') as lines:
+        read, invalid, created = import_subscribers(read_emails(lines), batch_size=1000)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f'{read} rows read, {created} created in {elapsed:.1f}s '
+          f'({read / elapsed:,.0f} rows/s), peak {peak / 2**20:.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"""gunicorn settings, loaded automatically from the working directory.
+
+With PROMETHEUS_MULTIPROC_DIR set, every worker writes its metrics to that
+directory (see leumas/metrics.py). It is emptied when the master starts so
+counters from an earlier run are not summed in, and a dead worker's live
+values are dropped when it exits.
+"""
+
+import os
+import shutil
+
+METRICS_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+
+
+def on_starting(server):
+    if METRICS_DIR:
+        shutil.rmtree(METRICS_DIR, ignore_errors=True)
+        os.makedirs(METRICS_DIR, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if METRICS_DIR:
+        try:
+            from prometheus_client import multiprocess
+        except ImportError:
+            return
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import Newsletter, BlogPost, Portfolio, Service, Skill, Tag, Contact
+from django.utils import timezone
+from .newsletter import export_response
+from .models import Newsletter, BlogPost, Portfolio, Service, Skill, Tag, Contact, OutboxEmail, Broadcast
 
 
 @admin.register(Newsletter)
@@ -13,6 +15,11 @@ class NewsletterAdmin(admin.ModelAdmin):
             'fields': ('email', 'is_active', 'subscribed_at')
         }),
     )
+    actions = ['export_csv']
+
+    @admin.action(description='Export selected subscribers as CSV')
+    def export_csv(self, request, queryset):
+        return export_response(queryset)
 
 
 @admin.register(Tag)
@@ -28,7 +35,7 @@ class BlogPostAdmin(admin.ModelAdmin):
     list_filter = ('is_published', 'category', 'published_date', 'tags')
     search_fields = ('title', 'content', 'author')
     prepopulated_fields = {'slug': ('title',)}
-    readonly_fields = ('views_count', 'published_date', 'updated_date')
+    readonly_fields = ('views_count', 'word_count', 'reading_time', 'published_date', 'updated_date')
     filter_horizontal = ('tags',)
     
     fieldsets = (
@@ -36,13 +43,13 @@ class BlogPostAdmin(admin.ModelAdmin):
             'fields': ('title', 'slug', 'author')
         }),
         ('Content', {
-            'fields': ('excerpt', 'content', 'featured_image')
+            'fields': ('excerpt', 'content', 'featured_image', 'image_path')
         }),
         ('Metadata', {
             'fields': ('category', 'tags', 'meta_description', 'meta_keywords', 'is_published')
         }),
         ('Statistics', {
-            'fields': ('views_count', 'published_date', 'updated_date'),
+            'fields': ('views_count', 'word_count', 'reading_time', 'published_date', 'updated_date'),
             'classes': ('collapse',)
         }),
     )
@@ -108,3 +115,35 @@ class ContactAdmin(admin.ModelAdmin):
             'fields': ('is_read', 'submitted_at')
         }),
     )
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject', 'to')
+    readonly_fields = ('created_at', 'sent_at', 'last_error')
+    actions = ['retry_now']
+
+    @admin.action(description='Retry selected emails now')
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboxEmail.STATUS_SENT).update(
+            status=OutboxEmail.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f'{updated} emails queued for retry.')
+
+
+@admin.register(Broadcast)
+class BroadcastAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'sent_count', 'failed_count', 'created_at', 'finished_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject',)
+    readonly_fields = ('status', 'last_subscriber_id', 'sent_count', 'failed_count', 'started_at', 'finished_at')
+    actions = ['queue_for_sending']
+
+    @admin.action(description='Queue selected broadcasts for sending')
+    def queue_for_sending(self, request, queryset):
+        # The send_broadcast worker picks them up; sending 100k messages
+        # does not belong in a request
+        updated = queryset.filter(status=Broadcast.STATUS_DRAFT).update(status=Broadcast.STATUS_QUEUED)
+        self.message_user(request, f'{updated} broadcasts queued for sending.')
@@ -1,28 +1,171 @@
+import calendar
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
+from rest_framework.authentication import SessionAuthentication, TokenAuthentication
+from rest_framework.permissions import SAFE_METHODS
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import BlogPost, Portfolio, Service, Skill, Newsletter
+from .cache import get_version
+from .models import BlogPost, Portfolio, Service, Skill, Newsletter, normalize_email
+from .newsletter import subscribe
+from .pagination import KeysetPagination
+from .permissions import CanBulkSubscribe
+from .search import FullTextSearchFilter
 from .serializers import (
     BlogPostSerializer, BlogPostDetailSerializer,
     PortfolioSerializer, PortfolioDetailSerializer,
-    ServiceSerializer, SkillSerializer, NewsletterSerializer
+    ServiceSerializer, SkillSerializer, NewsletterSerializer, NewsletterBatchSerializer
 )
+from .view_counts import record_view
+
+
+class ConditionalGetMixin:
+    """
+    Weak ETag, and Last-Modified where it is sound, on read responses.
+
+    Validators are computed once the rows a response returns have been
+    fetched, and before they are serialized, so a matching If-None-Match or
+    If-Modified-Since is answered with a 304 without serializing anything.
+    The ETag hashes those rows' loaded columns and prefetched relations, the
+    page's count and links, the content version that signals bump (it
+    covers data read from other rows, such as related posts), the request
+    path and the negotiated media type.
+
+    Last-Modified is only sent for single objects and only when the response
+    leaves out `undated_fields`: the fields that can change without
+    `last_modified_field` moving, such as UPDATE-flushed view counts and
+    m2m tags. For lists it would miss deletes and unpublished rows.
+    """
+    cache_namespace = None
+    last_modified_field = None
+    undated_fields = ()
+
+    def get_etag(self, rows, envelope=None):
+        key = repr([
+            get_version(self.cache_namespace),
+            self.request.get_full_path(),
+            self.request.accepted_media_type,
+            envelope,
+            [row_state(row) for row in rows],
+        ])
+        return 'W/"%s"' % hashlib.sha1(key.encode()).hexdigest()
+
+    def get_last_modified(self, instance):
+        if not self.last_modified_field:
+            return None
+        requested = self.get_serializer_class().requested_fields(self.request)
+        if set(requested) & set(self.undated_fields):
+            return None
+        value = getattr(instance, self.last_modified_field)
+        return calendar.timegm(value.utctimetuple())
+
+    def conditional_response(self, render, etag, last_modified=None):
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render()
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        # Filtered and paginated once; the validators come from this page
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            rows = list(queryset)
+            return self.conditional_response(
+                lambda: Response(self.get_serializer(rows, many=True).data),
+                self.get_etag(rows),
+            )
+        # The count and links, without serializing the results
+        envelope = dict(self.get_paginated_response([]).data)
+        envelope.pop('results', None)
+        return self.conditional_response(
+            lambda: self.get_paginated_response(self.get_serializer(page, many=True).data),
+            self.get_etag(page, sorted(envelope.items())),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.conditional_response(
+            lambda: Response(self.get_serializer(instance).data),
+            self.get_etag([instance]),
+            self.get_last_modified(instance),
+        )
 
 
-class BlogPostViewSet(viewsets.ReadOnlyModelViewSet):
+def row_state(instance):
+    """The loaded column values of `instance` and its prefetched relations"""
+    values = [
+        instance.__dict__.get(field.attname) for field in instance._meta.concrete_fields
+        if field.attname in instance.__dict__
+    ]
+    prefetched = getattr(instance, '_prefetched_objects_cache', {})
+    for name in sorted(prefetched):
+        values.append([row_state(related) for related in prefetched[name]])
+    return values
+
+
+class ProjectionMixin:
+    """
+    Narrow the queryset to the fields the serializer will output.
+
+    Columns no requested field reads are deferred, and tags are prefetched
+    only when `tags` is in the response. Keyset columns are always loaded
+    because the paginator reads them to build cursors.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Detail actions other than retrieve don't serialize this queryset
+        if self.request.method not in SAFE_METHODS or (self.detail and self.action != 'retrieve'):
+            return queryset
+        return self.project(queryset, self.get_serializer_class().requested_fields(self.request))
+
+    def project(self, queryset, requested):
+        keep = set(requested)
+        # Read for Last-Modified whether or not it is in the response
+        if getattr(self, 'last_modified_field', None):
+            keep.add(self.last_modified_field)
+        for ordering in getattr(self, 'cursor_orderings', ()):
+            keep.update(field.lstrip('-') for field in ordering)
+        deferred = [
+            field.name for field in queryset.model._meta.concrete_fields
+            if not field.primary_key and field.name not in keep
+        ]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+        if 'tags' in keep:
+            queryset = queryset.prefetch_related('tags')
+        return queryset
+
+
+class BlogPostViewSet(ConditionalGetMixin, ProjectionMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for blog posts.
     
     List, retrieve, and search blog posts.
     """
     queryset = BlogPost.objects.filter(is_published=True)
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['category', 'tags', 'author']
     search_fields = ['title', 'content', 'excerpt']
     ordering_fields = ['published_date', 'views_count']
     ordering = ['-published_date']
+    pagination_class = KeysetPagination
+    cache_namespace = 'blog'
+    last_modified_field = 'updated_date'
+    # View counts are flushed with UPDATE; tags and related posts are other rows
+    undated_fields = ['views_count', 'tags', 'related_posts']
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -31,32 +174,37 @@ class BlogPostViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=True, methods=['post'])
     def increment_views(self, request, pk=None):
-        """Increment view count for a blog post"""
+        """Count a view; it is buffered and written to the database in batches"""
         blog = self.get_object()
-        blog.increment_views()
-        return Response({'views_count': blog.views_count})
+        pending = record_view(blog.pk)
+        return Response({'views_count': blog.views_count + pending})
 
     @action(detail=True, methods=['get'])
     def related_posts(self, request, pk=None):
         """Get related posts for this blog"""
-        blog = self.get_object()
-        related = blog.get_related_posts()
-        serializer = BlogPostSerializer(related, many=True)
-        return Response(serializer.data)
+        related = list(self.get_object().get_related_posts())
+        return self.conditional_response(
+            lambda: Response(self.get_serializer(related, many=True).data),
+            self.get_etag(related),
+        )
 
 
-class PortfolioViewSet(viewsets.ReadOnlyModelViewSet):
+class PortfolioViewSet(ConditionalGetMixin, ProjectionMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for portfolio projects.
     
     List and retrieve portfolio projects.
     """
     queryset = Portfolio.objects.all()
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['category', 'tags', 'is_featured']
     search_fields = ['title', 'description', 'challenge', 'solution']
     ordering_fields = ['created_date', 'is_featured']
     ordering = ['-is_featured', '-created_date']
+    pagination_class = KeysetPagination
+    cache_namespace = 'portfolio'
+    last_modified_field = 'updated_date'
+    undated_fields = ['tags']
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -66,12 +214,14 @@ class PortfolioViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get featured portfolio projects"""
-        featured = self.get_queryset().filter(is_featured=True)
-        serializer = PortfolioSerializer(featured, many=True)
-        return Response(serializer.data)
+        featured = list(self.get_queryset().filter(is_featured=True))
+        return self.conditional_response(
+            lambda: Response(self.get_serializer(featured, many=True).data),
+            self.get_etag(featured),
+        )
 
 
-class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceViewSet(ConditionalGetMixin, ProjectionMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for services.
     
@@ -81,9 +231,10 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ServiceSerializer
     ordering_fields = ['order']
     ordering = ['order']
+    cache_namespace = 'service'
 
 
-class SkillViewSet(viewsets.ReadOnlyModelViewSet):
+class SkillViewSet(ConditionalGetMixin, ProjectionMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for technical skills.
     
@@ -95,13 +246,15 @@ class SkillViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ['category']
     ordering_fields = ['category', 'proficiency']
     ordering = ['category', '-proficiency']
+    cache_namespace = 'skill'
 
 
 class NewsletterViewSet(viewsets.ModelViewSet):
     """
     API endpoint for newsletter subscriptions.
     
-    Create new newsletter subscriptions.
+    Create new newsletter subscriptions, one at a time or in batches.
+    Subscribing is idempotent: known addresses are reactivated if needed.
     """
     queryset = Newsletter.objects.all()
     serializer_class = NewsletterSerializer
@@ -110,11 +263,33 @@ class NewsletterViewSet(viewsets.ModelViewSet):
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-        return Response(
-            {'detail': 'Successfully subscribed to the newsletter.'},
-            status=status.HTTP_201_CREATED
-        )
+        if subscribe([serializer.validated_data['email']]):
+            return Response(
+                {'detail': 'Successfully subscribed to the newsletter.'},
+                status=status.HTTP_201_CREATED
+            )
+        return Response({'detail': 'This email is already subscribed.'})
 
-    def perform_create(self, serializer):
-        serializer.save()
+    @action(
+        detail=False, methods=['post'],
+        # Tokens let non-browser partners call it without a CSRF token
+        authentication_classes=[TokenAuthentication, SessionAuthentication],
+        permission_classes=[CanBulkSubscribe],
+    )
+    def batch(self, request):
+        """Subscribe many addresses in one request; invalid ones are reported back"""
+        serializer = NewsletterBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        valid, invalid = [], []
+        for email in serializer.validated_data['emails']:
+            try:
+                validate_email(email.strip())
+                valid.append(email)
+            except ValidationError:
+                invalid.append(email)
+        subscribed = subscribe(valid)
+        return Response({
+            'subscribed': len(subscribed),
+            'already_subscribed': len({normalize_email(email) for email in valid}) - len(subscribed),
+            'invalid': invalid,
+        })
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class LeumasConfig(AppConfig):
     name = 'leumas'
+
+    def ready(self):
+        # Connect cache invalidation handlers
+        from leumas import signals  # noqa: F401
+        from leumas import checks  # noqa: F401
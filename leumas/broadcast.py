@@ -0,0 +1,210 @@
+"""Batched newsletter broadcasts.
+
+send_broadcast() walks the active subscribers in primary-key order, one
+keyset page at a time. The email is rendered once per batch, and each batch
+is split across BROADCAST_CONNECTIONS worker threads. Every worker keeps one
+SMTP connection open for the whole run. A shared limiter caps the overall
+rate at BROADCAST_RATE messages per second.
+
+After each batch the last subscriber id and the counters are saved on the
+Broadcast row. A run that crashes resumes after the last completed batch,
+so only the batch that was in flight can be delivered twice.
+
+A refused recipient is counted as failed and skipped. Any other error
+means the mail server itself is failing. The message is retried once
+over a fresh connection; if that fails too, the run stops with
+BroadcastInterrupted. The workers finish their current message, the
+subscribers the batch did reach are saved in `delivered_ids`, and the
+broadcast is queued again. The next send_broadcast resumes the batch
+without sending to them twice or skipping anyone.
+"""
+
+import html
+import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from leumas.models import Broadcast, Newsletter
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE = 'leumas/emails/newsletter_broadcast'
+
+
+class BroadcastInterrupted(Exception):
+    """The mail server failed; the broadcast was queued to resume later"""
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate else 0
+        self.lock = threading.Lock()
+        self.next_at = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Sender:
+    """One SMTP connection, reopened after a failure"""
+
+    def __init__(self):
+        self.connection = None
+
+    def send(self, message):
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+            self.connection.open()
+        message.connection = self.connection
+        try:
+            message.send()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+
+
+def render_broadcast(broadcast):
+    context = {
+        'subject': broadcast.subject,
+        'body': broadcast.body,
+        'text_body': html.unescape(strip_tags(broadcast.body)).strip(),
+    }
+    return (
+        render_to_string(f'{TEMPLATE}.txt', context),
+        render_to_string(f'{TEMPLATE}.html', context),
+    )
+
+
+def _send_chunk(sender, recipients, limiter, stop, subject, text, html_body):
+    """Send to (subscriber id, email) pairs until done or `stop` is set.
+
+    Returns (sent, failed, ids reached, outage exception or None).
+    """
+    sent = failed = 0
+    reached = []
+    for pk, email in recipients:
+        if stop.is_set():
+            break
+        limiter.wait()
+        message = EmailMultiAlternatives(subject=subject, body=text, to=[email])
+        message.attach_alternative(html_body, 'text/html')
+        for attempt in (1, 2):
+            try:
+                sender.send(message)
+            except smtplib.SMTPRecipientsRefused as exc:
+                failed += 1
+                logger.warning('Broadcast to %s refused: %s', email, exc)
+                break
+            except Exception as exc:
+                # The sender reconnects on the next call; failing twice is an outage
+                if attempt == 2:
+                    stop.set()
+                    return sent, failed, reached, exc
+            else:
+                sent += 1
+                break
+        reached.append(pk)
+    return sent, failed, reached, None
+
+
+def send_broadcast(broadcast, batch_size=None, rate=None, connections=None):
+    """Send `broadcast` to every active subscriber not reached yet.
+
+    Returns (sent, failed, seconds) for this run. Raises
+    BroadcastInterrupted, with the broadcast queued again, when the mail
+    server fails.
+    """
+    batch_size = batch_size or settings.BROADCAST_BATCH_SIZE
+    connections = connections or settings.BROADCAST_CONNECTIONS
+    limiter = RateLimiter(settings.BROADCAST_RATE if rate is None else rate)
+    senders = [Sender() for _ in range(connections)]
+    stop = threading.Event()
+
+    now = timezone.now()
+    Broadcast.objects.filter(pk=broadcast.pk, started_at__isnull=True).update(started_at=now)
+    Broadcast.objects.filter(pk=broadcast.pk).update(status=Broadcast.STATUS_SENDING)
+    broadcast.refresh_from_db()
+
+    sent = failed = 0
+    start = time.monotonic()
+    cursor = broadcast.last_subscriber_id
+    try:
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            while True:
+                batch = list(
+                    Newsletter.objects.filter(is_active=True, pk__gt=cursor)
+                    .order_by('pk').values_list('pk', 'email')[:batch_size]
+                )
+                if not batch:
+                    break
+                delivered = set(broadcast.delivered_ids)
+                recipients = [(pk, email) for pk, email in batch if pk not in delivered]
+                text, html_body = render_broadcast(broadcast)
+                send_chunk = partial(
+                    _send_chunk, limiter=limiter, stop=stop,
+                    subject=broadcast.subject, text=text, html_body=html_body,
+                )
+                results = pool.map(send_chunk, senders, [recipients[i::connections] for i in range(connections)])
+                batch_sent = batch_failed = 0
+                outage = None
+                for chunk_sent, chunk_failed, reached, error in results:
+                    batch_sent += chunk_sent
+                    batch_failed += chunk_failed
+                    delivered.update(reached)
+                    outage = outage or error
+                sent += batch_sent
+                failed += batch_failed
+                if outage is not None:
+                    # Keep the checkpoint; remember who this batch reached
+                    Broadcast.objects.filter(pk=broadcast.pk).update(
+                        status=Broadcast.STATUS_QUEUED,
+                        delivered_ids=sorted(delivered),
+                        sent_count=F('sent_count') + batch_sent,
+                        failed_count=F('failed_count') + batch_failed,
+                    )
+                    broadcast.refresh_from_db()
+                    raise BroadcastInterrupted(f'{type(outage).__name__}: {outage}') from outage
+                cursor = batch[-1][0]
+                Broadcast.objects.filter(pk=broadcast.pk).update(
+                    last_subscriber_id=cursor,
+                    delivered_ids=[],
+                    sent_count=F('sent_count') + batch_sent,
+                    failed_count=F('failed_count') + batch_failed,
+                )
+                broadcast.delivered_ids = []
+    finally:
+        for sender in senders:
+            sender.close()
+
+    Broadcast.objects.filter(pk=broadcast.pk).update(
+        status=Broadcast.STATUS_SENT, finished_at=timezone.now()
+    )
+    broadcast.refresh_from_db()
+    return sent, failed, time.monotonic() - start
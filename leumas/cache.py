@@ -0,0 +1,192 @@
+"""Versioned content caching.
+
+Cached read paths put a per-namespace content version in their keys. Signal
+handlers bump the version whenever the underlying rows change, so stale
+entries are never read again and simply age out of the cache.
+
+The versions live in the default cache, so it must be shared by every
+worker (REDIS_URL in settings); a per-process cache would only invalidate
+the worker that handled the save. That cache outlives deploys, so page and
+fragment keys also carry deploy_version(), a digest of the templates and
+the static and image manifests.
+"""
+
+import hashlib
+import re
+import time
+from functools import lru_cache, wraps
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template import engines
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import parse_http_date_safe, quote_etag
+
+from leumas.images import negotiate_format
+from leumas.metrics import record_cache
+
+VERSION_KEY = 'leumas:version:{}'
+
+# Cached pages are shared between visitors, so the per-visitor CSRF token is
+# swapped for a placeholder on store and re-injected on every hit.
+CSRF_INPUT_RE = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+CSRF_PLACEHOLDER = b'__leumas_csrf_token__'
+
+
+def site_digest():
+    """Content hash of the inputs every page shares: templates and the
+    static and image manifests"""
+    paths = []
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            paths += sorted(p for p in Path(directory).rglob('*') if p.is_file())
+    paths += [Path(settings.STATIC_ROOT) / 'staticfiles.json', Path(settings.IMAGE_VARIANTS_MANIFEST)]
+    sha = hashlib.sha1()
+    for path in paths:
+        try:
+            sha.update(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        sha.update(b'\0')
+    return sha.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _deploy_version():
+    return site_digest()[:12]
+
+
+def deploy_version():
+    """site_digest() for cache keys, computed once per process since its
+    inputs only change on deploy. With DEBUG on it is recomputed on every
+    call, so template edits under runserver show up at once."""
+    return site_digest()[:12] if settings.DEBUG else _deploy_version()
+
+
+def get_version(namespace):
+    """Return the current content version for `namespace`"""
+    key = VERSION_KEY.format(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never reuses an old value
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate every entry cached under `namespace`"""
+    key = VERSION_KEY.format(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+        return cache.get(key)
+
+
+def cached(namespace, name, builder, timeout=None):
+    """Return the cached value for `name`, building it on a miss"""
+    key = f'leumas:{namespace}:{get_version(namespace)}:{name}'
+    missing = object()
+    value = cache.get(key, missing)
+    record_cache('content', value is not missing)
+    if value is missing:
+        value = builder()
+        if timeout is None:
+            timeout = settings.CONTENT_CACHE_SECONDS
+        cache.set(key, value, timeout)
+    return value
+
+
+def page_cache_key(request, namespaces, data_versions=()):
+    """Build the page cache key from the URL and the content versions it shows"""
+    versions = '.'.join([
+        deploy_version(), *(str(get_version(namespace)) for namespace in namespaces), *data_versions,
+    ])
+    path = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    # Pages pick image formats from the Accept header (see leumas.images)
+    return f'leumas:page:{versions}:{path}:{negotiate_format(request)}'
+
+
+def versioned_cache_page(*namespaces, data_versions=()):
+    """Cache a public page until the content in `namespaces` changes.
+
+    Only successful GET/HEAD responses are stored. Saving any model mapped to
+    one of the namespaces in leumas.signals invalidates the page; otherwise it
+    lives for CACHE_MIDDLEWARE_SECONDS. `data_versions` are the hashes of the
+    leumas.views.data dictionaries the page shows, which change on deploy.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            key = page_cache_key(request, namespaces, data_versions)
+            entry = cache.get(key)
+            record_cache('page', entry is not None)
+            if entry is not None:
+                content, content_type = entry
+                token = get_token(request).encode()
+                response = HttpResponse(content.replace(CSRF_PLACEHOLDER, token), content_type=content_type)
+                patch_vary_headers(response, ['Accept'])
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            patch_vary_headers(response, ['Accept'])
+            if response.status_code == 200 and not response.streaming and not response.cookies:
+                content = CSRF_INPUT_RE.sub(rb'\1' + CSRF_PLACEHOLDER + rb'\2', response.content)
+                cache.set(key, (content, response['Content-Type']), settings.CACHE_MIDDLEWARE_SECONDS)
+            return response
+        return _wrapped_view
+    return decorator
+
+
+def versioned_conditional_cache(*namespaces, max_age, data_versions=()):
+    """Cache a machine-read document (sitemap, feed) until `namespaces` change.
+
+    `data_versions` are the hashes of any leumas.views.data dictionaries
+    the document is built from, which change on deploy rather than on save.
+
+    The rendered bytes are stored with the view's headers and a content
+    ETag. Every hit answers If-None-Match / If-Modified-Since with a 304
+    and is marked public for `max_age` seconds, so polling clients cost a
+    cache lookup at most.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            versions = '.'.join([*(str(get_version(namespace)) for namespace in namespaces), *data_versions])
+            path = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+            key = f'leumas:document:{versions}:{path}'
+            entry = cache.get(key)
+            record_cache('document', entry is not None)
+            if entry is None:
+                response = view_func(request, *args, **kwargs)
+                if hasattr(response, 'render'):
+                    response.render()
+                if response.status_code != 200:
+                    return response
+                headers = dict(response.items())
+                headers['ETag'] = quote_etag(hashlib.md5(response.content).hexdigest())
+                entry = (response.content, headers)
+                cache.set(key, entry, settings.CONTENT_CACHE_SECONDS)
+
+            content, headers = entry
+            last_modified = headers.get('Last-Modified')
+            response = get_conditional_response(
+                request, etag=headers['ETag'],
+                last_modified=parse_http_date_safe(last_modified) if last_modified else None,
+            )
+            if response is None:
+                response = HttpResponse(content)
+            for name, value in headers.items():
+                if name != 'Content-Length':
+                    response[name] = value
+            patch_cache_control(response, public=True, max_age=max_age)
+            return response
+        return _wrapped_view
+    return decorator
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Content versions (leumas/cache.py) only invalidate the process that
+    bumped them when the cache is not shared between workers"""
+    backend = settings.CACHES['default']['BACKEND']
+    if backend != 'django.core.cache.backends.locmem.LocMemCache':
+        return []
+    return [Warning(
+        'The default cache is local to each process.',
+        hint='Set REDIS_URL so every worker sees content changes; otherwise '
+             'workers keep serving cached pages until they expire.',
+        id='leumas.W001',
+    )]
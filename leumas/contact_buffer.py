@@ -0,0 +1,163 @@
+"""Low-overhead persistence of contact form submissions.
+
+The request handler only does one cache write (the duplicate check) and
+appends the submission to an in-process buffer. A background thread saves
+buffered submissions with bulk_create, together with their outbox emails,
+every CONTACT_FLUSH_SECONDS and once more when the process exits.
+
+Re-sends are caught twice. The cache check drops them at the door when the
+cache is shared between workers. The unique (submission_hash,
+submission_window) constraint catches whatever still reaches the flush,
+including a double-click that two workers with private caches both
+buffered. A re-send that straddles two windows is the only one kept.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+
+from leumas.forms import ContactForm
+from leumas.models import Contact, OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+DEDUP_KEY = 'leumas:contact:{}'
+
+_buffer = deque()
+_wakeup = threading.Event()
+_flush_lock = threading.Lock()
+_start_lock = threading.Lock()
+_flusher_pid = None
+
+
+def submission_hash(data):
+    """Fingerprint of a submission, used to drop double-clicked re-sends"""
+    parts = [str(data.get(field, '')).strip().lower() for field in ('name', 'email', 'inquiry', 'message')]
+    return hashlib.sha256('\x1f'.join(parts).encode()).hexdigest()
+
+
+def submit_contact(data):
+    """Buffer a validated submission; returns False for a recent duplicate"""
+    digest = submission_hash(data)
+    if not cache.add(DEDUP_KEY.format(digest), 1, settings.CONTACT_DEDUP_SECONDS):
+        return False
+    window = int(time.time() // settings.CONTACT_DEDUP_SECONDS)
+    _buffer.append((digest, window, dict(data)))
+    if settings.CONTACT_FLUSH_IN_BACKGROUND:
+        _ensure_flusher()
+    return True
+
+
+def _saved_submissions(items):
+    """(hash, window) pairs of `items` that are already saved"""
+    return set(Contact.objects.filter(
+        submission_hash__in={digest for digest, _, _ in items}
+    ).values_list('submission_hash', 'submission_window'))
+
+
+def _insert_new(contacts):
+    """Insert `contacts` and return the ones that were saved.
+
+    A concurrent flush in another worker may commit the same submission
+    after our check. Then the bulk insert hits the unique constraint, and
+    the rows are inserted one at a time so only the lost ones are skipped.
+    """
+    try:
+        with transaction.atomic():
+            Contact.objects.bulk_create(contacts)
+        return contacts
+    except IntegrityError:
+        pass
+    inserted = []
+    for contact in contacts:
+        contact.pk = None
+        try:
+            with transaction.atomic():
+                contact.save(force_insert=True)
+        except IntegrityError:
+            continue
+        inserted.append(contact)
+    return inserted
+
+
+def flush_contact_submissions():
+    """Save every buffered submission and queue its emails.
+
+    Returns the number saved; duplicates of rows already saved are dropped.
+    """
+    with _flush_lock:
+        items = []
+        while _buffer:
+            items.append(_buffer.popleft())
+        if not items:
+            return 0
+
+        try:
+            with transaction.atomic():
+                saved = _saved_submissions(items)
+                contacts, emails = [], []
+                for digest, window, data in items:
+                    if (digest, window) in saved:
+                        continue
+                    saved.add((digest, window))
+                    contact = Contact(
+                        name=data['name'].strip(),
+                        email=data['email'],
+                        inquiry=data['inquiry'],
+                        message=data['message'],
+                        submission_hash=digest,
+                        submission_window=window,
+                    )
+                    contacts.append(contact)
+                    form = ContactForm(data)
+                    emails.append(form.build_emails() if form.is_valid() else [])
+                inserted = {id(contact) for contact in _insert_new(contacts)}
+                # Only rows this flush inserted get their notifications
+                OutboxEmail.objects.bulk_create([
+                    email for contact, built in zip(contacts, emails)
+                    if id(contact) in inserted for email in built
+                ])
+        except Exception:
+            # Keep the submissions for the next attempt
+            _buffer.extendleft(reversed(items))
+            raise
+        return len(inserted)
+
+
+def _run_flusher():
+    while True:
+        _wakeup.wait(settings.CONTACT_FLUSH_SECONDS)
+        _wakeup.clear()
+        try:
+            flush_contact_submissions()
+        except Exception:
+            logger.exception('Could not save buffered contact submissions')
+        finally:
+            connection.close()
+
+
+def _ensure_flusher():
+    """Start this process's flusher thread (again after a fork)"""
+    global _flusher_pid
+    if _flusher_pid == os.getpid():
+        return
+    with _start_lock:
+        if _flusher_pid != os.getpid():
+            threading.Thread(target=_run_flusher, name='contact-flusher', daemon=True).start()
+            _flusher_pid = os.getpid()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        flush_contact_submissions()
+    except Exception:
+        logger.exception('Lost buffered contact submissions at shutdown')
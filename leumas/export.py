@@ -0,0 +1,179 @@
+"""Static export of the public pages.
+
+export_site() renders every public GET page to an output directory, next
+to copies of STATIC_ROOT and MEDIA_ROOT, so nginx or a CDN can serve the
+site without Python. Each page is rendered through its normal view.
+
+Exports are incremental. Every page has an inputs digest made of content
+hashes: its data (published blog rows, SERVICES, PORTFOLIO_PROJECTS), the
+templates and the static and image manifests. A page whose digest matches
+the previous export's is not rendered again. Pages that no longer exist,
+such as unpublished posts, are removed. The digests are kept in
+EXPORT_MANIFEST inside the output directory.
+
+URLs map to files as '/' -> index.html, '/about' -> about.html and
+'/blog/3/' -> blog/3/index.html; serve them with
+`try_files $uri $uri.html $uri/index.html`. The contact page, newsletter
+signup, CV download and API stay dynamic and must be proxied to Django.
+A static copy cannot issue a CSRF token, so the contact and newsletter
+forms are replaced with a link to the contact page Django serves.
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+from django.conf import settings
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from leumas.cache import site_digest
+from leumas.models import BlogPost
+from leumas.views.data import PORTFOLIO_PROJECTS, PORTFOLIO_PROJECTS_VERSION, SERVICES, SERVICES_VERSION
+
+EXPORT_MANIFEST = '.export-manifest.json'
+
+# Part of every page digest; bump it when render_page() changes its output
+# so the next export re-renders pages written by the old code
+EXPORT_FORMAT = 2
+
+# Pages are exported with the image formats this allows (see
+# leumas.images.negotiate_format). A static copy is served to every client
+# and responsive_image emits a single-format <img>, so the default names no
+# modern format and pages keep the JPEG/PNG variants every browser shows.
+DEFAULT_ACCEPT = 'text/html,application/xhtml+xml,*/*'
+
+FORM_RE = re.compile(rb'<form\b.*?</form>', re.DOTALL | re.IGNORECASE)
+
+
+def _digest(*parts):
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part if isinstance(part, bytes) else str(part).encode())
+        sha.update(b'\0')
+    return sha.hexdigest()
+
+
+def blog_digest():
+    """Content hash of everything the HTML pages show about blog posts"""
+    fields = [f.attname for f in BlogPost._meta.concrete_fields if f.attname != 'views_count']
+    rows = BlogPost.objects.filter(is_published=True).order_by('pk').values_list(*fields)
+    tags = BlogPost.tags.through.objects.order_by('pk').values_list('blogpost_id', 'tag__name')
+    return _digest(json.dumps([list(rows), list(tags)], default=str))
+
+
+def public_pages():
+    """(url, data digest) for every exported page"""
+    blog = blog_digest()
+    home = _digest(SERVICES_VERSION, PORTFOLIO_PROJECTS_VERSION, blog)
+    pages = [
+        (reverse('leumas:leumas-index'), home),
+        (reverse('leumas:leumas-about'), home),
+        (reverse('leumas:leumas-services'), SERVICES_VERSION),
+        (reverse('leumas:leumas-works'), PORTFOLIO_PROJECTS_VERSION),
+        (reverse('leumas:leumas-blog'), blog),
+        (reverse('leumas:leumas-blogs'), blog),
+    ]
+    pages += [(reverse('leumas:service-detail', args=[pk]), SERVICES_VERSION) for pk in SERVICES]
+    pages += [(reverse('leumas:portfolio-detail', args=[pk]), PORTFOLIO_PROJECTS_VERSION) for pk in PORTFOLIO_PROJECTS]
+    published = BlogPost.objects.filter(is_published=True).order_by('pk').values_list('pk', flat=True)
+    pages += [(reverse('leumas:blog-detail', args=[pk]), blog) for pk in published]
+    return pages
+
+
+def output_path(url):
+    """Relative file a URL is exported to"""
+    path = url.strip('/')
+    if not path:
+        return 'index.html'
+    return f'{path}/index.html' if url.endswith('/') else f'{path}.html'
+
+
+def strip_post_forms(content):
+    """Replace forms that need a CSRF token with a link to the contact page"""
+    link = f'<a class="base-btn1" href="{reverse("leumas:leumas-contact")}">Get in touch</a>'.encode()
+
+    def replace(match):
+        return link if b'csrfmiddlewaretoken' in match.group() else match.group()
+    return FORM_RE.sub(replace, content)
+
+
+def render_page(url, host, accept=DEFAULT_ACCEPT):
+    """Render `url` through its view and return the response body.
+
+    Forms that POST to Django are swapped for a link; see strip_post_forms().
+    """
+    request = RequestFactory().get(url, HTTP_HOST=host, HTTP_ACCEPT=accept)
+    match = resolve(url)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise ValueError(f'{url} returned {response.status_code}')
+    return strip_post_forms(response.content)
+
+
+def copy_tree(source, target):
+    """Copy files that are missing or differ in `target`; returns the count"""
+    copied = 0
+    source = Path(source)
+    if not source.is_dir():
+        return copied
+    for path in source.rglob('*'):
+        if not path.is_file():
+            continue
+        destination = Path(target) / path.relative_to(source)
+        if destination.exists() and filecmp.cmp(path, destination, shallow=False):
+            continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, destination)
+        copied += 1
+    return copied
+
+
+def export_site(output, host='localhost', force=False, accept=DEFAULT_ACCEPT):
+    """Export the public pages and assets to `output`.
+
+    Returns a dict with the number of pages rendered, unchanged and removed,
+    and the static and media files copied.
+    """
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    manifest_path = output / EXPORT_MANIFEST
+    try:
+        previous = json.loads(manifest_path.read_text())
+    except (FileNotFoundError, ValueError):
+        previous = {}
+
+    shared = _digest(EXPORT_FORMAT, site_digest(), accept)
+    manifest = {}
+    rendered = unchanged = 0
+    for url, data in public_pages():
+        inputs = _digest(shared, data)
+        target = output / output_path(url)
+        if not force and previous.get(url) == inputs and target.exists():
+            unchanged += 1
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp = target.with_name(target.name + '.tmp')
+            temp.write_bytes(render_page(url, host, accept))
+            os.replace(temp, target)
+            rendered += 1
+        manifest[url] = inputs
+
+    removed = 0
+    for url in set(previous) - set(manifest):
+        (output / output_path(url)).unlink(missing_ok=True)
+        removed += 1
+
+    static = copy_tree(settings.STATIC_ROOT, output / settings.STATIC_URL.strip('/'))
+    media = copy_tree(settings.MEDIA_ROOT, output / settings.MEDIA_URL.strip('/'))
+    manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    return {
+        'rendered': rendered, 'unchanged': unchanged, 'removed': removed,
+        'static': static, 'media': media,
+    }
@@ -0,0 +1,100 @@
+"""RSS and Atom feeds of the published blog posts.
+
+Both feeds take `?limit=N` (FEED_ITEMS by default, at most
+FEED_MAX_ITEMS) and `?content=1`, which adds each post's full content:
+<content:encoded> in RSS and <content> in Atom. The views in
+leumas.views.feeds cache them per blog content version.
+"""
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.syndication.views import Feed
+from django.urls import reverse_lazy
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+
+from leumas.models import BlogPost
+
+
+class ContentRssFeed(Rss201rev2Feed):
+    """RSS 2.0 with the content module for full post bodies"""
+
+    def rss_attributes(self):
+        attrs = super().rss_attributes()
+        attrs['xmlns:content'] = 'http://purl.org/rss/1.0/modules/content/'
+        return attrs
+
+    def add_item_elements(self, handler, item):
+        super().add_item_elements(handler, item)
+        if item.get('content') is not None:
+            handler.addQuickElement('content:encoded', item['content'])
+
+
+class ContentAtomFeed(Atom1Feed):
+
+    def add_item_elements(self, handler, item):
+        super().add_item_elements(handler, item)
+        if item.get('content') is not None:
+            handler.addQuickElement('content', item['content'], {'type': 'html'})
+
+
+@dataclass(frozen=True)
+class FeedOptions:
+    limit: int
+    content: bool
+
+
+class BlogPostsFeed(Feed):
+    feed_type = ContentRssFeed
+    title = 'leumas - Blog'
+    link = reverse_lazy('leumas:leumas-blogs')
+    description = 'Latest posts on DevOps, cloud infrastructure and automation'
+
+    def get_object(self, request, *args, **kwargs):
+        try:
+            limit = int(request.GET.get('limit', settings.FEED_ITEMS))
+        except ValueError:
+            limit = settings.FEED_ITEMS
+        return FeedOptions(
+            limit=min(max(limit, 1), settings.FEED_MAX_ITEMS),
+            content=request.GET.get('content') in ('1', 'true'),
+        )
+
+    def items(self, options):
+        queryset = (
+            BlogPost.objects.filter(is_published=True)
+            .order_by('-published_date', '-id')
+            .prefetch_related('tags')
+        )
+        if not options.content:
+            queryset = queryset.defer('content')
+        return queryset[:options.limit]
+
+    def item_title(self, post):
+        return post.title
+
+    def item_description(self, post):
+        return post.excerpt
+
+    def item_author_name(self, post):
+        return post.author
+
+    def item_pubdate(self, post):
+        return post.published_date
+
+    def item_updateddate(self, post):
+        return post.updated_date
+
+    def item_categories(self, post):
+        return [tag.name for tag in post.tags.all()]
+
+    def item_extra_kwargs(self, post):
+        # items() only loads content when ?content= asked for it
+        if 'content' in post.get_deferred_fields():
+            return {}
+        return {'content': post.content}
+
+
+class BlogPostsAtomFeed(BlogPostsFeed):
+    feed_type = ContentAtomFeed
+    subtitle = BlogPostsFeed.description
@@ -1,8 +1,7 @@
 from django import forms
 from django.conf import settings
-from django.core.mail import send_mail, EmailMultiAlternatives
-from django.template.loader import render_to_string
-from .models import Newsletter
+from .models import Newsletter, OutboxEmail
+from .outbox import build_email
 
 
 class ContactForm(forms.Form):
@@ -30,11 +29,9 @@ class ContactForm(forms.Form):
 
         return subject, msg
 
-    def send(self):
-
+    def build_emails(self):
+        """Return the unsaved owner notification and sender confirmation"""
         subject, msg = self.get_info()
-        # Owner notification (plain text)
-        owner_subject = f"Contact form: {subject}"
         context = {
             'name': self.cleaned_data.get('name').strip(),
             'email': self.cleaned_data.get('email'),
@@ -42,47 +39,38 @@ class ContactForm(forms.Form):
             'message': self.cleaned_data.get('message')
         }
 
-        text_body = render_to_string('leumas/emails/contact_received.txt', context)
-        html_body = render_to_string('leumas/emails/contact_received.html', context)
-
-        owner_email = EmailMultiAlternatives(
-            subject=owner_subject,
-            body=text_body,
+        # Owner notification
+        owner_email = build_email(
+            subject=f"Contact form: {subject}",
+            to=[settings.RECIPIENT_ADDRESS],
+            template='leumas/emails/contact_received',
+            context=context,
             from_email=settings.EMAIL_HOST_USER,
-            to=[settings.RECIPIENT_ADDRESS]
         )
-        owner_email.attach_alternative(html_body, "text/html")
-        owner_email.send(fail_silently=True)
 
         # Confirmation email to the sender
-        confirm_subject = "Thanks for contacting Samuel Adomeh"
-        confirm_text = render_to_string('leumas/emails/contact_confirm.txt', context)
-        confirm_html = render_to_string('leumas/emails/contact_confirm.html', context)
-
-        confirm_email = EmailMultiAlternatives(
-            subject=confirm_subject,
-            body=confirm_text,
+        confirm_email = build_email(
+            subject="Thanks for contacting Samuel Adomeh",
+            to=[self.cleaned_data.get('email')],
+            template='leumas/emails/contact_confirm',
+            context=context,
             from_email=settings.EMAIL_HOST_USER,
-            to=[self.cleaned_data.get('email')]
         )
-        confirm_email.attach_alternative(confirm_html, "text/html")
-        confirm_email.send(fail_silently=True)
+        return [owner_email, confirm_email]
 
-
-class NewsletterForm(forms.ModelForm):
-    class Meta:
-        model = Newsletter
-        fields = ['email']
-        widgets = {
-            'email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Enter your email...',
-                'required': True,
-            })
-        }
-
-    def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if Newsletter.objects.filter(email=email, is_active=True).exists():
-            raise forms.ValidationError('This email is already subscribed to our newsletter.')
-        return email
+    def send(self):
+        """Queue both emails in the outbox"""
+        OutboxEmail.objects.bulk_create(self.build_emails())
+
+
+class NewsletterForm(forms.Form):
+    # Not a ModelForm: subscribing is an upsert, so the uniqueness checks a
+    # ModelForm would query for are neither needed nor errors
+    email = forms.EmailField(
+        max_length=Newsletter._meta.get_field('email').max_length,
+        widget=forms.EmailInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Enter your email...',
+            'required': True,
+        })
+    )
@@ -0,0 +1,189 @@
+"""Responsive image variants.
+
+Each source image is resized to the IMAGE_VARIANT_WIDTHS narrower than itself,
+plus its own width. Every size is saved as WebP, as AVIF when Pillow has an
+AVIF encoder, and as JPEG (PNG for transparent images) as a fallback. A variant entry
+records the source's dimensions and, per format, a list of (width, path)
+pairs:
+
+    {"width": 1600, "height": 1067, "source": "...",
+     "formats": {"webp": [[320, "images/variants/about-320.webp"], ...], ...}}
+
+Static images are processed by `manage.py build_image_variants`. It writes
+the variants under IMAGE_VARIANTS_DIR, which is a STATICFILES_DIRS entry,
+and the entries to IMAGE_VARIANTS_MANIFEST. Uploaded BlogPost and
+Portfolio images are processed on save; their entry is stored on the row.
+The `responsive_image` template tag turns an entry into an <img srcset>.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pillow_avif  # noqa: F401 - registers the AVIF plugin
+except ImportError:
+    pass
+
+# format -> (Pillow format, extension, mime type, save options)
+FORMATS = {
+    'avif': ('AVIF', 'avif', 'image/avif', {'quality': 50}),
+    'webp': ('WEBP', 'webp', 'image/webp', {'quality': 80}),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+    'png': ('PNG', 'png', 'image/png', {'optimize': True}),
+}
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+
+def available_formats():
+    """Modern formats this Pillow build can encode, best first"""
+    Image.init()
+    return [name for name in ('avif', 'webp') if FORMATS[name][0] in Image.SAVE]
+
+
+def has_transparency(image):
+    """Whether any pixel is see-through, not just whether there's an alpha band"""
+    if image.mode not in ('RGBA', 'LA', 'PA') and 'transparency' not in image.info:
+        return False
+    return image.convert('RGBA').getchannel('A').getextrema()[0] < 255
+
+
+def render_variants(data, stem, save):
+    """Resize the image bytes `data` and pass each encoded variant to `save`.
+
+    `save(path, content)` stores one file and returns nothing; `stem` is the
+    path prefix the variants are named after. Returns the variant entry.
+    """
+    with Image.open(BytesIO(data)) as image:
+        fallback = 'png' if has_transparency(image) else 'jpeg'
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < width] + [width]
+        formats = {}
+        for name in available_formats() + [fallback]:
+            pillow_format, extension, _, options = FORMATS[name]
+            formats[name] = []
+            for target in widths:
+                resized = image if target == width else image.resize(
+                    (target, round(height * target / width)), Image.LANCZOS
+                )
+                if pillow_format == 'JPEG' and resized.mode != 'RGB':
+                    resized = resized.convert('RGB')
+                buffer = BytesIO()
+                resized.save(buffer, pillow_format, **options)
+                path = f'{stem}-{target}.{extension}'
+                save(path, buffer.getvalue())
+                formats[name].append([target, path])
+    return {'width': width, 'height': height, 'formats': formats}
+
+
+def build_static_variants(force=False, source_root=None):
+    """Process every image under `images/` in the app's static directory.
+
+    Sources whose content hash matches the manifest are skipped unless
+    `force` is set. Returns (processed, skipped).
+    """
+    source_root = source_root or settings.BASE_DIR / 'leumas' / 'static'
+    output_root = settings.IMAGE_VARIANTS_DIR
+    manifest = load_manifest_file()
+    processed = skipped = 0
+    for source in sorted((source_root / 'images').rglob('*')):
+        if source.suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        name = source.relative_to(source_root).as_posix()
+        data = source.read_bytes()
+        digest = hashlib.sha1(data).hexdigest()
+        if not force and is_current(manifest.get(name), digest, output_root):
+            skipped += 1
+            continue
+
+        def save(path, content):
+            target = output_root / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+
+        stem = (PurePosixPath('images/variants') / PurePosixPath(name).relative_to('images')).with_suffix('')
+        try:
+            manifest[name] = render_variants(data, stem.as_posix(), save)
+        except (UnidentifiedImageError, OSError) as exc:
+            logger.warning('Skipping image %s: %s', name, exc)
+            continue
+        manifest[name]['source'] = digest
+        processed += 1
+
+    manifest_path = settings.IMAGE_VARIANTS_MANIFEST
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp = manifest_path.with_suffix('.tmp')
+    temp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(temp, manifest_path)
+    get_manifest.cache_clear()
+    return processed, skipped
+
+
+def is_current(entry, digest, output_root):
+    """Whether `entry` was built from this content and all its files exist"""
+    if not entry or entry.get('source') != digest:
+        return False
+    if not set(available_formats()) <= set(entry['formats']):
+        return False
+    return all(
+        (output_root / path).exists()
+        for variants in entry['formats'].values() for _, path in variants
+    )
+
+
+def load_manifest_file():
+    try:
+        return json.loads(settings.IMAGE_VARIANTS_MANIFEST.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+@lru_cache(maxsize=None)
+def get_manifest():
+    """The static image manifest, read once per process"""
+    return load_manifest_file()
+
+
+def build_upload_variants(field_file, storage=None):
+    """Process an uploaded image; returns its entry, or None if unreadable"""
+    storage = storage or default_storage
+    name = field_file.name
+    if not name or not storage.exists(name):
+        return None
+    with storage.open(name, 'rb') as upload:
+        data = upload.read()
+
+    def save(path, content):
+        if storage.exists(path):
+            storage.delete(path)
+        storage.save(path, ContentFile(content))
+
+    stem = PurePosixPath('variants') / PurePosixPath(name).with_suffix('')
+    try:
+        entry = render_variants(data, stem.as_posix(), save)
+    except (UnidentifiedImageError, OSError) as exc:
+        logger.warning('Could not build variants for %s: %s', name, exc)
+        return None
+    entry['source'] = name
+    return entry
+
+
+def negotiate_format(request):
+    """The best modern format the client's Accept header allows, if any"""
+    accept = request.META.get('HTTP_ACCEPT', '') if request is not None else ''
+    for name in available_formats():
+        if FORMATS[name][2] in accept:
+            return name
+    return None
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from leumas.views.cv import build_cv
+
+
+class Command(BaseCommand):
+    help = 'Render the downloadable CV PDF ahead of time (run at deploy)'
+
+    def handle(self, *args, **options):
+        path = build_cv()
+        self.stdout.write(self.style.SUCCESS(f'CV ready at {path}'))
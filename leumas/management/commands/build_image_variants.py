@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from leumas.images import available_formats, build_static_variants
+
+
+class Command(BaseCommand):
+    help = 'Build resized WebP/AVIF variants of the static images and their manifest'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true',
+                            help='Rebuild images whose variants are already current')
+
+    def handle(self, *args, **options):
+        processed, skipped = build_static_variants(force=options['force'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Built variants for {processed} images ({skipped} unchanged); '
+            f"formats: {', '.join(available_formats())} with JPEG/PNG fallbacks"
+        ))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from leumas.models import Newsletter
+from leumas.newsletter import export_rows
+
+
+class Command(BaseCommand):
+    help = 'Export newsletter subscribers as CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Output file, or '-' for stdout")
+        parser.add_argument('--active-only', action='store_true')
+
+    def handle(self, *args, **options):
+        queryset = Newsletter.objects.all()
+        if options['active_only']:
+            queryset = queryset.filter(is_active=True)
+        if options['path'] == '-':
+            self.stdout.writelines(export_rows(queryset))
+        else:
+            with open(options['path'], 'w', newline='', encoding='utf-8') as output:
+                output.writelines(export_rows(queryset))
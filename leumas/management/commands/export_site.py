@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from leumas.export import DEFAULT_ACCEPT, export_site
+
+
+class Command(BaseCommand):
+    help = 'Render the public pages and copy the static files to a directory nginx or a CDN can serve'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Directory to export the site to')
+        parser.add_argument('--host', default=None,
+                            help='Host name to render the pages for (default: first ALLOWED_HOSTS entry)')
+        parser.add_argument('--accept', default=DEFAULT_ACCEPT,
+                            help='Accept header the pages are rendered with; decides the image formats. '
+                                 'Only name image/webp or image/avif if every visitor supports them')
+        parser.add_argument('--force', action='store_true',
+                            help='Re-render pages whose inputs have not changed')
+
+    def handle(self, *args, **options):
+        if not (Path(settings.STATIC_ROOT) / 'staticfiles.json').exists():
+            raise CommandError('No collected static files found; run collectstatic first')
+        host = options['host'] or next(
+            (host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost'
+        )
+        counts = export_site(options['output'], host=host, force=options['force'], accept=options['accept'])
+        self.stdout.write(self.style.SUCCESS(
+            'Exported to {output}: {rendered} pages rendered, {unchanged} unchanged, {removed} removed; '
+            '{static} static and {media} media files copied'.format(output=options['output'], **counts)
+        ))
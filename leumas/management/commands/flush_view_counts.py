@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from leumas.models import BlogPost
+from leumas.view_counts import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Write buffered blog view counts to the database. Schedule this when '
+        'the cache is shared between workers (e.g. Redis or Memcached).'
+    )
+
+    def handle(self, *args, **options):
+        post_ids = BlogPost.objects.values_list('id', flat=True)
+        written = flush_view_counts(list(post_ids))
+        self.stdout.write(self.style.SUCCESS(f'Flushed {written} buffered views'))
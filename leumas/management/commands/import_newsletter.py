@@ -0,0 +1,23 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from leumas.newsletter import import_subscribers, read_emails
+
+
+class Command(BaseCommand):
+    help = 'Import newsletter subscribers from a CSV file, skipping known addresses'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file with an email column, or '-' for stdin")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options['path'] == '-':
+            read, invalid, created = import_subscribers(read_emails(sys.stdin), options['batch_size'])
+        else:
+            with open(options['path'], newline='', encoding='utf-8') as lines:
+                read, invalid, created = import_subscribers(read_emails(lines), options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Read {read} rows: {created} subscribed, {read - invalid - created} already known, {invalid} invalid'
+        ))
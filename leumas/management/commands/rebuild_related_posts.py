@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from leumas.cache import bump_version
+from leumas.related import rebuild_related_posts
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the related-posts index for every blog post'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        count = rebuild_related_posts(batch_size=options['batch_size'])
+        bump_version('blog')
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt related-posts index with {count} rows'))
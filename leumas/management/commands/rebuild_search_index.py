@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from leumas.search import get_backend, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for blog posts and portfolio projects'
+
+    def handle(self, *args, **options):
+        if get_backend() is None:
+            self.stdout.write(self.style.WARNING('No full-text backend for this database; nothing to do'))
+            return
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} documents'))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from leumas.cache import bump_version
+from leumas.models import BlogPost, reading_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the stored word count and reading time of every blog post'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        batch = []
+        updated = 0
+        for post in BlogPost.objects.only('id', 'content').iterator(chunk_size=batch_size):
+            post.word_count, post.reading_time = reading_stats(post.content)
+            batch.append(post)
+            if len(batch) >= batch_size:
+                updated += BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time'])
+                batch = []
+        updated += BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time'])
+
+        # bulk_update() skips post_save, so invalidate cached pages here
+        bump_version('blog')
+        self.stdout.write(self.style.SUCCESS(f'Recomputed reading stats for {updated} posts'))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from leumas.broadcast import BroadcastInterrupted, send_broadcast
+from leumas.models import Broadcast
+
+
+class Command(BaseCommand):
+    help = 'Send queued newsletter broadcasts, resuming from the last checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('broadcast_ids', nargs='*', type=int,
+                            help='Broadcasts to send or resume; defaults to every queued one')
+        parser.add_argument('--batch-size', type=int)
+        parser.add_argument('--rate', type=float, help='Messages per second, 0 for no limit')
+        parser.add_argument('--connections', type=int, help='SMTP connections to send over')
+
+    def handle(self, *args, **options):
+        if options['broadcast_ids']:
+            broadcasts = Broadcast.objects.filter(pk__in=options['broadcast_ids'])
+            if broadcasts.filter(status=Broadcast.STATUS_SENT).exists():
+                raise CommandError('Broadcasts that were already sent cannot be sent again')
+        else:
+            broadcasts = Broadcast.objects.filter(status=Broadcast.STATUS_QUEUED)
+
+        for broadcast in broadcasts.order_by('pk'):
+            # Claim it so a second worker started at the same time skips it
+            if not options['broadcast_ids'] and not Broadcast.objects.filter(
+                pk=broadcast.pk, status=Broadcast.STATUS_QUEUED
+            ).update(status=Broadcast.STATUS_SENDING):
+                continue
+            try:
+                sent, failed, seconds = send_broadcast(
+                    broadcast, options['batch_size'], options['rate'], options['connections']
+                )
+            except BroadcastInterrupted as exc:
+                raise CommandError(
+                    f'"{broadcast.subject}" stopped after {broadcast.sent_count} messages: {exc}. '
+                    'It is queued and resumes on the next run.'
+                )
+            self.stdout.write(self.style.SUCCESS(
+                f'"{broadcast.subject}": sent {sent}, failed {failed} in {seconds:.1f}s '
+                f'({sent / seconds if seconds else 0:.1f} messages/s)'
+            ))
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from leumas.outbox import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = 'Send queued transactional email from the outbox, in batches over one SMTP connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--interval', type=float, default=5.0,
+                            help='Seconds to wait when the outbox is empty')
+        parser.add_argument('--once', action='store_true',
+                            help='Drain the due emails and exit instead of polling')
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_queued_emails(options['batch_size'])
+            if sent or failed:
+                self.stdout.write(f'Sent {sent}, failed {failed}')
+            elif options['once']:
+                return
+            else:
+                time.sleep(options['interval'])
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from leumas.storage import bytes_saved, compression_report
+
+
+class Command(BaseCommand):
+    help = 'Report the bytes saved by the gzip and Brotli copies collectstatic wrote'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=0,
+                            help='Only list the N assets with the largest savings')
+
+    def handle(self, *args, **options):
+        rows = compression_report()
+        if not rows:
+            raise CommandError('No static manifest found; run collectstatic first')
+
+        total = compressed = 0
+        listed = rows[:options['top']] if options['top'] else rows
+        self.stdout.write(f"{'asset':<60} {'size':>10} {'gzip':>10} {'brotli':>10} {'saved':>10}")
+        for name, size, encoded in listed:
+            self.stdout.write(
+                f"{name:<60} {size:>10} {encoded.get('gz', '-'):>10} "
+                f"{encoded.get('br', '-'):>10} {bytes_saved(size, encoded):>10}"
+            )
+        for name, size, encoded in rows:
+            total += size
+            compressed += size - bytes_saved(size, encoded)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(rows)} assets: {total} bytes, {compressed} bytes as served compressed '
+            f'({total - compressed} saved, {100 * (total - compressed) / total:.0f}%)'
+        ))
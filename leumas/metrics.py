@@ -0,0 +1,96 @@
+"""Prometheus metrics.
+
+MetricsMiddleware (leumas.middleware) records, per URL name, request
+latency, response status and size, and the number and total time of the
+database queries each request ran. leumas.cache reports hits and misses of
+the page, content and document caches through record_cache(). The
+/metrics view renders everything in the Prometheus text format.
+
+Under gunicorn every worker has its own memory. When PROMETHEUS_MULTIPROC_DIR
+is set in the environment, prometheus_client writes the values to
+memory-mapped files in that directory and /metrics sums them across
+workers; gunicorn.conf.py empties the directory at startup and cleans up
+after dead workers. Recording a value is a dict lookup and an mmap write,
+a few microseconds per request.
+
+prometheus_client is optional: without it nothing is recorded and
+/metrics returns 404.
+"""
+
+import os
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Histogram, multiprocess
+except ImportError:
+    prometheus_client = None
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = Histogram(
+        'leumas_http_request_duration_seconds', 'Time spent handling requests',
+        ['view', 'method'], buckets=LATENCY_BUCKETS,
+    )
+    RESPONSES = Counter(
+        'leumas_http_responses', 'Responses by status code', ['view', 'method', 'status'],
+    )
+    RESPONSE_SIZE = Histogram(
+        'leumas_http_response_size_bytes', 'Size of non-streaming response bodies',
+        ['view'], buckets=SIZE_BUCKETS,
+    )
+    DB_QUERIES = Histogram(
+        'leumas_db_queries_per_request', 'Database queries run by a request',
+        ['view'], buckets=QUERY_BUCKETS,
+    )
+    DB_DURATION = Histogram(
+        'leumas_db_query_duration_seconds', 'Total database time of a request',
+        ['view'], buckets=LATENCY_BUCKETS,
+    )
+    CACHE_REQUESTS = Counter(
+        'leumas_cache_requests', 'Lookups in the leumas caches', ['cache', 'result'],
+    )
+
+
+# Bound children per label set; labels() costs more than the observation
+_children = {}
+
+
+def observe_request(view, method, status, seconds, size, queries, query_seconds):
+    """Record one finished request; `size` is None for streaming responses"""
+    if prometheus_client is None:
+        return
+    children = _children.get((view, method))
+    if children is None:
+        children = _children[(view, method)] = (
+            REQUEST_LATENCY.labels(view, method), RESPONSE_SIZE.labels(view),
+            DB_QUERIES.labels(view), DB_DURATION.labels(view), {},
+        )
+    latency, response_size, db_queries, db_duration, responses = children
+    latency.observe(seconds)
+    counter = responses.get(status)
+    if counter is None:
+        counter = responses[status] = RESPONSES.labels(view, method, status)
+    counter.inc()
+    if size is not None:
+        response_size.observe(size)
+    db_queries.observe(queries)
+    db_duration.observe(query_seconds)
+
+
+def record_cache(cache, hit):
+    """Count a hit or miss of one of the caches in leumas.cache"""
+    if prometheus_client is not None:
+        CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def render_latest():
+    """(body, content type) of the current metrics, summed across workers"""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
@@ -0,0 +1,60 @@
+import time
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+from leumas import metrics
+
+
+class QueryTimer:
+    """connection.execute_wrapper that counts queries and sums their time"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """Record Prometheus metrics for every request (see leumas.metrics).
+
+    Requests are labelled with their URL name; requests that match no URL
+    share the 'unmatched' label so the label set stays bounded.
+    """
+
+    def __init__(self, get_response):
+        if metrics.prometheus_client is None:
+            raise MiddlewareNotUsed('prometheus_client is not installed')
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = QueryTimer()
+        # What connection.execute_wrapper() does, without the context
+        # manager overhead
+        wrappers = connection.execute_wrappers
+        wrappers.append(queries)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            wrappers.remove(queries)
+        seconds = time.perf_counter() - start
+
+        match = request.resolver_match
+        metrics.observe_request(
+            view=match.view_name if match else 'unmatched',
+            method=request.method,
+            status=response.status_code,
+            seconds=seconds,
+            size=None if response.streaming else len(response.content),
+            queries=queries.count,
+            query_seconds=queries.seconds,
+        )
+        return response
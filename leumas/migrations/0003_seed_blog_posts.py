@@ -0,0 +1,772 @@
+from datetime import timedelta
+
+from django.core.management.color import no_style
+from django.db import migrations
+from django.utils import timezone
+from django.utils.text import slugify
+
+# The posts that used to be hard-coded in blog_helpers, keyed by the id in
+# their /blog/<id>/ URL. Frozen here so the migration never imports app code.
+POSTS = {
+    1: {
+        'title': 'Setting Up Kubernetes High Availability Clusters',
+        'category': 'Kubernetes',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'A comprehensive guide to setting up and maintaining highly available Kubernetes clusters across multiple availability zones.',
+        'content': '''
+            <h3>Understanding High Availability</h3>
+            <p>High availability (HA) is a critical requirement for production Kubernetes clusters. In this comprehensive guide, we explore the key components and best practices for building resilient Kubernetes infrastructure that can withstand node failures, network partitions, and other infrastructure challenges.</p>
+            
+            <h3>Key Components of HA Kubernetes</h3>
+            <ul>
+                <li><strong>Multiple Control Plane Nodes:</strong> Deploy at least 3 control plane nodes for etcd quorum consensus. This ensures that the cluster can tolerate the failure of one node.</li>
+                <li><strong>etcd Clustering:</strong> Configure etcd with proper clustering to maintain data consistency across control planes. Use odd numbers of nodes (3, 5, 7) for quorum.</li>
+                <li><strong>Load Balancing:</strong> Implement a load balancer in front of your API servers to distribute traffic across multiple control plane instances.</li>
+                <li><strong>Persistent Volume Management:</strong> Use properly configured storage backends for persistent volumes with replication and backup strategies.</li>
+                <li><strong>Network Policies:</strong> Implement network segmentation for security and performance optimization.</li>
+            </ul>
+            
+            <h3>Implementation Best Practices</h3>
+            <p>When setting up HA Kubernetes clusters, follow these guidelines:</p>
+            <ul>
+                <li><strong>Geographic Distribution:</strong> Spread nodes across multiple availability zones to protect against zone failures.</li>
+                <li><strong>Resource Allocation:</strong> Ensure control plane nodes have sufficient CPU and memory for peak loads.</li>
+                <li><strong>Backup Strategy:</strong> Implement automated etcd backups with regular restore testing.</li>
+                <li><strong>Monitoring and Alerting:</strong> Set up comprehensive monitoring for all control plane components.</li>
+                <li><strong>Upgrade Strategy:</strong> Plan rolling updates to maintain availability during cluster upgrades.</li>
+            </ul>
+            
+            <h3>Monitoring and Observability</h3>
+            <p>Proper monitoring is essential for maintaining cluster health. Implement comprehensive monitoring with Prometheus to track metrics like:</p>
+            <ul>
+                <li>API server latency and request rates</li>
+                <li>etcd commit duration and disk fsync latency</li>
+                <li>Node readiness and resource utilization</li>
+                <li>Pod scheduling failures and restart counts</li>
+                <li>Network connectivity between nodes</li>
+            </ul>
+            
+            <h3>Disaster Recovery Planning</h3>
+            <p>Develop and test comprehensive disaster recovery procedures including etcd backup and recovery, control plane node replacement, and complete cluster restoration from backups. Ensure you can recover from data corruption, node failures, and other critical incidents.</p>
+            
+            <h3>Conclusion</h3>
+            <p>Building truly resilient Kubernetes infrastructure requires careful planning, proper tooling, and continuous monitoring. By implementing the practices outlined in this guide, you can achieve the 99.9% uptime SLA that production systems demand.</p>
+        '''
+    },
+    2: {
+        'title': 'GitLab CI/CD Pipelines: From Zero to Hero',
+        'category': 'CI/CD',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Master GitLab CI/CD pipelines: creating efficient, scalable automation that enables rapid, reliable deployments.',
+        'content': '''
+            <h3>GitLab CI/CD Overview</h3>
+            <p>GitLab provides powerful built-in CI/CD capabilities that integrate seamlessly with your repository. Unlike external tools, GitLab CI/CD is version-controlled alongside your code, making it easy to track pipeline evolution and collaborate on automation improvements.</p>
+            
+            <h3>Pipeline Architecture</h3>
+            <p>A GitLab CI/CD pipeline consists of several key components:</p>
+            <ul>
+                <li><strong>Stages:</strong> Sequential groups of jobs that run one after another. Common stages include build, test, deploy-staging, and deploy-production.</li>
+                <li><strong>Jobs:</strong> Individual scripts or commands that execute within a stage. Jobs can run in parallel within the same stage.</li>
+                <li><strong>Runners:</strong> Agents that execute the jobs. They can be on-premises or cloud-based.</li>
+                <li><strong>Artifacts:</strong> Files produced by one job that can be used by subsequent jobs.</li>
+            </ul>
+            
+            <h3>Advanced Techniques</h3>
+            <p>Optimize your pipelines with these advanced patterns:</p>
+            <ul>
+                <li><strong>Parallel Execution:</strong> Run multiple jobs simultaneously within a stage to reduce total pipeline time.</li>
+                <li><strong>Conditional Pipelines:</strong> Use rules and variables to trigger pipelines only when necessary (e.g., only on specific branches or tags).</li>
+                <li><strong>Caching Strategies:</strong> Cache dependencies to accelerate builds. Use cache keys to manage different dependency versions.</li>
+                <li><strong>Artifacts Storage:</strong> Optimize artifact storage by retaining only necessary artifacts and using expiration policies.</li>
+                <li><strong>Docker-in-Docker:</strong> Build container images within CI/CD jobs for consistent image creation.</li>
+            </ul>
+            
+            <h3>Security in CI/CD</h3>
+            <p>Implement security best practices in your pipeline:</p>
+            <ul>
+                <li><strong>Secret Management:</strong> Use GitLab CI/CD variables for sensitive data, never hardcode secrets in .gitlab-ci.yml</li>
+                <li><strong>Security Scanning:</strong> Integrate SAST (Static Application Security Testing) to detect vulnerabilities in code.</li>
+                <li><strong>Container Scanning:</strong> Use vulnerability scanning to identify issues in container images before deployment.</li>
+                <li><strong>Dependency Scanning:</strong> Automatically detect vulnerable dependencies in your projects.</li>
+                <li><strong>Authorization Checks:</strong> Implement approval gates for production deployments.</li>
+            </ul>
+            
+            <h3>Kubernetes Integration</h3>
+            <p>Deploy directly to Kubernetes clusters from your pipeline using GitLab CI/CD with Helm charts or Kustomize. Configure proper RBAC and use service accounts with minimal permissions.</p>
+            
+            <h3>Example Pipeline</h3>
+            <p>A typical production-ready pipeline includes stages for linting, building, testing, security scanning, and deployment. Each stage validates the application before moving to the next, ensuring only quality code reaches production.</p>
+            
+            <h3>Conclusion</h3>
+            <p>GitLab CI/CD enables teams to automate their entire software delivery process, reducing manual errors and accelerating time-to-market. Invest in well-structured pipelines and you'll see immediate improvements in deployment frequency and quality.</p>
+        '''
+    },
+    3: {
+        'title': 'Terraform: Infrastructure as Code Best Practices',
+        'category': 'Infrastructure',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Learn Terraform best practices for managing cloud infrastructure as code with version control and team collaboration.',
+        'content': '''
+            <h3>Why Infrastructure as Code?</h3>
+            <p>Infrastructure as Code (IaC) represents a paradigm shift in how we manage cloud resources. Instead of manually clicking through cloud provider dashboards, we define infrastructure in declarative configuration files that can be version-controlled, code-reviewed, and tested just like application code.</p>
+            
+            <h3>Terraform Fundamentals</h3>
+            <p>Terraform uses a simple yet powerful language with these core concepts:</p>
+            <ul>
+                <li><strong>Providers:</strong> Plugins that enable interaction with cloud platforms (AWS, Azure, GCP, etc.).</li>
+                <li><strong>Resources:</strong> Infrastructure components you want to create (EC2 instances, RDS databases, VPCs, etc.).</li>
+                <li><strong>Variables:</strong> Input values that make configurations flexible and reusable.</li>
+                <li><strong>Outputs:</strong> Values exported from your configuration for use in other modules or external systems.</li>
+                <li><strong>Data Sources:</strong> References to existing infrastructure managed outside Terraform.</li>
+            </ul>
+            
+            <h3>Module Management</h3>
+            <p>Modules are the key to writing DRY Terraform code:</p>
+            <ul>
+                <li><strong>Creating Reusable Modules:</strong> Encapsulate related resources into modules for reuse across projects.</li>
+                <li><strong>Module Composition:</strong> Build complex infrastructure by composing multiple smaller modules.</li>
+                <li><strong>Remote Module Registries:</strong> Use the Terraform Registry to share and consume modules across your organization.</li>
+                <li><strong>Dependency Management:</strong> Terraform automatically handles dependencies between resources and modules.</li>
+                <li><strong>Version Constraints:</strong> Pin module versions to ensure consistent infrastructure deployments.</li>
+            </ul>
+            
+            <h3>State Management</h3>
+            <p>The Terraform state file is critical for tracking your infrastructure:</p>
+            <ul>
+                <li><strong>Local State:</strong> Suitable for small projects or development environments.</li>
+                <li><strong>Remote Backends:</strong> Use S3, Azure Blob Storage, or Terraform Cloud for team collaboration.</li>
+                <li><strong>State Locking:</strong> Prevent concurrent modifications with state locking mechanisms.</li>
+                <li><strong>Backup Strategy:</strong> Maintain backups of your state file as a disaster recovery measure.</li>
+                <li><strong>State Isolation:</strong> Separate state for different environments (dev, staging, production).</li>
+            </ul>
+            
+            <h3>Advanced Topics</h3>
+            <p>Master these techniques for production-grade infrastructure:</p>
+            <ul>
+                <li><strong>Workspaces:</strong> Manage multiple environments within a single configuration using workspaces.</li>
+                <li><strong>Dynamic Blocks:</strong> Generate multiple resource configurations from lists or maps for complex infrastructure.</li>
+                <li><strong>Conditionals:</strong> Use count and for_each to create resources conditionally based on variables.</li>
+                <li><strong>Import:</strong> Import existing infrastructure into Terraform state for management under code.</li>
+                <li><strong>Testing:</strong> Use tools like Terratest to write and run tests for your infrastructure code.</li>
+            </ul>
+            
+            <h3>Best Practices</h3>
+            <ul>
+                <li>Keep Terraform code in version control with clear commit messages</li>
+                <li>Use consistent naming conventions across your infrastructure</li>
+                <li>Implement code reviews for all infrastructure changes</li>
+                <li>Maintain separate state files for different environments</li>
+                <li>Document your modules with clear variable and output descriptions</li>
+                <li>Use policy as code tools like Sentinel or OPA to enforce standards</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Terraform enables you to treat infrastructure like application code. By following these best practices, you'll build scalable, reviewable, and maintainable cloud infrastructure.</p>
+        '''
+    },
+    4: {
+        'title': 'Docker Container Optimization and Security',
+        'category': 'Containers',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Optimize Docker containers for performance, size reduction, and security hardening in production environments.',
+        'content': '''
+            <h3>Container Security Fundamentals</h3>
+            <p>Security is paramount in containerized environments. Containers introduce new attack surfaces at the image level, runtime level, and orchestration level. A comprehensive security strategy addresses all these layers.</p>
+            
+            <h3>Image Optimization</h3>
+            <p>Reduce container image size and improve build performance:</p>
+            <ul>
+                <li><strong>Multi-stage Builds:</strong> Use Docker's multi-stage build feature to separate build-time dependencies from runtime requirements. This dramatically reduces final image size.</li>
+                <li><strong>Layer Caching Optimization:</strong> Order Dockerfile instructions strategically, placing stable commands earlier and frequently-changing commands later to maximize layer cache hits.</li>
+                <li><strong>Base Image Selection:</strong> Choose minimal base images like alpine or distroless images instead of full OS images.</li>
+                <li><strong>Minimal Image Strategy:</strong> Remove unnecessary files, documentation, and package manager caches to reduce attack surface.</li>
+                <li><strong>Image Scanning:</strong> Use vulnerability scanners like Trivy or Grype to identify security issues before deployment.</li>
+            </ul>
+            
+            <h3>Runtime Security</h3>
+            <p>Implement security controls at container runtime:</p>
+            <ul>
+                <li><strong>Resource Limits:</strong> Set memory and CPU limits to prevent resource exhaustion attacks and ensure fair resource allocation.</li>
+                <li><strong>Network Policies:</strong> Implement Kubernetes NetworkPolicies to control traffic between containers.</li>
+                <li><strong>Security Contexts:</strong> Use securityContext to drop unnecessary capabilities, run as non-root user, and make filesystems read-only.</li>
+                <li><strong>Pod Security Policies:</strong> Enforce security standards cluster-wide with Pod Security Policies or Pod Security Standards.</li>
+                <li><strong>Secrets Management:</strong> Never embed secrets in images; use external secret management systems.</li>
+            </ul>
+            
+            <h3>Vulnerability Scanning</h3>
+            <p>Integrate vulnerability scanning into your CI/CD pipeline:</p>
+            <ul>
+                <li><strong>Image Scanning:</strong> Use Trivy for quick, accurate vulnerability scanning of container images.</li>
+                <li><strong>Dependency Scanning:</strong> Analyze application dependencies for known vulnerabilities.</li>
+                <li><strong>Registry Scanning:</strong> Continuously scan images in your container registry to detect new vulnerabilities.</li>
+                <li><strong>Policy Enforcement:</strong> Prevent deployment of images with critical vulnerabilities.</li>
+            </ul>
+            
+            <h3>Performance Optimization</h3>
+            <ul>
+                <li><strong>Efficient Layering:</strong> Minimize the number of layers in your Dockerfile for faster pulls and smaller image size.</li>
+                <li><strong>Resource Management:</strong> Monitor and optimize container resource usage.</li>
+                <li><strong>Health Checks:</strong> Implement proper health checks for container orchestration systems.</li>
+                <li><strong>Caching Strategy:</strong> Leverage layer caching to speed up builds.</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Optimized and secure containers are critical for reliable containerized applications. Implement these practices to build secure, efficient container images suitable for production environments.</p>
+        '''
+    },
+    5: {
+        'title': 'Observability: Monitoring, Logging, and Tracing',
+        'category': 'Observability',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Implement comprehensive observability with Prometheus, ELK Stack, and distributed tracing for production systems.',
+        'content': '''
+            <h3>The Three Pillars of Observability</h3>
+            <p>Modern observability rests on three fundamental pillars: metrics, logs, and traces. Together, they provide comprehensive insight into application behavior and system health, enabling rapid issue detection and resolution.</p>
+            
+            <h3>Metrics with Prometheus</h3>
+            <p>Metrics represent quantitative measurements of your system:</p>
+            <ul>
+                <li><strong>Setting up Prometheus:</strong> Deploy Prometheus to scrape metrics from your applications and infrastructure. Configure scrape intervals and retention policies based on your needs.</li>
+                <li><strong>Custom Metrics:</strong> Instrument your applications to expose custom metrics via Prometheus client libraries.</li>
+                <li><strong>Alerting Rules:</strong> Define alert rules to automatically notify you of anomalies and critical conditions.</li>
+                <li><strong>Long-term Storage:</strong> Use storage backends like M3 or Thanos for long-term metric retention and high availability.</li>
+                <li><strong>Grafana Visualization:</strong> Create comprehensive dashboards to visualize metrics and track system health over time.</li>
+            </ul>
+            
+            <h3>Centralized Logging with ELK Stack</h3>
+            <p>Logs provide detailed information about application and system events:</p>
+            <ul>
+                <li><strong>Elasticsearch:</strong> Stores and indexes logs for powerful full-text search capabilities.</li>
+                <li><strong>Logstash:</strong> Processes and transforms logs before sending them to Elasticsearch.</li>
+                <li><strong>Kibana:</strong> Provides visualization and exploration of log data with powerful filtering and analysis capabilities.</li>
+                <li><strong>Log Aggregation:</strong> Collect logs from all services in a centralized location for easier troubleshooting.</li>
+                <li><strong>Log Retention:</strong> Implement appropriate retention policies balancing complexity and compliance requirements.</li>
+            </ul>
+            
+            <h3>Distributed Tracing</h3>
+            <p>Traces show request flows across distributed systems:</p>
+            <ul>
+                <li><strong>Jaeger Implementation:</strong> Deploy Jaeger for distributed tracing to understand request paths through microservices.</li>
+                <li><strong>Span Instrumentation:</strong> Add tracing instrumentation to your applications using OpenTelemetry libraries.</li>
+                <li><strong>Service Dependencies:</strong> Visualize service dependencies and identify performance bottlenecks.</li>
+                <li><strong>Error Tracking:</strong> Quickly identify which services in the request chain are causing failures.</li>
+                <li><strong>Performance Analysis:</strong> Analyze end-to-end latency to optimize critical paths.</li>
+            </ul>
+            
+            <h3>Correlation IDs</h3>
+            <p>Implement correlation IDs to track requests across services. This enables you to correlate logs, metrics, and traces for the same request, dramatically improving troubleshooting efficiency.</p>
+            
+            <h3>Best Practices</h3>
+            <ul>
+                <li>Monitor the right metrics for your business and technical requirements</li>
+                <li>Parse logs in a structured format (JSON) for easier analysis</li>
+                <li>Set appropriate alert thresholds to avoid alert fatigue</li>
+                <li>Correlate metrics, logs, and traces for better insights</li>
+                <li>Document dashboards and runbooks for your team</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Comprehensive observability enables rapid issue detection and resolution. Implement metrics, logs, and traces to gain complete visibility into your systems.</p>
+        '''
+    },
+    6: {
+        'title': 'AWS Networking: VPC, Subnets, and Security Groups',
+        'category': 'Cloud',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Deep dive into AWS networking fundamentals: VPCs, subnets, routing, and security group configurations.',
+        'content': '''
+            <h3>VPC Architecture</h3>
+            <p>A Virtual Private Cloud (VPC) is your isolated network environment in AWS. Design a robust VPC architecture that supports high availability, security, and scalability.</p>
+            <ul>
+                <li><strong>VPC Planning:</strong> Start with proper CIDR block planning. Choose space large enough for growth but not wasteful.</li>
+                <li><strong>Multiple Availability Zones:</strong> Distribute resources across multiple AZs for high availability.</li>
+                <li><strong>Security Layers:</strong> Implement defense in depth with security groups, network ACLs, and routing policies.</li>
+                <li><strong>NAT Gateway:</strong> Use NAT gateways for private instances to access external resources.</li>
+            </ul>
+            
+            <h3>Subnet Planning</h3>
+            <p>Subnets divide your VPC into segments for organization and security:</p>
+            <ul>
+                <li><strong>Public Subnets:</strong> Host resources accessible from the internet with proper security controls.</li>
+                <li><strong>Private Subnets:</strong> Host application and database servers not directly exposed to the internet.</li>
+                <li><strong>Multi-AZ Strategy:</strong> Create subnets in multiple AZs for redundancy.</li>
+                <li><strong>IP Addressing:</strong> Plan IP addressing carefully to support your workload requirements.</li>
+                <li><strong>Network ACLs:</strong> Implement stateless firewalls at the subnet level for additional security.</li>
+            </ul>
+            
+            <h3>Connectivity Options</h3>
+            <p>Connect your VPC to your on-premises infrastructure or other VPCs:</p>
+            <ul>
+                <li><strong>NAT Gateways:</strong> Enable private instances to initiate outbound connections.</li>
+                <li><strong>Internet Gateway:</strong> Provide internet access for public instances.</li>
+                <li><strong>VPN Connections:</strong> Establish encrypted connections to on-premises networks.</li>
+                <li><strong>VPC Peering:</strong> Connect multiple VPCs for resource sharing.</li>
+                <li><strong>Transit Gateway:</strong> Simplify network architecture with hub-and-spoke connectivity.</li>
+                <li><strong>AWS Direct Connect:</strong> Establish dedicated network connections for consistent performance.</li>
+            </ul>
+            
+            <h3>Security Best Practices</h3>
+            <ul>
+                <li><strong>Defense in Depth:</strong> Use multiple layers of security controls at different levels.</li>
+                <li><strong>Least Privilege:</strong> Grant only minimum necessary permissions in security groups and NACLs.</li>
+                <li><strong>Logging and Monitoring:</strong> Enable VPC Flow Logs to monitor network traffic and detect anomalies.</li>
+                <li><strong>Organization:</strong> Use tags and naming conventions for easier management.</li>
+                <li><strong>Regular Audits:</strong> Review security configurations regularly and adjust for new threats.</li>
+            </ul>
+            
+            <h3>Route Tables and Routing</h3>
+            <p>Route tables control traffic between subnets and to external networks. Configure them carefully to ensure traffic follows the intended path while maintaining security.</p>
+            
+            <h3>Conclusion</h3>
+            <p>Proper AWS networking is the foundation for secure, scalable, and performant cloud infrastructure. Invest in understanding VPCs, subnets, and security concepts to build robust cloud architectures.</p>
+        '''
+    },
+    7: {
+        'title': 'DevOps: Culture, Tools, and Practices',
+        'category': 'DevOps',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Explore DevOps culture, methodologies, and tools for building high-performing technology teams.',
+        'content': '''
+            <h3>DevOps Mindset</h3>
+            <p>DevOps is fundamentally a cultural movement that breaks down silos between development and operations teams. It\'s about collaboration, shared responsibility, and continuous improvement. At its core, DevOps seeks to reduce the time between writing code and deploying it to production while maintaining quality and stability.</p>
+            
+            <h3>Core DevOps Practices</h3>
+            <p>Successful DevOps organizations implement these fundamental practices:</p>
+            <ul>
+                <li><strong>Infrastructure as Code:</strong> Manage infrastructure using version-controlled configuration files, enabling repeatability and reducing manual errors.</li>
+                <li><strong>Continuous Integration:</strong> Enable developers to merge code changes frequently, with automated builds and tests catching issues early.</li>
+                <li><strong>Continuous Deployment:</strong> Automate the entire software delivery pipeline from code commit to production deployment.</li>
+                <li><strong>Automated Testing:</strong> Implement comprehensive automated testing at unit, integration, and system levels to ensure quality.</li>
+                <li><strong>Monitoring and Alerting:</strong> Instrument applications and infrastructure to detect and respond to issues in real-time.</li>
+                <li><strong>Incident Response:</strong> Develop and practice rapid response procedures to minimize downtime and user impact.</li>
+            </ul>
+            
+            <h3>Team Structure</h3>
+            <p>Organize teams for DevOps success:</p>
+            <ul>
+                <li><strong>Cross-functional Teams:</strong> Combine developers, operations engineers, and QA professionals into unified teams with shared goals.</li>
+                <li><strong>Shared Ownership:</strong> Developers take ownership of production systems; operations team contributes to development practices.</li>
+                <li><strong>Communication:</strong> Establish clear communication channels and regular synchronization between team members.</li>
+                <li><strong>Decision Making:</strong> Enable teams to make decisions autonomously within appropriate guardrails.</li>
+                <li><strong>Learning Culture:</strong> Foster continuous learning through knowledge sharing, experimentation, and blameless post-mortems.</li>
+            </ul>
+            
+            <h3>Essential Tools</h3>
+            <p>DevOps teams leverage a wide range of tools:</p>
+            <ul>
+                <li><strong>Version Control:</strong> Git for managing code and configuration changes.</li>
+                <li><strong>CI/CD:</strong> Jenkins, GitLab CI/CD, or GitHub Actions for automation.</li>
+                <li><strong>Infrastructure as Code:</strong> Terraform, CloudFormation, or Ansible for infrastructure management.</li>
+                <li><strong>Containerization:</strong> Docker and Kubernetes for consistent, scalable deployments.</li>
+                <li><strong>Monitoring:</strong> Prometheus, Grafana, and ELK Stack for observability.</li>
+                <li><strong>Collaboration:</strong> Slack, Jira, and wiki systems for team communication.</li>
+            </ul>
+            
+            <h3>Metrics and Measurement</h3>
+            <p>Track these key metrics to measure DevOps effectiveness:</p>
+            <ul>
+                <li><strong>Deployment Frequency:</strong> How often you deploy to production (target: multiple times per day).</li>
+                <li><strong>Lead Time:</strong> Time from code commit to production deployment (target: hours to minutes).</li>
+                <li><strong>Mean Time to Recovery (MTTR):</strong> Time to restore service after failure (target: minutes).</li>
+                <li><strong>Change Failure Rate:</strong> Percentage of deployments causing incidents (target: less than 15%).</li>
+                <li><strong>System Uptime:</strong> Availability of your services (target: 99.9% or higher).</li>
+            </ul>
+            
+            <h3>Continuous Improvement</h3>
+            <p>DevOps is an ongoing journey of improvement. Regularly assess your practices, identify bottlenecks, and incrementally improve your processes and tooling. Foster a culture of experimentation where teams can safely try new approaches.</p>
+            
+            <h3>Conclusion</h3>
+            <p>DevOps is not just about tools and automation. It\'s about creating a culture where development and operations teams work together to deliver high-quality software rapidly and reliably. Start with the fundamentals, measure your progress, and continuously improve your practices.</p>
+        '''
+    },
+    8: {
+        'title': 'Microservices Architecture: Design Patterns and Pitfalls',
+        'category': 'Architecture',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Master microservices architecture patterns, common pitfalls, and best practices for building scalable distributed systems.',
+        'content': '''
+            <h3>Understanding Microservices</h3>
+            <p>Microservices architecture decomposes an application into small, loosely coupled, independently deployable services. Each service runs in its own process and communicates with others via well-defined APIs. This approach enables faster development, easier scaling, and better fault isolation compared to monolithic architectures.</p>
+            
+            <h3>Key Design Patterns</h3>
+            <ul>
+                <li><strong>API Gateway Pattern:</strong> Single entry point for all client requests, handling routing, authentication, and rate limiting.</li>
+                <li><strong>Service Discovery:</strong> Dynamic registration of services allowing clients to discover service locations automatically.</li>
+                <li><strong>Circuit Breaker:</strong> Prevent cascading failures by detecting failures and stopping requests to failing services.</li>
+                <li><strong>Event-Driven Architecture:</strong> Services communicate asynchronously through events for loose coupling.</li>
+                <li><strong>CQRS Pattern:</strong> Separate read and write operations for improved performance and scalability.</li>
+                <li><strong>Saga Pattern:</strong> Manage distributed transactions across multiple services reliably.</li>
+            </ul>
+            
+            <h3>Common Pitfalls</h3>
+            <p>Avoid these common mistakes when implementing microservices:</p>
+            <ul>
+                <li><strong>Too Fine-Grained Services:</strong> Services so small they require constant communication. Find the right granularity.</li>
+                <li><strong>Ignoring Network Latency:</strong> Don\'t forget inter-service calls have inherent latency and failure modes.</li>
+                <li><strong>Shared Databases:</strong> Never share databases between services; use service-specific data stores.</li>
+                <li><strong>Inadequate Monitoring:</strong> Distributed systems need comprehensive observability to debug issues.</li>
+                <li><strong>Version Management:</strong> Plan for backward compatibility when evolving service contracts.</li>
+                <li><strong>Testing Complexity:</strong> Integration and contract testing become critical in distributed systems.</li>
+            </ul>
+            
+            <h3>Organizational Alignment</h3>
+            <p>Conway\'s Law states that system architectures mirror the communication structures of the organizations that create them. Design your teams and organizational structure to align with your microservices architecture for maximum effectiveness.</p>
+            
+            <h3>Conclusion</h3>
+            <p>Microservices offer tremendous benefits but require careful design and operational discipline. Understand the patterns, avoid common pitfalls, and build observability in from the start.</p>
+        '''
+    },
+    9: {
+        'title': 'Database Replication and High Availability Strategies',
+        'category': 'Database',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Design resilient database architectures with replication, failover, and disaster recovery strategies.',
+        'content': '''
+            <h3>Importance of Database Resilience</h3>
+            <p>Databases are critical to application functionality, and downtime directly impacts users. Implementing proper replication and failover mechanisms ensures data availability and consistency even during failures.</p>
+            
+            <h3>Replication Strategies</h3>
+            <ul>
+                <li><strong>Master-Slave Replication:</strong> Single master accepts writes; slaves replicate changes asynchronously. Simple but poses consistency challenges.</li>
+                <li><strong>Master-Master Replication:</strong> Multiple masters accept writes with conflict resolution. More complex but increases availability.</li>
+                <li><strong>Cascading Replication:</strong> Slave becomes source for other slaves, reducing load on master.</li>
+                <li><strong>Synchronous Replication:</strong> Changes written to multiple nodes before acknowledging. Trades latency for consistency.</li>
+                <li><strong>Asynchronous Replication:</strong> Changes acknowledged immediately, replicated later. Better performance but slight inconsistency window.</li>
+            </ul>
+            
+            <h3>Failover Mechanisms</h3>
+            <p>Implement automatic failover to minimize downtime:</p>
+            <ul>
+                <li><strong>Health Monitoring:</strong> Continuously monitor master health and detect failures quickly.</li>
+                <li><strong>Automatic Promotion:</strong> Automatically promote a healthy slave to master when master fails.</li>
+                <li><strong>Connection Failover:</strong> Applications must support multiple database endpoints and failover automatically.</li>
+                <li><strong>Quorum-Based Decisions:</strong> Use consensus to decide which node becomes primary.</li>
+                <li><strong>Split Brain Prevention:</strong> Prevent two nodes claiming mastership during network partitions.</li>
+            </ul>
+            
+            <h3>Backup Strategy</h3>
+            <ul>
+                <li><strong>Point-in-Time Recovery:</strong> Maintain full backups plus transaction logs for recovery to specific moments.</li>
+                <li><strong>Backup Frequency:</strong> Balance backup frequency with storage costs and recovery time objectives.</li>
+                <li><strong>Backup Verification:</strong> Regularly test backup restoration to ensure backups are usable.</li>
+                <li><strong>Off-Site Backup Storage:</strong> Store backups in different geographic locations for disaster recovery.</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Database high availability requires layered strategies: replication for data distribution, failover for quick recovery, and backups for disaster scenarios. Implement all three for true resilience.</p>
+        '''
+    },
+    10: {
+        'title': 'Cloud Application Security: From Code to Runtime',
+        'category': 'Security',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Implement comprehensive security strategies across application code, infrastructure, and runtime environments.',
+        'content': '''
+            <h3>Security as a Holistic Concern</h3>
+            <p>Cloud security isn\'t just about firewalls and access controls. It requires a comprehensive approach spanning code quality, infrastructure design, runtime monitoring, and incident response.</p>
+            
+            <h3>Code Security</h3>
+            <ul>
+                <li><strong>Static Code Analysis:</strong> Use SAST tools to identify vulnerabilities in source code before deployment.</li>
+                <li><strong>Dependency Scanning:</strong> Continuously scan dependencies for known vulnerabilities and outdated packages.</li>
+                <li><strong>Code Review:</strong> Security-focused code reviews catch vulnerabilities humans might miss.</li>
+                <li><strong>Secret Management:</strong> Never hardcode secrets; use external secret management systems.</li>
+                <li><strong>Input Validation:</strong> Validate and sanitize all user input to prevent injection attacks.</li>
+                <li><strong>OWASP Top 10:</strong> Design code to prevent common vulnerabilities like SQL injection, XSS, and CSRF.</li>
+            </ul>
+            
+            <h3>Infrastructure Security</h3>
+            <ul>
+                <li><strong>Network Segmentation:</strong> Isolate resources using security groups and network policies.</li>
+                <li><strong>Principle of Least Privilege:</strong> Grant only minimum necessary permissions via IAM policies.</li>
+                <li><strong>Encryption in Transit:</strong> Use TLS for all network communication.</li>
+                <li><strong>Encryption at Rest:</strong> Encrypt sensitive data stored in databases and storage services.</li>
+                <li><strong>VPC Security:</strong> Use VPCs to isolate cloud resources from the public internet.</li>
+                <li><strong>WAF Configuration:</strong> Deploy Web Application Firewalls to protect against common attacks.</li>
+            </ul>
+            
+            <h3>Runtime Security</h3>
+            <ul>
+                <li><strong>Container Image Scanning:</strong> Scan Docker images for vulnerabilities before deployment.</li>
+                <li><strong>Runtime Monitoring:</strong> Monitor containers and processes for suspicious behavior.</li>
+                <li><strong>Log Aggregation:</strong> Centralize logs for security event detection and forensics.</li>
+                <li><strong>Intrusion Detection:</strong> Deploy IDS/IPS to detect and prevent malicious activity.</li>
+                <li><strong>Security Patching:</strong> Apply security patches promptly for all systems and dependencies.</li>
+            </ul>
+            
+            <h3>Incident Response</h3>
+            <p>When security incidents occur, being prepared makes all the difference. Develop incident response playbooks, conduct tabletop exercises, and maintain forensic capabilities for investigation.</p>
+            
+            <h3>Conclusion</h3>
+            <p>Cloud security requires vigilance at every layer. Implement defense in depth, monitor continuously, and respond rapidly to threats.</p>
+        '''
+    },
+    11: {
+        'title': 'Cloud Cost Optimization: Strategies and Tools',
+        'category': 'Cloud',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Reduce cloud spending by 30-50% through optimization strategies and cost management tools.',
+        'content': '''
+            <h3>Understanding Cloud Costs</h3>
+            <p>Cloud providers charge for compute, storage, data transfer, and various managed services. Without optimization, costs grow quickly. Understanding cost drivers and implementing optimization strategies can reduce spending by 30-50% without sacrificing performance.</p>
+            
+            <h3>Compute Optimization</h3>
+            <ul>
+                <li><strong>Reserved Instances:</strong> Purchase reserved capacity upfront for significant discounts on predictable workloads.</li>
+                <li><strong>Spot Instances:</strong> Use spare capacity at 70-90% discounts for fault-tolerant, non-critical workloads.</li>
+                <li><strong>Right-Sizing:</strong> Choose appropriately-sized instances; oversized instances waste money.</li>
+                <li><strong>Auto Scaling:</strong> Scale capacity based on demand to avoid idle resources during low-traffic periods.</li>
+                <li><strong>Serverless:</strong> Use Lambda/Cloud Functions for workloads with unpredictable patterns instead of always-on servers.</li>
+                <li><strong>Container Efficiency:</strong> Use Kubernetes for better resource utilization compared to VMs.</li>
+            </ul>
+            
+            <h3>Storage Optimization</h3>
+            <ul>
+                <li><strong>Delete Unused Data:</strong> Regularly clean up unneeded volumes, snapshots, and databases.</li>
+                <li><strong>Storage Tiers:</strong> Move infrequently accessed data to cheaper storage classes.</li>
+                <li><strong>Compression:</strong> Compress data before storage to reduce space requirements.</li>
+                <li><strong>Deduplication:</strong> Identify and eliminate duplicate data.</li>
+                <li><strong>Backup Policies:</strong> Implement intelligent backup retention to avoid keeping excessive backups.</li>
+            </ul>
+            
+            <h3>Network Cost Optimization</h3>
+            <ul>
+                <li><strong>Data Transfer Optimization:</strong> Minimize inter-region data transfer which is expensive.</li>
+                <li><strong>CloudFront/CDN:</strong> Use content delivery networks to serve content closer to users.</li>
+                <li><strong>VPC Optimization:</strong> Understand and optimize VPC peering and NAT costs.</li>
+                <li><strong>Egress Filtering:</strong> Monitor and control expensive internet egress traffic.</li>
+            </ul>
+            
+            <h3>Cost Management Tools</h3>
+            <ul>
+                <li><strong>AWS Cost Explorer:</strong> Analyze spending patterns and identify optimization opportunities.</li>
+                <li><strong>Cloud Billing Tools:</strong> Third-party tools like Cloudability, Apptio provide deeper insights.</li>
+                <li><strong>Budget Alerts:</strong> Set budget thresholds to catch unexpected spending spikes.</li>
+                <li><strong>Resource Tagging:</strong> Tag resources to track costs by project, team, or cost center.</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Cloud cost optimization is ongoing. Regularly audit spending, implement automation, and foster a cost-conscious culture in your organization.</p>
+        '''
+    },
+    12: {
+        'title': 'API Gateways and Service Mesh: Building Resilient Architectures',
+        'category': 'Architecture',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Implement API gateways and service meshes for routing, security, and observability in microservices.',
+        'content': '''
+            <h3>API Gateways</h3>
+            <p>API gateways act as the front door for your microservices architecture, providing a single entry point for all client requests.</p>
+            
+            <h3>API Gateway Responsibilities</h3>
+            <ul>
+                <li><strong>Request Routing:</strong> Route requests to appropriate backend services based on path, host, or other criteria.</li>
+                <li><strong>Authentication:</strong> Validate credentials and enforce authorization policies.</li>
+                <li><strong>Rate Limiting:</strong> Protect services from overload by rate limiting client requests.</li>
+                <li><strong>Request/Response Transformation:</strong> Transform requests and responses for compatibility.</li>
+                <li><strong>Caching:</strong> Cache responses to reduce backend load and latency.</li>
+                <li><strong>API Versioning:</strong> Support multiple API versions for backward compatibility.</li>
+                <li><strong>Logging and Monitoring:</strong> Log all requests for audit and debugging purposes.</li>
+            </ul>
+            
+            <h3>Popular API Gateways</h3>
+            <ul>
+                <li><strong>Kong:</strong> Open-source gateway with extensive plugins for authentication, caching, rate limiting.</li>
+                <li><strong>AWS API Gateway:</strong> Managed service from AWS with Lambda integration.</li>
+                <li><strong>Azure API Management:</strong> Microsoft\'s managed API gateway with policy-based controls.</li>
+                <li><strong>Nginx:</strong> High-performance reverse proxy commonly used as API gateway.</li>
+            </ul>
+            
+            <h3>Service Mesh</h3>
+            <p>A service mesh handles service-to-service communication in microservices architectures. It manages traffic, security, and observability at the infrastructure level.</p>
+            
+            <h3>Service Mesh Capabilities</h3>
+            <ul>
+                <li><strong>Traffic Management:</strong> Advanced routing, load balancing, and traffic mirroring.</li>
+                <li><strong>Security:</strong> mTLS between services, authorization policies, and certificate management.</li>
+                <li><strong>Observability:</strong> Automatic metrics collection and distributed tracing.</li>
+                <li><strong>Resilience:</strong> Automatic retries, circuit breaking, and timeout management.</li>
+                <li><strong>Load Balancing:</strong> Intelligent load balancing across healthy service instances.</li>
+            </ul>
+            
+            <h3>Popular Service Meshes</h3>
+            <ul>
+                <li><strong>Istio:</strong> Feature-rich service mesh with traffic management, security, and observability.</li>
+                <li><strong>Linkerd:</strong> Lightweight, focused on simplicity and performance.</li>
+                <li><strong>Consul:</strong> HashiCorp\'s service mesh with broader DevOps tooling integration.</li>
+            </ul>
+            
+            <h3>API Gateway vs Service Mesh</h3>
+            <p>API gateways handle external client traffic while service meshes manage internal service-to-service traffic. Modern architectures often use both, complementing each other.</p>
+            
+            <h3>Conclusion</h3>
+            <p>API gateways and service meshes are essential components of modern microservices architectures, providing critical capabilities for resilience, security, and observability.</p>
+        '''
+    },
+    13: {
+        'title': 'MLOps: Operationalizing Machine Learning Models',
+        'category': 'MLOps',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Deploy, monitor, and manage machine learning models in production with MLOps practices.',
+        'content': '''
+            <h3>What is MLOps?</h3>
+            <p>MLOps applies DevOps principles to machine learning systems. It encompasses the practices, processes, and tools for deploying, versioning, monitoring, and managing ML models in production environments.</p>
+            
+            <h3>ML Model Development Workflow</h3>
+            <ul>
+                <li><strong>Data Collection:</strong> Gather and prepare training data from various sources.</li>
+                <li><strong>Feature Engineering:</strong> Create meaningful features for model training.</li>
+                <li><strong>Model Training:</strong> Train models and tune hyperparameters.</li>
+                <li><strong>Model Evaluation:</strong> Validate model performance on test data.</li>
+                <li><strong>Model Registry:</strong> Version and track trained models for reproducibility.</li>
+                <li><strong>Deployment:</strong> Package and deploy models to production.</li>
+                <li><strong>Monitoring:</strong> Monitor model performance and detect drift.</li>
+                <li><strong>Retraining:</strong> Periodically retrain models with new data.</li>
+            </ul>
+            
+            <h3>Key MLOps Tools</h3>
+            <ul>
+                <li><strong>MLflow:</strong> End-to-end platform for experiment tracking, model versioning, and serving.</li>
+                <li><strong>Kubeflow:</strong> Kubernetes-native platform for ML workflows.</li>
+                <li><strong>DVC:</strong> Data and ML experiment versioning system.</li>
+                <li><strong>Airflow:</strong> Workflow orchestration for data pipelines and retraining.</li>
+                <li><strong>Prometheus/Grafana:</strong> Monitor model performance metrics.</li>
+            </ul>
+            
+            <h3>Model Deployment Strategies</h3>
+            <ul>
+                <li><strong>Batch Predictions:</strong> Precompute predictions and store results for lookup.</li>
+                <li><strong>Real-time Inference:</strong> Serve predictions via API for interactive applications.</li>
+                <li><strong>Shadow Deployment:</strong> Run new model alongside current model to validate before cutover.</li>
+                <li><strong>Canary Deployment:</strong> Route small percentage of traffic to new model initially.</li>
+                <li><strong>Blue-Green Deployment:</strong> Maintain two identical environments and switch between them.</li>
+            </ul>
+            
+            <h3>Model Monitoring and Drift Detection</h3>
+            <p>Monitor models for performance degradation and data drift:</p>
+            <ul>
+                <li><strong>Performance Metrics:</strong> Track accuracy, precision, recall, and business metrics.</li>
+                <li><strong>Data Drift:</strong> Detect when input data distributions change significantly.</li>
+                <li><strong>Model Drift:</strong> Identify when model predictions become inaccurate.</li>
+                <li><strong>Automated Retraining:</strong> Trigger retraining when drift is detected.</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>MLOps bridges the gap between research and production, enabling organizations to reliably deploy and maintain machine learning systems at scale.</p>
+        '''
+    },
+    14: {
+        'title': 'Disaster Recovery and Business Continuity Planning',
+        'category': 'Disaster Recovery',
+        'author': 'Samuel Adomeh',
+        'excerpt': 'Design comprehensive disaster recovery strategies and test business continuity plans for production systems.',
+        'content': '''
+            <h3>Understanding Disaster Recovery</h3>
+            <p>Disaster recovery (DR) comprises the strategies, processes, and tools to restore critical systems and data after major disruptions. Unlike high availability which prevents failures, DR enables rapid recovery when failures occur.</p>
+            
+            <h3>Key Metrics</h3>
+            <ul>
+                <li><strong>Recovery Time Objective (RTO):</strong> Maximum acceptable downtime for critical systems. Lower RTO requires more resources.</li>
+                <li><strong>Recovery Point Objective (RPO):</strong> Maximum acceptable data loss in time. Lower RPO requires more frequent backups.</li>
+                <li><strong>Mean Time to Recovery (MTTR):</strong> Actual time to restore service after a failure.</li>
+                <li><strong>Mean Time Between Failures (MTBF):</strong> Average time until next predicted failure.</li>
+            </ul>
+            
+            <h3>DR Strategies</h3>
+            <ul>
+                <li><strong>Backup and Restore:</strong> Most cost-effective but longest RTO (hours to days). Suitable for non-critical systems.</li>
+                <li><strong>Pilot Light:</strong> Minimal standby environment with core components. Faster than full restore.</li>
+                <li><strong>Warm Standby:</strong> Scaled-down version of production running continuously. Moderate cost and RTO.</li>
+                <li><strong>Multi-Region Active-Active:</strong> Full production systems in multiple regions. Highest cost but near-zero RTO.</li>
+            </ul>
+            
+            <h3>Backup Best Practices</h3>
+            <ul>
+                <li><strong>Multiple Copies:</strong> Maintain at least 3 copies of critical data in different locations.</li>
+                <li><strong>Test Restores:</strong> Regularly test restoring from backups to ensure they\'re usable.</li>
+                <li><strong>Backup Encryption:</strong> Encrypt backups to protect sensitive data.</li>
+                <li><strong>Retention Policies:</strong> Define how long to keep backups based on compliance and recovery needs.</li>
+                <li><strong>Incremental Backups:</strong> Use incremental backups to reduce storage and backup time.</li>
+                <li><strong>Off-Site Storage:</strong> Store backups in different geographic regions for protection against regional disasters.</li>
+            </ul>
+            
+            <h3>DR Testing</h3>
+            <p>Testing is critical to ensure DR plans work when needed:</p>
+            <ul>
+                <li><strong>Tabletop Exercises:</strong> Team discusses disaster scenarios and responses without executing them.</li>
+                <li><strong>Simulation Drills:</strong> Execute parts of DR plan in controlled environment.</li>
+                <li><strong>Full-Scale Tests:</strong> Actually fail over to DR system and validate functionality.</li>
+                <li><strong>Document Findings:</strong> Update DR procedures based on test results.</li>
+                <li><strong>Test Frequency:</strong> Conduct substantial tests at least annually, simpler tests quarterly.</li>
+            </ul>
+            
+            <h3>Business Continuity Planning</h3>
+            <p>Beyond technology, ensure business processes can continue during disruptions:</p>
+            <ul>
+                <li><strong>Identify Critical Functions:</strong> Determine which business processes must resume first.</li>
+                <li><strong>Document Procedures:</strong> Maintain runbooks for manual operations if systems are unavailable.</li>
+                <li><strong>Communication Plan:</strong> Define how to communicate with customers and stakeholders during outages.</li>
+                <li><strong>Resource Planning:</strong> Ensure personnel are available to support recovery operations.</li>
+                <li><strong>Supplier Dependencies:</strong> Understand how failures of suppliers impact your business.</li>
+            </ul>
+            
+            <h3>Conclusion</h3>
+            <p>Comprehensive disaster recovery and business continuity planning minimize impact when failures occur. Invest in planning and testing to ensure your organization can recover quickly.</p>
+        '''
+    }
+}
+
+
+def seed_blog_posts(apps, schema_editor):
+    """Load the posts that used to be hard-coded in blog_helpers.
+
+    Each post keeps its old id, and so its URL, unless that id already
+    belongs to another row; then it gets a new one. Posts whose slug
+    already exists are left alone, so the migration is safe on a database
+    that has posts of its own.
+    """
+    BlogPost = apps.get_model('leumas', 'BlogPost')
+    Tag = apps.get_model('leumas', 'Tag')
+    slugs = set(BlogPost.objects.values_list('slug', flat=True))
+    taken_ids = set(BlogPost.objects.values_list('pk', flat=True))
+
+    now = timezone.now()
+    for position, (blog_id, source) in enumerate(POSTS.items()):
+        slug = slugify(source['title'])
+        if slug in slugs:
+            continue
+        tag, _ = Tag.objects.get_or_create(
+            slug=slugify(source['category']),
+            defaults={'name': source['category']},
+        )
+        post = BlogPost.objects.create(
+            id=None if blog_id in taken_ids else blog_id,
+            title=source['title'],
+            slug=slug,
+            category=source['category'],
+            author=source['author'],
+            excerpt=source['excerpt'],
+            content=source['content'].strip(),
+        )
+        post.tags.add(tag)
+        # published_date is auto_now_add; spread posts out to keep their order
+        BlogPost.objects.filter(pk=post.pk).update(
+            published_date=now - timedelta(days=position * 2)
+        )
+
+    # Explicit ids do not advance PostgreSQL's sequence
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [BlogPost]):
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0002_contact_service_tag_alter_newsletter_id_skill_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_blog_posts, migrations.RunPython.noop),
+    ]
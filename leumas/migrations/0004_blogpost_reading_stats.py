@@ -0,0 +1,46 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:08
+
+from django.db import migrations, models
+
+
+# A frozen copy of leumas.models.reading_stats, so later changes to it
+# never alter what this migration computes
+WORDS_PER_MINUTE = 200
+
+
+def reading_stats(content):
+    words = len(content.split())
+    return words, max(1, words // WORDS_PER_MINUTE)
+
+
+def backfill_reading_stats(apps, schema_editor):
+    BlogPost = apps.get_model('leumas', 'BlogPost')
+    batch = []
+    for post in BlogPost.objects.only('id', 'content').iterator(chunk_size=500):
+        post.word_count, post.reading_time = reading_stats(post.content)
+        batch.append(post)
+        if len(batch) >= 500:
+            BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time'])
+            batch = []
+    BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0003_seed_blog_posts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Minutes'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reading_stats, migrations.RunPython.noop),
+    ]
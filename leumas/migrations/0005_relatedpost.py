@@ -0,0 +1,58 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:09
+
+from collections import Counter, defaultdict
+from itertools import combinations
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_related_posts(apps, schema_editor):
+    # A frozen copy of leumas.related.rebuild_related_posts
+    BlogPost = apps.get_model('leumas', 'BlogPost')
+    RelatedPost = apps.get_model('leumas', 'RelatedPost')
+    posts = dict(BlogPost.objects.filter(is_published=True).values_list('id', 'published_date'))
+    posts_by_tag = defaultdict(list)
+    for post_id, tag_id in BlogPost.tags.through.objects.values_list('blogpost_id', 'tag_id'):
+        posts_by_tag[tag_id].append(post_id)
+
+    shared = Counter()
+    for post_ids in posts_by_tag.values():
+        for first, second in combinations(sorted(post_ids), 2):
+            shared[first, second] += 1
+
+    rows = []
+    for (first, second), count in shared.items():
+        if second in posts:
+            rows.append(RelatedPost(post_id=first, related_id=second,
+                                    shared_tags=count, related_published_date=posts[second]))
+        if first in posts:
+            rows.append(RelatedPost(post_id=second, related_id=first,
+                                    shared_tags=count, related_published_date=posts[first]))
+    RelatedPost.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0004_blogpost_reading_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shared_tags', models.PositiveIntegerField()),
+                ('related_published_date', models.DateTimeField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_to', to='leumas.blogpost')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_from', to='leumas.blogpost')),
+            ],
+            options={
+                'ordering': ['-shared_tags', '-related_published_date'],
+                'indexes': [models.Index(fields=['post', '-shared_tags', '-related_published_date'], name='leumas_rela_post_id_bdb345_idx')],
+                'unique_together': {('post', 'related')},
+            },
+        ),
+        migrations.RunPython(build_related_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+from django.db import migrations
+from django.utils.html import strip_tags
+
+# Frozen copies of the leumas.search DDL and documents as of this
+# migration, so later changes to that module never alter what it does
+CREATE_INDEX = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS leumas_search USING fts5("
+        "kind UNINDEXED, object_id UNINDEXED, title, body, "
+        "tokenize='porter unicode61')",
+    ],
+    'postgresql': [
+        "CREATE TABLE IF NOT EXISTS leumas_search ("
+        "kind varchar(20) NOT NULL, object_id bigint NOT NULL, "
+        "title text NOT NULL, body text NOT NULL, "
+        "document tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', title), 'A') || "
+        "setweight(to_tsvector('english', body), 'B')) STORED, "
+        "PRIMARY KEY (kind, object_id))",
+        'CREATE INDEX IF NOT EXISTS leumas_search_document ON leumas_search USING GIN (document)',
+    ],
+}
+
+# kind -> (model name, title field, body fields)
+DOCUMENTS = {
+    'blog': ('BlogPost', 'title', ['excerpt', 'content']),
+    'portfolio': ('Portfolio', 'title', ['description', 'challenge', 'solution']),
+}
+
+
+def create_search_index(apps, schema_editor):
+    statements = CREATE_INDEX.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+        for kind, (model_name, title_field, body_fields) in DOCUMENTS.items():
+            cursor.execute('DELETE FROM leumas_search WHERE kind = %s', [kind])
+            model = apps.get_model('leumas', model_name)
+            for obj in model.objects.only('id', title_field, *body_fields).iterator(chunk_size=500):
+                body = '\n'.join(getattr(obj, field) or '' for field in body_fields)
+                cursor.execute(
+                    'INSERT INTO leumas_search (kind, object_id, title, body) VALUES (%s, %s, %s, %s)',
+                    [kind, obj.pk, getattr(obj, title_field), strip_tags(body)],
+                )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in CREATE_INDEX:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute('DROP TABLE IF EXISTS leumas_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0005_relatedpost'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0007_outboxemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='submission_hash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0008_contact_submission_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', '-published_date', '-id'], name='leumas_blog_is_publ_c35e2a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolio',
+            index=models.Index(fields=['-is_featured', '-created_date', '-id'], name='leumas_port_is_feat_4b131c_idx'),
+        ),
+    ]
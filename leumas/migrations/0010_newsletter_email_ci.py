@@ -0,0 +1,34 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:22
+
+from django.db import migrations, models
+from django.db.models.functions import Lower
+import django.db.models.functions.text
+
+
+def drop_case_duplicates(apps, schema_editor):
+    """Keep one row per address, preferring an active one, then the oldest"""
+    Newsletter = apps.get_model('leumas', 'Newsletter')
+    previous = None
+    duplicates = []
+    rows = Newsletter.objects.annotate(key=Lower('email')).order_by('key', '-is_active', 'pk')
+    for pk, key in rows.values_list('pk', 'key').iterator(chunk_size=2000):
+        if key == previous:
+            duplicates.append(pk)
+        previous = key
+    for start in range(0, len(duplicates), 500):
+        Newsletter.objects.filter(pk__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0009_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='newsletter',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='leumas_newsletter_email_ci'),
+        ),
+    ]
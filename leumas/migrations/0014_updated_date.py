@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-18 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0013_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='portfolio',
+            name='updated_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='updated_date',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
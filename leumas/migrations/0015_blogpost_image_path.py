@@ -0,0 +1,42 @@
+from django.db import migrations, models
+
+# The images the seeded posts (0003) showed when they were hard-coded.
+# The last post pointed at img7.png, which was never shipped; it keeps the
+# default image instead.
+SEEDED_IMAGES = {
+    'setting-up-kubernetes-high-availability-clusters': '/static/images/blog/img1.png',
+    'gitlab-cicd-pipelines-from-zero-to-hero': '/static/images/blog/img2.png',
+    'terraform-infrastructure-as-code-best-practices': '/static/images/blog/img3.png',
+    'docker-container-optimization-and-security': '/static/images/blog/img4.png',
+    'observability-monitoring-logging-and-tracing': '/static/images/blog/img5.png',
+    'aws-networking-vpc-subnets-and-security-groups': '/static/images/blog/img6.png',
+    'devops-culture-tools-and-practices': '/static/images/blog/img3.png',
+    'microservices-architecture-design-patterns-and-pitfalls': '/static/images/blog/img1.png',
+    'database-replication-and-high-availability-strategies': '/static/images/blog/img2.png',
+    'cloud-application-security-from-code-to-runtime': '/static/images/blog/img3.png',
+    'cloud-cost-optimization-strategies-and-tools': '/static/images/blog/img4.png',
+    'api-gateways-and-service-mesh-building-resilient-architectures': '/static/images/blog/img5.png',
+    'mlops-operationalizing-machine-learning-models': '/static/images/blog/img6.png',
+}
+
+
+def restore_seeded_images(apps, schema_editor):
+    BlogPost = apps.get_model('leumas', 'BlogPost')
+    for slug, image in SEEDED_IMAGES.items():
+        BlogPost.objects.filter(slug=slug, image_path='').update(image_path=image)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0014_updated_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='image_path',
+            field=models.CharField(blank=True, help_text='Static image shown when there is no featured image', max_length=200),
+        ),
+        migrations.RunPython(restore_seeded_images, migrations.RunPython.noop),
+    ]
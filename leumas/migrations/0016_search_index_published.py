@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def drop_unpublished_posts(apps, schema_editor):
+    # The index used to include unpublished posts
+    connection = schema_editor.connection
+    if 'leumas_search' not in connection.introspection.table_names():
+        return
+    BlogPost = apps.get_model('leumas', 'BlogPost')
+    unpublished = list(BlogPost.objects.filter(is_published=False).values_list('id', flat=True))
+    with connection.cursor() as cursor:
+        for start in range(0, len(unpublished), 500):
+            ids = unpublished[start:start + 500]
+            cursor.execute(
+                "DELETE FROM leumas_search WHERE kind = 'blog' AND object_id IN (%s)"
+                % ', '.join(['%s'] * len(ids)),
+                ids,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0015_blogpost_image_path'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_unpublished_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.8 on 2026-10-18 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0016_search_index_published'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='submission_window',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='contact',
+            constraint=models.UniqueConstraint(fields=('submission_hash', 'submission_window'), name='unique_contact_submission'),
+        ),
+    ]
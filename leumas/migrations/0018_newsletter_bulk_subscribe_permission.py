@@ -0,0 +1,17 @@
+# Generated by Django 4.2.8 on 2026-10-18 01:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0017_contact_submission_window'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='newsletter',
+            options={'ordering': ['-subscribed_at'], 'permissions': [('bulk_subscribe', 'Can subscribe addresses in bulk through the API')]},
+        ),
+    ]
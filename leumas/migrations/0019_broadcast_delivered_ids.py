@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-18 01:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leumas', '0018_newsletter_bulk_subscribe_permission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='broadcast',
+            name='delivered_ids',
+            field=models.JSONField(default=list, editable=False),
+        ),
+    ]
@@ -1,7 +1,22 @@
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
 from django.utils.text import slugify
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+WORDS_PER_MINUTE = 200
+
+
+def reading_stats(content):
+    """Return (word_count, reading_time) for a block of post content"""
+    words = len(content.split())
+    return words, max(1, words // WORDS_PER_MINUTE)
+
+
+def normalize_email(email):
+    """Subscribers are unique case-insensitively; store one spelling"""
+    return email.strip().lower()
+
 
 class Newsletter(models.Model):
     email = models.EmailField(unique=True)
@@ -11,8 +26,19 @@ class Newsletter(models.Model):
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        # Upserts conflict on the exact address, so only one spelling may exist
+        self.email = normalize_email(self.email)
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['-subscribed_at']
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='leumas_newsletter_email_ci'),
+        ]
+        permissions = [
+            ('bulk_subscribe', 'Can subscribe addresses in bulk through the API'),
+        ]
 
 
 class Tag(models.Model):
@@ -41,10 +67,15 @@ class BlogPost(models.Model):
     published_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
     featured_image = models.ImageField(upload_to='blog/', null=True, blank=True)
+    # Responsive variants of featured_image, built on save by leumas.images
+    featured_image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    image_path = models.CharField(max_length=200, blank=True, help_text="Static image shown when there is no featured image")
     excerpt = models.TextField()
     content = models.TextField()
     is_published = models.BooleanField(default=True)
     views_count = models.IntegerField(default=0)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=1, editable=False, help_text="Minutes")
     tags = models.ManyToManyField(Tag, blank=True)
     meta_description = models.CharField(max_length=160, blank=True, help_text="SEO meta description")
     meta_keywords = models.CharField(max_length=200, blank=True)
@@ -52,22 +83,30 @@ class BlogPost(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.word_count, self.reading_time = reading_stats(self.content)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'word_count', 'reading_time'}
+        super().save(*args, **kwargs)
+
     def get_reading_time(self):
-        """Calculate reading time in minutes"""
-        words = len(self.content.split())
-        return max(1, words // 200)
+        """Reading time in minutes, stored when the post is saved"""
+        return self.reading_time
 
     def increment_views(self):
-        """Increment view count"""
+        """Increment view count with a single atomic UPDATE"""
+        BlogPost.objects.filter(pk=self.pk).update(views_count=models.F('views_count') + 1)
         self.views_count += 1
-        self.save(update_fields=['views_count'])
 
     def get_related_posts(self, limit=3):
-        """Get related posts by tags"""
+        """Get related posts ranked by shared tags, then recency"""
         return BlogPost.objects.filter(
-            tags__in=self.tags.all(),
-            is_published=True
-        ).exclude(id=self.id).distinct()[:limit]
+            related_from__post=self
+        ).order_by(
+            '-related_from__shared_tags', '-related_from__related_published_date'
+        ).defer('content').prefetch_related('tags')[:limit]
 
     def get_absolute_url(self):
         return f'/blog/{self.id}/'
@@ -76,11 +115,30 @@ class BlogPost(models.Model):
         ordering = ['-published_date']
         indexes = [
             models.Index(fields=['-published_date']),
+            models.Index(fields=['is_published', '-published_date', '-id']),
             models.Index(fields=['slug']),
             models.Index(fields=['is_published']),
         ]
 
 
+class RelatedPost(models.Model):
+    """Materialized related-posts index, maintained by leumas.related"""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_to')
+    related = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_from')
+    shared_tags = models.PositiveIntegerField()
+    related_published_date = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.shared_tags})"
+
+    class Meta:
+        ordering = ['-shared_tags', '-related_published_date']
+        unique_together = ['post', 'related']
+        indexes = [
+            models.Index(fields=['post', '-shared_tags', '-related_published_date']),
+        ]
+
+
 class Portfolio(models.Model):
     """Portfolio projects model"""
     title = models.CharField(max_length=200)
@@ -88,6 +146,8 @@ class Portfolio(models.Model):
     slug = models.SlugField(unique=True)
     category = models.CharField(max_length=50)
     image = models.ImageField(upload_to='portfolio/')
+    # Responsive variants of image, built on save by leumas.images
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField()
     challenge = models.TextField(blank=True)
     solution = models.TextField(blank=True)
@@ -95,6 +155,7 @@ class Portfolio(models.Model):
     tags = models.ManyToManyField(Tag, blank=True)
     is_featured = models.BooleanField(default=False)
     created_date = models.DateTimeField(auto_now_add=True)
+    updated_date = models.DateTimeField(auto_now=True)
     meta_description = models.CharField(max_length=160, blank=True)
 
     def __str__(self):
@@ -105,6 +166,9 @@ class Portfolio(models.Model):
 
     class Meta:
         ordering = ['-created_date']
+        indexes = [
+            models.Index(fields=['-is_featured', '-created_date', '-id']),
+        ]
 
 
 class Service(models.Model):
@@ -114,10 +178,14 @@ class Service(models.Model):
     description = models.TextField()
     icon = models.CharField(max_length=50, help_text="FontAwesome icon class")
     order = models.IntegerField(default=0, validators=[MinValueValidator(0)])
+    updated_date = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
 
+    def get_absolute_url(self):
+        return f'/service/{self.id}/'
+
     class Meta:
         ordering = ['order']
 
@@ -147,9 +215,86 @@ class Contact(models.Model):
     message = models.TextField()
     submitted_at = models.DateTimeField(auto_now_add=True)
     is_read = models.BooleanField(default=False)
+    submission_hash = models.CharField(max_length=64, blank=True, db_index=True, editable=False)
+    # CONTACT_DEDUP_SECONDS window the submission arrived in; null for rows
+    # not created from the form
+    submission_window = models.BigIntegerField(null=True, editable=False)
 
     def __str__(self):
         return f"{self.name} - {self.inquiry}"
 
     class Meta:
         ordering = ['-submitted_at']
+        constraints = [
+            # Catches re-sends that different workers buffered
+            models.UniqueConstraint(
+                fields=['submission_hash', 'submission_window'], name='unique_contact_submission'
+            ),
+        ]
+
+
+class OutboxEmail(models.Model):
+    """Transactional email waiting to be sent by the send_outbox worker"""
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+
+class Broadcast(models.Model):
+    """Newsletter issue sent to every active subscriber by send_broadcast"""
+    STATUS_DRAFT = 'draft'
+    STATUS_QUEUED = 'queued'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_CHOICES = [
+        (STATUS_DRAFT, 'Draft'),
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_SENDING, 'Sending'),
+        (STATUS_SENT, 'Sent'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(help_text="HTML, rendered inside the newsletter email template")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_DRAFT)
+    # Checkpoint: every subscriber up to this id has been sent to
+    last_subscriber_id = models.PositiveIntegerField(default=0, editable=False)
+    # Subscribers past the checkpoint that an interrupted batch already
+    # reached; skipped when the broadcast resumes
+    delivered_ids = models.JSONField(default=list, editable=False)
+    sent_count = models.PositiveIntegerField(default=0, editable=False)
+    failed_count = models.PositiveIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True, editable=False)
+    finished_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    def __str__(self):
+        return f"{self.subject} ({self.status})"
+
+    class Meta:
+        ordering = ['-created_at']
@@ -0,0 +1,133 @@
+"""Newsletter subscription writes: upserts, and bulk CSV import and export.
+
+subscribe() is a single INSERT ... ON CONFLICT statement, so concurrent
+requests for the same address cannot race each other into an IntegrityError.
+
+Both CSV directions stream: import reads the CSV lazily and inserts
+fixed-size batches, and export walks the table with a server-side iterator.
+Neither holds more than one batch in memory, however long the list is.
+"""
+
+import csv
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import Newsletter, normalize_email
+
+CSV_HEADER = ['email', 'subscribed_at', 'is_active']
+
+
+def subscribe(emails, batch_size=250):
+    """Subscribe `emails`, reactivating unsubscribed rows.
+
+    Returns the addresses that were inserted or reactivated; addresses that
+    were already active are left untouched and not returned.
+    """
+    emails = list(dict.fromkeys(normalize_email(email) for email in emails))
+    if connection.vendor in ('postgresql', 'sqlite') and connection.features.can_return_rows_from_bulk_insert:
+        changed = []
+        for start in range(0, len(emails), batch_size):
+            changed += _upsert(emails[start:start + batch_size])
+        return changed
+    return _subscribe_each(emails)
+
+
+def _upsert(emails):
+    table = connection.ops.quote_name(Newsletter._meta.db_table)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    values = ', '.join(['(%s, %s, %s)'] * len(emails))
+    params = []
+    for email in emails:
+        params += [email, now, True]
+    # The WHERE keeps active rows untouched, so RETURNING lists only the
+    # rows this call inserted or reactivated
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} (email, subscribed_at, is_active) VALUES {values} '
+            f'ON CONFLICT (email) DO UPDATE SET is_active = EXCLUDED.is_active '
+            f'WHERE NOT {table}.is_active RETURNING email',
+            params,
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _subscribe_each(emails):
+    """Fallback for databases without INSERT ... ON CONFLICT ... RETURNING"""
+    changed = []
+    for email in emails:
+        with transaction.atomic():
+            subscriber, created = Newsletter.objects.select_for_update().get_or_create(email=email)
+            if created or not subscriber.is_active:
+                Newsletter.objects.filter(pk=subscriber.pk).update(is_active=True)
+                changed.append(email)
+    return changed
+
+
+def read_emails(lines):
+    """Yield the email column of a CSV, with or without a header row"""
+    column = 0
+    for number, row in enumerate(csv.reader(lines)):
+        if not row:
+            continue
+        if number == 0:
+            header = [cell.strip().lower() for cell in row]
+            if 'email' in header:
+                column = header.index('email')
+                continue
+        if column < len(row):
+            yield row[column]
+
+
+def import_subscribers(emails, batch_size=1000):
+    """Insert new subscribers, skipping invalid and already known addresses.
+
+    Returns (read, invalid, created).
+    """
+    read = invalid = 0
+    before = Newsletter.objects.count()
+    emails = iter(emails)
+    while True:
+        chunk = list(islice(emails, batch_size))
+        if not chunk:
+            break
+        read += len(chunk)
+        batch = {}
+        for email in chunk:
+            email = normalize_email(email)
+            try:
+                validate_email(email)
+            except ValidationError:
+                invalid += 1
+                continue
+            batch.setdefault(email, Newsletter(email=email))
+        # Existing addresses hit the case-insensitive unique index and are skipped
+        Newsletter.objects.bulk_create(batch.values(), ignore_conflicts=True)
+    return read, invalid, Newsletter.objects.count() - before
+
+
+class Echo:
+    """File-like object whose write() hands the line back to csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, chunk_size=2000):
+    """Yield the CSV lines for `queryset`, header first"""
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+    rows = queryset.order_by('pk').values_list(*CSV_HEADER).iterator(chunk_size=chunk_size)
+    for email, subscribed_at, is_active in rows:
+        yield writer.writerow([email, subscribed_at.isoformat(), int(is_active)])
+
+
+def export_response(queryset, filename='newsletter.csv'):
+    """Stream `queryset` to the client as a CSV attachment"""
+    response = StreamingHttpResponse(export_rows(queryset), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
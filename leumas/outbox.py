@@ -0,0 +1,111 @@
+"""Durable outbox for transactional email.
+
+Requests only insert an OutboxEmail row; the send_outbox worker drains the
+table in batches over one reused SMTP connection. Failed messages are
+retried with exponential backoff and marked failed after
+OUTBOX_MAX_ATTEMPTS.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from leumas.models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def build_email(subject, to, template, context, from_email=None):
+    """Render `template` (.txt and .html) into an unsaved OutboxEmail"""
+    return OutboxEmail(
+        subject=subject,
+        body=render_to_string(f'{template}.txt', context),
+        html_body=render_to_string(f'{template}.html', context),
+        from_email=from_email or '',
+        to=list(to),
+    )
+
+
+def queue_email(subject, to, template, context, from_email=None):
+    """Render `template` and queue it for delivery"""
+    email = build_email(subject, to, template, context, from_email)
+    email.save()
+    return email
+
+
+def _build_message(email, connection):
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email or None,
+        to=email.to,
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, 'text/html')
+    return message
+
+
+def _claim_batch(batch_size):
+    """Lease a batch of due emails so concurrent workers skip them"""
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        # A worker that dies mid-batch releases its emails when the lease ends
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in batch]).update(
+            next_attempt_at=now + timedelta(seconds=settings.OUTBOX_LEASE_SECONDS)
+        )
+    return batch
+
+
+def send_queued_emails(batch_size=50):
+    """Send one batch of due emails; returns (sent, failed) counts"""
+    batch = _claim_batch(batch_size)
+    if not batch:
+        return 0, 0
+
+    sent = failed = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+        for email in batch:
+            try:
+                _build_message(email, connection).send()
+            except Exception as exc:
+                failed += 1
+                _record_failure(email, exc)
+            else:
+                sent += 1
+                email.status = OutboxEmail.STATUS_SENT
+                email.sent_at = timezone.now()
+                email.attempts += 1
+                email.save(update_fields=['status', 'sent_at', 'attempts'])
+    except Exception as exc:
+        # Could not reach the server: retry the rest of the batch later
+        for email in batch[sent + failed:]:
+            failed += 1
+            _record_failure(email, exc)
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def _record_failure(email, exc):
+    email.attempts += 1
+    email.last_error = f'{type(exc).__name__}: {exc}'
+    if email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboxEmail.STATUS_FAILED
+        logger.error('Giving up on outbox email %s: %s', email.pk, email.last_error)
+    else:
+        delay = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (email.attempts - 1)
+        email.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
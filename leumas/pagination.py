@@ -0,0 +1,178 @@
+"""Keyset (cursor) pagination for the list APIs.
+
+A page is fetched with `WHERE (key) > (last key seen) ORDER BY key LIMIT n`
+instead of `OFFSET`, so every page costs the same index range scan however
+deep the client goes. The key is the queryset's ordering plus the primary
+key as a tie-breaker, and it must be one of the model's orderings in
+KeysetPagination.cursor_orderings. Any other ordering (search relevance,
+`views_count`) and the legacy `?page=` parameter fall back to page number
+pagination.
+
+`?count=false` skips the `COUNT(*)` for clients that don't need totals.
+"""
+
+import base64
+import datetime
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = _('Invalid cursor')
+    fallback_class = PageNumberPagination
+    # Orderings that page by cursor, by model; each is backed by an index
+    # in the model's Meta.indexes
+    cursor_orderings = {
+        'leumas.BlogPost': [('-published_date', '-id')],
+        'leumas.Portfolio': [('-is_featured', '-created_date', '-id')],
+    }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.fallback = None
+        ordering = self.get_ordering(queryset, view)
+        if ordering is None or self.fallback_class.page_query_param in request.query_params:
+            self.fallback = self.fallback_class()
+            return self.fallback.paginate_queryset(queryset, request, view)
+
+        self.ordering = ordering
+        self.base_url = request.build_absolute_uri()
+        self.count = queryset.count() if self.wants_count(request) else None
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        if reverse:
+            queryset = queryset.order_by(*[invert(field) for field in ordering])
+        else:
+            queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.after(position, reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        del results[self.page_size:]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+        fields = []
+        if self.count is not None:
+            fields.append(('count', self.count))
+        fields += [
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]
+        return Response(OrderedDict(fields))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'count': {'type': 'integer', 'example': 123},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_ordering(self, queryset, view):
+        """The keyset for this queryset, or None if no index supports it"""
+        pk = queryset.model._meta.pk.name
+        ordering = [
+            field.replace('pk', pk) if field.lstrip('-') == 'pk' else field
+            for field in queryset.query.order_by or queryset.model._meta.ordering
+        ]
+        if not all(isinstance(field, str) for field in ordering) or not ordering:
+            return None
+        if ordering[-1].lstrip('-') != pk:
+            ordering.append(f'-{pk}' if ordering[-1].startswith('-') else pk)
+        for allowed in self.cursor_orderings.get(queryset.model._meta.label, ()):
+            if ordering in (list(allowed), [invert(field) for field in allowed]):
+                return ordering
+        return None
+
+    def wants_count(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() not in ('0', 'false', 'no')
+
+    def after(self, position, reverse):
+        """Row-value comparison `(key) > (position)` spelled out as a Q"""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            condition |= equal & Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+            equal &= Q(**{name: value})
+        # A plain range on the leading column lets the planner use the index
+        name = self.ordering[0].lstrip('-')
+        descending = self.ordering[0].startswith('-') != reverse
+        return Q(**{f"{name}__{'lte' if descending else 'gte'}": position[0]}) & condition
+
+    def get_position(self, instance):
+        return [getattr(instance, field.lstrip('-')) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse):
+        payload = {'o': self.ordering, 'p': position}
+        if reverse:
+            payload['r'] = 1
+        encoded = json.dumps(payload, default=encode_value, separators=(',', ':'))
+        token = base64.urlsafe_b64encode(encoded.encode()).decode().rstrip('=')
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            if payload['o'] != self.ordering or len(payload['p']) != len(self.ordering):
+                raise ValueError
+            position = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, payload['p'])
+            ]
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+
+def invert(field):
+    return field[1:] if field.startswith('-') else f'-{field}'
+
+
+def encode_value(value):
+    # Full precision: DjangoJSONEncoder drops microseconds past milliseconds
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not a cursor value')
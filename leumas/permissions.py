@@ -0,0 +1,10 @@
+from rest_framework.permissions import BasePermission
+
+
+class CanBulkSubscribe(BasePermission):
+    """Staff, or partners granted leumas.bulk_subscribe"""
+    message = 'Bulk subscription is limited to staff and partners.'
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and (user.is_staff or user.has_perm('leumas.bulk_subscribe')))
@@ -0,0 +1,77 @@
+"""Maintenance of the materialized related-posts index.
+
+Two posts are related when they share at least one tag. Each RelatedPost row
+stores how many tags they share plus the related post's publish date, so a
+post's related list is one indexed query ordered by
+(-shared_tags, -related_published_date).
+"""
+
+from collections import Counter, defaultdict
+from itertools import combinations
+
+from django.db import transaction
+from django.db.models import Count
+
+from leumas.models import BlogPost, RelatedPost
+
+
+def refresh_related_posts(post_ids):
+    """Recompute the index rows that involve any of `post_ids`"""
+    post_ids = set(post_ids)
+    if not post_ids:
+        return
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=post_ids).delete()
+        RelatedPost.objects.filter(related_id__in=post_ids).delete()
+
+        rows = {}
+        posts = BlogPost.objects.filter(id__in=post_ids).only('id', 'is_published', 'published_date')
+        for post in posts:
+            tag_ids = post.tags.values_list('id', flat=True)
+            candidates = (
+                BlogPost.objects.filter(tags__in=tag_ids)
+                .exclude(id=post.id)
+                .annotate(shared=Count('tags'))
+                .values_list('id', 'is_published', 'published_date', 'shared')
+            )
+            for other_id, other_published, other_date, shared in candidates:
+                if other_published:
+                    rows[post.id, other_id] = RelatedPost(
+                        post_id=post.id, related_id=other_id,
+                        shared_tags=shared, related_published_date=other_date,
+                    )
+                if post.is_published:
+                    rows[other_id, post.id] = RelatedPost(
+                        post_id=other_id, related_id=post.id,
+                        shared_tags=shared, related_published_date=post.published_date,
+                    )
+        RelatedPost.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+def rebuild_related_posts(batch_size=1000):
+    """Rebuild the whole index from the tag assignments; returns the row count"""
+    posts = dict(
+        BlogPost.objects.filter(is_published=True).values_list('id', 'published_date')
+    )
+    posts_by_tag = defaultdict(list)
+    for post_id, tag_id in BlogPost.tags.through.objects.values_list('blogpost_id', 'tag_id'):
+        posts_by_tag[tag_id].append(post_id)
+
+    shared = Counter()
+    for post_ids in posts_by_tag.values():
+        for first, second in combinations(sorted(post_ids), 2):
+            shared[first, second] += 1
+
+    rows = []
+    for (first, second), count in shared.items():
+        if second in posts:
+            rows.append(RelatedPost(post_id=first, related_id=second,
+                                    shared_tags=count, related_published_date=posts[second]))
+        if first in posts:
+            rows.append(RelatedPost(post_id=second, related_id=first,
+                                    shared_tags=count, related_published_date=posts[first]))
+
+    with transaction.atomic():
+        RelatedPost.objects.all().delete()
+        RelatedPost.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
@@ -0,0 +1,243 @@
+"""Full-text search over blog posts and portfolio projects.
+
+Documents are stored in a `leumas_search` table: an FTS5 virtual table on
+SQLite, and a table with a generated, GIN-indexed tsvector column on
+PostgreSQL. Signal handlers keep it in sync with the models, and
+FullTextSearchFilter answers the API's `?search=` parameter from it with
+ranked results and snippets. On any other database the filter falls back to
+DRF's SearchFilter.
+
+Only rows the API can return are indexed: unpublished posts are left out.
+A search returns at most SEARCH_MAX_RESULTS of the best matches, and the
+paginated `count` is the size of that capped set.
+"""
+
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, CharField, IntegerField, Value, When
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+SEARCH_TABLE = 'leumas_search'
+
+# kind -> (model label, title field, body fields, filter of indexed rows)
+SEARCH_DOCUMENTS = {
+    'blog': ('leumas.BlogPost', 'title', ['excerpt', 'content'], {'is_published': True}),
+    'portfolio': ('leumas.Portfolio', 'title', ['description', 'challenge', 'solution'], {}),
+}
+
+SNIPPET_START = '<mark>'
+SNIPPET_END = '</mark>'
+
+
+class SQLiteFTSBackend:
+    """SQLite FTS5 index ranked with bm25(), title weighted over body"""
+
+    def create_index(self, cursor):
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            "kind UNINDEXED, object_id UNINDEXED, title, body, "
+            "tokenize='porter unicode61')"
+        )
+
+    def drop_index(self, cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def index(self, cursor, kind, object_id, title, body):
+        self.remove(cursor, kind, object_id)
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (kind, object_id, title, body) VALUES (%s, %s, %s, %s)',
+            [kind, object_id, title, body],
+        )
+
+    def remove(self, cursor, kind, object_id):
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE kind = %s AND object_id = %s',
+            [kind, object_id],
+        )
+
+    def clear(self, cursor, kind):
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE kind = %s', [kind])
+
+    def search(self, cursor, kind, query, limit):
+        match = self.match_expression(query)
+        if not match:
+            return []
+        cursor.execute(
+            f"SELECT object_id, snippet({SEARCH_TABLE}, 3, %s, %s, '…', 16) "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND kind = %s "
+            f"ORDER BY bm25({SEARCH_TABLE}, 0, 0, 10.0, 1.0) LIMIT %s",
+            [SNIPPET_START, SNIPPET_END, match, kind, limit],
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def match_expression(query):
+        """Turn free text into an FTS5 query of prefix terms, all required"""
+        terms = re.findall(r'\w+', query)
+        return ' '.join(f'"{term}"*' for term in terms)
+
+
+class PostgresSearchBackend:
+    """PostgreSQL tsvector index ranked with ts_rank(), title weighted A"""
+
+    def create_index(self, cursor):
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+            "kind varchar(20) NOT NULL, object_id bigint NOT NULL, "
+            "title text NOT NULL, body text NOT NULL, "
+            "document tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', title), 'A') || "
+            "setweight(to_tsvector('english', body), 'B')) STORED, "
+            "PRIMARY KEY (kind, object_id))"
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document '
+            f'ON {SEARCH_TABLE} USING GIN (document)'
+        )
+
+    def drop_index(self, cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def index(self, cursor, kind, object_id, title, body):
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (kind, object_id, title, body) VALUES (%s, %s, %s, %s) '
+            'ON CONFLICT (kind, object_id) DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body',
+            [kind, object_id, title, body],
+        )
+
+    def remove(self, cursor, kind, object_id):
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE kind = %s AND object_id = %s',
+            [kind, object_id],
+        )
+
+    def clear(self, cursor, kind):
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE kind = %s', [kind])
+
+    def search(self, cursor, kind, query, limit):
+        cursor.execute(
+            "SELECT object_id, ts_headline('english', body, q, %s) "
+            f"FROM {SEARCH_TABLE}, websearch_to_tsquery('english', %s) q "
+            "WHERE kind = %s AND document @@ q "
+            "ORDER BY ts_rank(document, q) DESC LIMIT %s",
+            [f'StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, MaxWords=24, MinWords=8',
+             query, kind, limit],
+        )
+        return cursor.fetchall()
+
+
+BACKENDS = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend(using=None):
+    """Return the search backend for the database, or None if unsupported"""
+    using = using or connection
+    if settings.SEARCH_BACKEND:
+        return import_string(settings.SEARCH_BACKEND)()
+    backend_class = BACKENDS.get(using.vendor)
+    return backend_class() if backend_class else None
+
+
+def get_kind(model):
+    """Return the search document kind for `model`, or None"""
+    for kind, (label, *_) in SEARCH_DOCUMENTS.items():
+        if model._meta.label == label:
+            return kind
+    return None
+
+
+def build_document(kind, obj):
+    """Return the (title, body) text indexed for `obj`"""
+    _, title_field, body_fields, _ = SEARCH_DOCUMENTS[kind]
+    body = '\n'.join(getattr(obj, field) or '' for field in body_fields)
+    return getattr(obj, title_field), strip_tags(body)
+
+
+def is_indexed(kind, obj):
+    """Whether `obj` belongs in the index, e.g. is a published post"""
+    filters = SEARCH_DOCUMENTS[kind][3]
+    return all(getattr(obj, field) == value for field, value in filters.items())
+
+
+def index_object(obj):
+    """Add or refresh `obj`, or drop it once it no longer qualifies"""
+    kind = get_kind(type(obj))
+    backend = get_backend()
+    if kind and backend:
+        with connection.cursor() as cursor:
+            if is_indexed(kind, obj):
+                backend.index(cursor, kind, obj.pk, *build_document(kind, obj))
+            else:
+                backend.remove(cursor, kind, obj.pk)
+
+
+def remove_object(obj):
+    kind = get_kind(type(obj))
+    backend = get_backend()
+    if kind and backend:
+        with connection.cursor() as cursor:
+            backend.remove(cursor, kind, obj.pk)
+
+
+def rebuild_index(using=None):
+    """Reindex every searchable row; returns the number of documents"""
+    using = using or connection
+    backend = get_backend(using)
+    if backend is None:
+        return 0
+    count = 0
+    with using.cursor() as cursor:
+        backend.create_index(cursor)
+        for kind, (label, title_field, body_fields, filters) in SEARCH_DOCUMENTS.items():
+            backend.clear(cursor, kind)
+            model = apps.get_model(label)
+            fields = ['id', title_field, *body_fields]
+            for obj in model.objects.filter(**filters).only(*fields).iterator(chunk_size=500):
+                backend.index(cursor, kind, obj.pk, *build_document(kind, obj))
+                count += 1
+    return count
+
+
+class FullTextSearchFilter(SearchFilter):
+    """Serve `?search=` from the full-text index, ranked by relevance.
+
+    Matching rows are annotated with `search_rank` (0 is best) and
+    `search_snippet`. Results are ordered by rank unless `?ordering=` is
+    given. Only the SEARCH_MAX_RESULTS best matches are returned, whatever
+    the ordering. Without a supported backend this behaves like SearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        kind = get_kind(queryset.model)
+        backend = get_backend()
+        if not query or kind is None or backend is None:
+            return super().filter_queryset(request, queryset, view)
+
+        with connection.cursor() as cursor:
+            hits = backend.search(cursor, kind, query, settings.SEARCH_MAX_RESULTS)
+        if not hits:
+            return queryset.none()
+
+        queryset = queryset.filter(pk__in=[object_id for object_id, _ in hits]).annotate(
+            search_rank=Case(
+                *[When(pk=object_id, then=Value(rank)) for rank, (object_id, _) in enumerate(hits)],
+                output_field=IntegerField(),
+            ),
+            search_snippet=Case(
+                *[When(pk=object_id, then=Value(snippet)) for object_id, snippet in hits],
+                output_field=CharField(),
+            ),
+        )
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            queryset = queryset.order_by('search_rank')
+        return queryset
@@ -1,16 +1,54 @@
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 from .models import BlogPost, Portfolio, Service, Skill, Tag, Newsletter
 
 
-class TagSerializer(serializers.ModelSerializer):
+def split_param(value):
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+class SparseFieldsMixin:
+    """Serialize only the fields named in `?fields=`, minus any in `?omit=`"""
+    extra_fields = []
+
+    @classmethod
+    def requested_fields(cls, request):
+        """The fields a response to `request` includes, in declaration order"""
+        fields = list(cls.Meta.fields) + cls.extra_fields
+        if request is None or request.method not in SAFE_METHODS:
+            return fields
+        only = split_param(request.query_params.get('fields', ''))
+        omit = split_param(request.query_params.get('omit', ''))
+        return [name for name in fields if (not only or name in only) and name not in omit]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requested = set(self.requested_fields(self.context.get('request')))
+        for name in list(self.fields):
+            if name not in self.requested:
+                self.fields.pop(name)
+
+
+class TagSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ['id', 'name', 'slug']
 
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class SearchSnippetMixin:
+    """Include the full-text search snippet in `?search=` results"""
+    extra_fields = ['search_snippet']
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        snippet = getattr(instance, 'search_snippet', None)
+        if snippet is not None and 'search_snippet' in self.requested:
+            data['search_snippet'] = snippet
+        return data
+
+
+class BlogPostSerializer(SearchSnippetMixin, SparseFieldsMixin, serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
-    reading_time = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogPost
@@ -19,10 +57,7 @@ class BlogPostSerializer(serializers.ModelSerializer):
             'featured_image', 'published_date', 'updated_date', 'views_count',
             'tags', 'reading_time', 'meta_description'
         ]
-        read_only_fields = ['id', 'slug', 'published_date', 'updated_date', 'views_count']
-
-    def get_reading_time(self, obj):
-        return obj.get_reading_time()
+        read_only_fields = ['id', 'slug', 'published_date', 'updated_date', 'views_count', 'reading_time']
 
 
 class BlogPostDetailSerializer(BlogPostSerializer):
@@ -36,7 +71,7 @@ class BlogPostDetailSerializer(BlogPostSerializer):
         return BlogPostSerializer(related, many=True).data
 
 
-class PortfolioSerializer(serializers.ModelSerializer):
+class PortfolioSerializer(SearchSnippetMixin, SparseFieldsMixin, serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
 
     class Meta:
@@ -53,29 +88,31 @@ class PortfolioDetailSerializer(PortfolioSerializer):
         fields = PortfolioSerializer.Meta.fields + ['challenge', 'solution', 'results']
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = ['id', 'title', 'slug', 'description', 'icon', 'order']
         read_only_fields = ['id', 'slug']
 
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Skill
         fields = ['id', 'name', 'category', 'proficiency']
         read_only_fields = ['id']
 
 
-class NewsletterSerializer(serializers.ModelSerializer):
+class NewsletterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Newsletter
         fields = ['email']
         extra_kwargs = {
-            'email': {'required': True}
+            # Uniqueness is enforced by the upsert, not by a query up front
+            'email': {'required': True, 'validators': []}
         }
 
-    def validate_email(self, value):
-        if Newsletter.objects.filter(email=value, is_active=True).exists():
-            raise serializers.ValidationError('This email is already subscribed.')
-        return value
+
+class NewsletterBatchSerializer(serializers.Serializer):
+    emails = serializers.ListField(
+        child=serializers.CharField(), allow_empty=False, max_length=1000
+    )
@@ -0,0 +1,123 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from leumas.cache import bump_version
+from leumas.images import build_upload_variants
+from leumas.models import BlogPost, Portfolio, Service, Skill, Tag
+from leumas.related import refresh_related_posts
+from leumas.search import index_object, remove_object
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_blog_cache(sender, update_fields=None, **kwargs):
+    """Drop cached blog pages when a post changes"""
+    if update_fields is not None and set(update_fields) <= {'views_count'}:
+        # View counts are not rendered on the HTML pages
+        return
+    bump_version('blog')
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def invalidate_blog_tags_cache(sender, **kwargs):
+    """Drop cached blog pages when a post's tags are reassigned"""
+    bump_version('blog')
+
+
+@receiver(post_save, sender=Portfolio)
+@receiver(post_delete, sender=Portfolio)
+@receiver(m2m_changed, sender=Portfolio.tags.through)
+def invalidate_portfolio_cache(sender, **kwargs):
+    """Drop cached portfolio pages when a project changes"""
+    bump_version('portfolio')
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def invalidate_service_cache(sender, **kwargs):
+    """Drop cached service pages when a service changes"""
+    bump_version('service')
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def invalidate_skill_cache(sender, **kwargs):
+    """Drop cached pages that show skills"""
+    bump_version('skill')
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_cache(sender, **kwargs):
+    """Tags are shown on both blog posts and portfolio projects"""
+    bump_version('blog')
+    bump_version('portfolio')
+
+
+@receiver(post_save, sender=BlogPost)
+def refresh_related_on_save(sender, instance, created, update_fields=None, **kwargs):
+    """Publishing state and date feed the related-posts ranking"""
+    if created:
+        # New posts have no tags yet; m2m_changed handles their first tags
+        return
+    if update_fields is not None and not set(update_fields) & {'is_published', 'published_date'}:
+        return
+    refresh_related_posts([instance.pk])
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def refresh_related_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recompute the related-posts rows of posts whose tags changed"""
+    if action not in ('pre_clear', 'post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        if action != 'pre_clear':
+            refresh_related_posts([instance.pk])
+        return
+    # Changed from the tag side (tag.blogpost_set); pk_set holds post ids
+    if action == 'pre_clear':
+        instance._related_post_ids = list(instance.blogpost_set.values_list('id', flat=True))
+    elif action == 'post_clear':
+        refresh_related_posts(getattr(instance, '_related_post_ids', []))
+    else:
+        refresh_related_posts(pk_set)
+
+@receiver(pre_delete, sender=Tag)
+def remember_tagged_posts(sender, instance, **kwargs):
+    instance._related_post_ids = list(instance.blogpost_set.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+def refresh_related_on_tag_delete(sender, instance, **kwargs):
+    refresh_related_posts(getattr(instance, '_related_post_ids', []))
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=Portfolio)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    """Keep the full-text index in sync with saved posts and projects"""
+    if update_fields is not None and set(update_fields) <= {'views_count'}:
+        return
+    index_object(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+@receiver(post_delete, sender=Portfolio)
+def remove_from_search_index(sender, instance, **kwargs):
+    remove_object(instance)
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_save, sender=Portfolio)
+def build_image_variants(sender, instance, update_fields=None, **kwargs):
+    """Resize a newly uploaded image into its responsive variants"""
+    field = 'featured_image' if sender is BlogPost else 'image'
+    image = getattr(instance, field)
+    variants = getattr(instance, f'{field}_variants')
+    if not image or variants.get('source') == image.name:
+        return
+    entry = build_upload_variants(image)
+    if entry is not None:
+        # update() rather than save(), so the signals don't fire again
+        sender.objects.filter(pk=instance.pk).update(**{f'{field}_variants': entry})
+        setattr(instance, f'{field}_variants', entry)
@@ -0,0 +1,74 @@
+"""Sitemaps for the public pages, generated from content.
+
+Blog posts come from BlogPost, with the row's updated_date as `lastmod`.
+Portfolio projects and services list the data.py ids, since those are
+the only ones the /portfolio/<id>/ and /service/<id>/ views render.
+data.py has no dates, so those entries have no lastmod.
+
+The views in leumas.views.sitemap serve and cache these.
+"""
+
+from django.contrib.sitemaps import Sitemap
+from django.db.models import Max
+from django.urls import reverse
+
+from leumas.models import BlogPost
+from leumas.views.data import PORTFOLIO_PROJECTS, SERVICES
+
+
+class PageSitemap(Sitemap):
+    """The listing pages"""
+    changefreq = 'weekly'
+
+    def items(self):
+        return [
+            'leumas:leumas-index', 'leumas:leumas-about', 'leumas:leumas-services',
+            'leumas:leumas-works', 'leumas:leumas-blog', 'leumas:leumas-contact',
+        ]
+
+    def location(self, item):
+        return reverse(item)
+
+
+class BlogPostSitemap(Sitemap):
+    changefreq = 'monthly'
+
+    def items(self):
+        return BlogPost.objects.filter(is_published=True).only('id', 'updated_date').order_by('pk')
+
+    def lastmod(self, post):
+        return post.updated_date
+
+    def get_latest_lastmod(self):
+        return self.items().aggregate(latest=Max('updated_date'))['latest']
+
+
+class DataSitemap(Sitemap):
+    """The ids of a data.py dictionary"""
+    changefreq = 'monthly'
+    data = {}
+    url_name = None
+
+    def items(self):
+        return sorted(self.data)
+
+    def location(self, item):
+        return reverse(self.url_name, args=[item])
+
+
+class PortfolioSitemap(DataSitemap):
+    data = PORTFOLIO_PROJECTS
+    url_name = 'leumas:portfolio-detail'
+
+
+class ServiceSitemap(DataSitemap):
+    data = SERVICES
+    url_name = 'leumas:service-detail'
+
+
+SITEMAPS = {
+    'pages': PageSitemap,
+    'blog': BlogPostSitemap,
+    'portfolio': PortfolioSitemap,
+    'services': ServiceSitemap,
+}
@@ -0,0 +1,79 @@
+"""Static files storage: hashed names with gzip and Brotli siblings.
+
+collectstatic always writes content-hashed copies of every asset (for
+example css/style.3f2a9c1b7e4d.css) and compresses them. It does this
+whatever DEBUG is set to. Brotli needs the `brotli` package; without it
+only gzip is written. WhiteNoise serves the smallest encoding the client
+accepts.
+
+Once a manifest exists, {% static %} links to the hashed names even with
+DEBUG on, and WhiteNoise sends them with "max-age=315360000, public,
+immutable". Under runserver, `whitenoise.runserver_nostatic` hands static
+files to WhiteNoise, which finds the hashed copies in STATIC_ROOT. After
+editing an asset, run collectstatic again; deleting STATIC_ROOT goes back
+to the plain names, which is also what a fresh checkout uses.
+
+Vendored stylesheets such as plugin.css refer to images that were never
+shipped. Those references are left as they are, with a warning, rather
+than failing the whole build.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+from whitenoise.storage import CompressedManifestStaticFilesStorage as BaseStorage
+
+logger = logging.getLogger(__name__)
+
+ENCODINGS = ('gz', 'br')
+
+
+class CompressedManifestStaticFilesStorage(BaseStorage):
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def url(self, name, force=False):
+        # Django only hashes URLs with DEBUG off; use the manifest whenever
+        # there is one
+        return super().url(name, force=force or bool(self.hashed_files))
+
+    def url_converter(self, name, hashed_files, template=None):
+        converter = super().url_converter(name, hashed_files, template)
+
+        def convert(matchobj):
+            try:
+                return converter(matchobj)
+            except ValueError as exc:
+                logger.warning('Leaving reference in %s unhashed: %s', name, exc)
+                return matchobj['matched']
+        return convert
+
+
+def compression_report(root=None):
+    """Per hashed asset in STATIC_ROOT: (name, size, {encoding: size}).
+
+    Sorted by bytes saved, largest first.
+    """
+    root = str(root or settings.STATIC_ROOT)
+    storage = CompressedManifestStaticFilesStorage(location=root)
+    rows = []
+    for name in sorted(set(storage.hashed_files.values())):
+        path = os.path.join(root, name)
+        if not os.path.exists(path):
+            continue
+        encoded = {}
+        for encoding in ENCODINGS:
+            if os.path.exists(f'{path}.{encoding}'):
+                encoded[encoding] = os.path.getsize(f'{path}.{encoding}')
+        rows.append((name, os.path.getsize(path), encoded))
+    rows.sort(key=lambda row: bytes_saved(row[1], row[2]), reverse=True)
+    return rows
+
+
+def bytes_saved(size, encoded):
+    """Bytes saved by the smallest encoding, 0 when nothing was compressed"""
+    return size - min(encoded.values(), default=size)
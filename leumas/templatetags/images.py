@@ -0,0 +1,56 @@
+from django import template
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models.fields.files import FieldFile
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+from leumas.images import get_manifest, negotiate_format
+
+register = template.Library()
+
+
+def _resolve(image, variants):
+    """Return (fallback url, variant entry or None, url builder) for `image`"""
+    if isinstance(image, FieldFile):
+        if variants is None:
+            variants = getattr(image.instance, f'{image.field.name}_variants', None)
+        return image.url, variants or None, image.storage.url
+    image = str(image)
+    if image.startswith(('http://', 'https://')):
+        return image, variants or None, default_storage.url
+    if image.startswith('/'):
+        # Paths like '/static/images/work/1.jpg' from the static catalogues
+        if not image.startswith(settings.STATIC_URL):
+            return image, variants or None, default_storage.url
+        image = image[len(settings.STATIC_URL):]
+    return static(image), variants or get_manifest().get(image), static
+
+
+@register.simple_tag(takes_context=True)
+def responsive_image(context, image, alt='', sizes='100vw', variants=None, **attrs):
+    """Render an <img> with a srcset in the best format the client accepts.
+
+    `image` is a static path, a '/static/...' URL or an image field. Static
+    images are looked up in the build_image_variants manifest; uploads carry
+    their variants on the model. Without variants a plain <img> is rendered.
+    Extra keyword arguments become attributes, with '_' spelled '-'.
+    Pages using this tag must vary on Accept, which versioned_cache_page does.
+    """
+    src, entry, url = _resolve(image, variants)
+    attrs = {name.replace('_', '-'): value for name, value in attrs.items()}
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+    if not entry:
+        return format_html('<img src="{}" alt="{}"{}>', src, alt, flatatt(attrs))
+
+    formats = entry['formats']
+    name = negotiate_format(context.get('request'))
+    if name not in formats:
+        name = next(name for name in formats if name in ('jpeg', 'png'))
+    srcset = ', '.join(f'{url(path)} {width}w' for width, path in formats[name])
+    return format_html(
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" alt="{}"{}>',
+        url(formats[name][-1][1]), srcset, sizes, entry['width'], entry['height'], alt, flatatt(attrs)
+    )
@@ -1,9 +1,61 @@
-from django.test import TestCase, override_settings
+import importlib
+import json
+import os
+import shutil
+import smtplib
+import subprocess
+import sys
+import tempfile
+import threading
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from .cache import bump_version, cached, deploy_version, page_cache_key
+from .checks import check_shared_cache
 from .forms import ContactForm
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from .models import BlogPost, Portfolio, Service, Skill, Tag, Newsletter, Contact
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from .renderers import ORJSONParser, ORJSONRenderer
+from .contact_buffer import flush_contact_submissions
+from .broadcast import BroadcastInterrupted, Sender, render_broadcast, send_broadcast
+from .images import build_static_variants, get_manifest
+from .export import export_site
+from .metrics import render_latest
+from .newsletter import import_subscribers
+from .storage import CompressedManifestStaticFilesStorage, bytes_saved, compression_report
+from PIL import Image as PILImage
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY
+from .outbox import send_queued_emails
+from .view_counts import flush_view_counts, record_view
+from .search import get_backend
+from .serializers import BlogPostDetailSerializer
+from .sitemaps import BlogPostSitemap
+from .views.cv import build_cv
+from .views.data import PORTFOLIO_PROJECTS, SERVICES
+from .models import BlogPost, Broadcast, OutboxEmail, Portfolio, RelatedPost, Service, Skill, Tag, Newsletter, Contact
 
 
 class ContactFormTests(TestCase):
@@ -34,6 +86,9 @@ class ContactFormTests(TestCase):
 		# Clear outbox then send
 		mail.outbox = []
 		form.send()
+		# Emails are queued during the request and sent by the outbox worker
+		self.assertEqual(len(mail.outbox), 0)
+		self.assertEqual(send_queued_emails(), (2, 0))
 		# Two emails should have been sent: owner notification + sender confirmation
 		self.assertEqual(len(mail.outbox), 2)
 		# First email sent to owner (RECIPIENT_ADDRESS)
@@ -46,6 +101,632 @@ class ContactFormTests(TestCase):
 		self.assertEqual(confirm_email.from_email, 'sender@example.com')
 
 
+class FailingEmailBackend(BaseEmailBackend):
+	"""Email backend standing in for an SMTP server that rejects everything"""
+
+	def send_messages(self, email_messages):
+		raise ConnectionError('SMTP unavailable')
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OutboxTests(TestCase):
+	"""Test cases for the email outbox worker"""
+
+	def _queue(self, count):
+		for i in range(count):
+			OutboxEmail.objects.create(subject=f"Mail {i}", body="Body", to=[f"user{i}@example.com"])
+
+	def test_batch_reuses_one_connection(self):
+		"""A whole batch goes out over a single backend connection"""
+		self._queue(3)
+		with mock.patch('leumas.outbox.get_connection', wraps=mail.get_connection) as get_connection:
+			self.assertEqual(send_queued_emails(), (3, 0))
+		get_connection.assert_called_once()
+		self.assertEqual(len(mail.outbox), 3)
+		self.assertFalse(OutboxEmail.objects.filter(status=OutboxEmail.STATUS_PENDING).exists())
+
+	@override_settings(EMAIL_BACKEND='leumas.tests.FailingEmailBackend', OUTBOX_MAX_ATTEMPTS=2)
+	def test_failures_back_off_then_give_up(self):
+		"""Failed sends are retried later and eventually marked failed"""
+		self._queue(1)
+		self.assertEqual(send_queued_emails(), (0, 1))
+		email = OutboxEmail.objects.get()
+		self.assertEqual(email.status, OutboxEmail.STATUS_PENDING)
+		self.assertGreater(email.next_attempt_at, timezone.now())
+		# Not due yet, so the next run skips it
+		self.assertEqual(send_queued_emails(), (0, 0))
+
+		OutboxEmail.objects.update(next_attempt_at=timezone.now())
+		send_queued_emails()
+		email.refresh_from_db()
+		self.assertEqual(email.status, OutboxEmail.STATUS_FAILED)
+		self.assertIn('SMTP unavailable', email.last_error)
+
+	def test_send_outbox_command_drains_queue(self):
+		"""The worker command drains every due email with --once"""
+		self._queue(5)
+		call_command('send_outbox', '--once', '--batch-size', '2', stdout=StringIO())
+		self.assertEqual(len(mail.outbox), 5)
+
+	def test_newsletter_subscription_is_queued(self):
+		"""Subscribing answers without sending email in the request"""
+		response = self.client.post('/subscribe-newsletter/', {'email': 'queued@example.com'})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(len(mail.outbox), 0)
+		self.assertTrue(OutboxEmail.objects.filter(to=['queued@example.com']).exists())
+
+	def test_repeat_subscription_is_not_confirmed_twice(self):
+		"""Only new or reactivated subscribers get a confirmation"""
+		self.client.post('/subscribe-newsletter/', {'email': 'twice@example.com'})
+		response = self.client.post('/subscribe-newsletter/', {'email': 'twice@example.com'})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(OutboxEmail.objects.filter(to=['twice@example.com']).count(), 1)
+
+
+@override_settings(CONTACT_FLUSH_IN_BACKGROUND=False)
+class ContactSubmissionTests(TestCase):
+	"""Test cases for buffered contact form persistence"""
+
+	data = {
+		'name': 'Carol',
+		'email': 'carol@example.com',
+		'inquiry': 'Project',
+		'message': 'Let us talk.'
+	}
+
+	def setUp(self):
+		cache.clear()
+
+	def tearDown(self):
+		# Drain the buffer so nothing is left for the shutdown flush
+		flush_contact_submissions()
+
+	def _worker_cache(self, location):
+		"""An empty cache private to one simulated worker"""
+		worker_cache = LocMemCache(f'leumas-contact-{location}', {})
+		worker_cache.clear()
+		return worker_cache
+
+	def test_submission_costs_no_database_write(self):
+		"""The request only buffers the submission"""
+		with CaptureQueriesContext(connection) as queries:
+			response = self.client.post('/contact', self.data)
+		self.assertRedirects(response, '/success/', fetch_redirect_response=False)
+		self.assertFalse(any(query['sql'].startswith('INSERT') for query in queries))
+
+	def test_flush_saves_contact_and_queues_emails(self):
+		"""Flushing bulk-creates the Contact row and both outbox emails"""
+		self.client.post('/contact', self.data)
+		self.assertEqual(flush_contact_submissions(), 1)
+		contact = Contact.objects.get()
+		self.assertEqual(contact.email, 'carol@example.com')
+		self.assertEqual(len(contact.submission_hash), 64)
+		self.assertEqual(OutboxEmail.objects.count(), 2)
+
+	def test_double_click_is_saved_once(self):
+		"""An identical re-send within the dedup window is dropped"""
+		self.client.post('/contact', self.data)
+		self.client.post('/contact', self.data)
+		flush_contact_submissions()
+		self.assertEqual(Contact.objects.count(), 1)
+
+	def test_double_click_on_two_workers_is_saved_once(self):
+		"""Workers with private caches both buffer a re-send; one row is saved"""
+		for location in ('worker-a', 'worker-b'):
+			with mock.patch('leumas.contact_buffer.cache', self._worker_cache(location)):
+				self.client.post('/contact', self.data)
+		self.assertEqual(flush_contact_submissions(), 1)
+		self.assertEqual(Contact.objects.count(), 1)
+		self.assertEqual(OutboxEmail.objects.count(), 2)
+
+	def test_resend_after_flush_is_dropped(self):
+		"""A re-send reaching another worker after the first was saved is dropped"""
+		with mock.patch('leumas.contact_buffer.cache', self._worker_cache('worker-a')):
+			self.client.post('/contact', self.data)
+			flush_contact_submissions()
+		with mock.patch('leumas.contact_buffer.cache', self._worker_cache('worker-b')):
+			self.client.post('/contact', self.data)
+			self.assertEqual(flush_contact_submissions(), 0)
+		self.assertEqual(Contact.objects.count(), 1)
+
+	def test_lost_race_queues_no_emails(self):
+		"""A flush beaten to the insert by another worker sends nothing"""
+		with mock.patch('leumas.contact_buffer.cache', self._worker_cache('worker-a')):
+			self.client.post('/contact', self.data)
+			flush_contact_submissions()
+		other = dict(self.data, email='dave@example.com')
+		with mock.patch('leumas.contact_buffer.cache', self._worker_cache('worker-b')):
+			self.client.post('/contact', self.data)
+			self.client.post('/contact', other)
+			# Worker A commits after worker B checked for saved rows
+			with mock.patch('leumas.contact_buffer._saved_submissions', return_value=set()):
+				self.assertEqual(flush_contact_submissions(), 1)
+		self.assertEqual(Contact.objects.count(), 2)
+		self.assertEqual(OutboxEmail.objects.filter(to=['carol@example.com']).count(), 1)
+		self.assertEqual(OutboxEmail.objects.count(), 4)
+
+
+class SeedBlogPostsTests(TestCase):
+	"""Test cases for the migration that seeds the former hard-coded posts"""
+
+	def setUp(self):
+		cache.clear()
+
+	def _seed(self):
+		migration = importlib.import_module('leumas.migrations.0003_seed_blog_posts')
+		migration.seed_blog_posts(django_apps, SimpleNamespace(connection=connection))
+
+	def test_seeded_posts_keep_their_urls_and_images(self):
+		"""Post 7 is still at /blog/7/ with the image it always had"""
+		post = BlogPost.objects.get(pk=7)
+		self.assertEqual(post.slug, 'devops-culture-tools-and-practices')
+		self.assertContains(self.client.get('/blog/7/'), 'blog/img3')
+
+	def test_seeding_a_populated_database(self):
+		"""Missing posts are added; existing rows and ids are left alone"""
+		BlogPost.objects.filter(pk__in=[2, 5]).delete()
+		BlogPost.objects.create(id=5, title="Own Post", slug="own-post", category="Mine", excerpt="Mine", content="Mine")
+		self._seed()
+		self.assertEqual(BlogPost.objects.get(pk=2).slug, 'gitlab-cicd-pipelines-from-zero-to-hero')
+		self.assertEqual(BlogPost.objects.get(pk=5).slug, 'own-post')
+		moved = BlogPost.objects.get(slug='observability-monitoring-logging-and-tracing')
+		self.assertNotIn(moved.pk, range(1, 15))
+		self.assertEqual(BlogPost.objects.count(), 15)
+
+
+class BlogPageCacheTests(TestCase):
+	"""Test cases for the cached, model-backed blog pages"""
+
+	def setUp(self):
+		cache.clear()
+		self.post = BlogPost.objects.create(
+			title="Cached Post",
+			slug="cached-post",
+			category="Testing",
+			excerpt="Cached excerpt",
+			content="<p>Cached body</p>"
+		)
+
+	def test_listing_reads_from_model(self):
+		"""Posts created in the database show up on the listing page"""
+		response = self.client.get('/blogs')
+		self.assertContains(response, "Cached Post")
+
+	def test_warm_listing_runs_no_queries(self):
+		"""A warm cache serves the listing without touching the database"""
+		self.client.get('/blogs')
+		with self.assertNumQueries(0):
+			self.client.get('/blogs')
+
+	def test_save_invalidates_listing(self):
+		"""Saving a post drops the cached listing"""
+		self.client.get('/blogs')
+		self.post.title = "Renamed Post"
+		self.post.save()
+		self.assertContains(self.client.get('/blogs'), "Renamed Post")
+
+	def test_delete_invalidates_detail(self):
+		"""Deleting a post removes it from the detail page"""
+		url = f'/blog/{self.post.id}/'
+		self.assertContains(self.client.get(url), "Cached body")
+		self.post.delete()
+		self.assertNotContains(self.client.get(url), "Cached body")
+
+
+class PageCacheTests(TestCase):
+	"""Test cases for the versioned full-page cache"""
+
+	def setUp(self):
+		cache.clear()
+		self.post = BlogPost.objects.create(
+			title="Original Title",
+			slug="page-cache-post",
+			category="Testing",
+			excerpt="Excerpt",
+			content="Body"
+		)
+
+	def _rename_without_signals(self, title):
+		BlogPost.objects.filter(pk=self.post.pk).update(title=title)
+
+	def test_page_is_served_from_cache(self):
+		"""A cached page is returned even if rows change behind its back"""
+		self.client.get('/blogs')
+		self._rename_without_signals("Silent Rename")
+		self.assertContains(self.client.get('/blogs'), "Original Title")
+
+	def test_unrelated_save_keeps_page(self):
+		"""Saving a portfolio project does not evict blog pages"""
+		self.client.get('/blogs')
+		self._rename_without_signals("Silent Rename")
+		Portfolio.objects.create(title="Project", slug="project", category="Web", image="portfolio/p.jpg", description="Project")
+		self.assertContains(self.client.get('/blogs'), "Original Title")
+
+	def test_related_save_evicts_page(self):
+		"""Saving a blog post evicts the blog pages"""
+		self.client.get('/blogs')
+		self.post.title = "Saved Title"
+		self.post.save()
+		self.assertContains(self.client.get('/blogs'), "Saved Title")
+
+	def test_data_pages_ignore_model_saves(self):
+		"""Service and portfolio pages show views/data.py, not the model rows"""
+		self.client.get('/services')
+		with mock.patch('leumas.views.services.SERVICES', {}):
+			Service.objects.create(title="Row", slug="row", description="Row", icon="fa-row")
+			self.assertContains(self.client.get('/services'), 'Cloud Infrastructure')
+
+	def test_data_version_is_part_of_the_key(self):
+		request = RequestFactory().get('/services')
+		self.assertNotEqual(
+			page_cache_key(request, (), ('a',)),
+			page_cache_key(request, (), ('b',)),
+		)
+
+	def test_cached_page_gets_fresh_csrf_token(self):
+		"""The CSRF placeholder never leaks to visitors"""
+		self.client.get('/blogs')
+		response = self.client.get('/blogs')
+		self.assertContains(response, 'name="csrfmiddlewaretoken"')
+		self.assertNotContains(response, '__leumas_csrf_token__')
+
+
+class SharedCacheTests(TestCase):
+	"""Test cases for content versions across worker processes"""
+
+	def test_bump_reaches_other_workers(self):
+		"""A save in one worker invalidates what another worker cached"""
+		# Each worker has its own client; both talk to the same store
+		workers = [LocMemCache('leumas-shared-test', {}) for _ in range(2)]
+		workers[0].clear()
+		with mock.patch('leumas.cache.cache', workers[0]):
+			self.assertEqual(cached('blog', 'title', lambda: 'Old'), 'Old')
+		with mock.patch('leumas.cache.cache', workers[1]):
+			self.assertEqual(cached('blog', 'title', lambda: 'Stale'), 'Old')
+			bump_version('blog')
+		with mock.patch('leumas.cache.cache', workers[0]):
+			self.assertEqual(cached('blog', 'title', lambda: 'New'), 'New')
+
+	def test_deploy_check_warns_about_local_cache(self):
+		"""check --deploy flags a cache that each process keeps to itself"""
+		local = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+		shared = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://redis:6379/0'}}
+		with override_settings(CACHES=local):
+			self.assertEqual([w.id for w in check_shared_cache(None)], ['leumas.W001'])
+		with override_settings(CACHES=shared):
+			self.assertEqual(check_shared_cache(None), [])
+
+
+class IndexFragmentCacheTests(TestCase):
+	"""Test cases for the fragment-cached sections of index.html"""
+
+	def setUp(self):
+		cache.clear()
+		self.post = BlogPost.objects.create(
+			title="Fragment Title", slug="fragment-post", category="Testing",
+			excerpt="Excerpt", content="Body", is_published=True
+		)
+
+	def test_views_share_fragments(self):
+		"""Sections rendered for the home page are reused by the contact page"""
+		self.client.get('/')
+		BlogPost.objects.filter(pk=self.post.pk).update(title="Silent Rename")
+		with mock.patch('leumas.views.home.get_published_preview_posts') as preview:
+			response = self.client.get('/contact')
+		preview.assert_not_called()
+		self.assertContains(response, "Fragment Title")
+		self.assertContains(response, "const scrollTo = 'contact'")
+
+	def test_blog_save_refreshes_blog_fragment(self):
+		self.client.get('/contact')
+		self.post.title = "Saved Title"
+		self.post.save()
+		self.assertContains(self.client.get('/contact'), "Saved Title")
+
+	def test_deploy_refreshes_fragments(self):
+		"""Fragments outlive deploys in the shared cache, so their keys carry the deploy version"""
+		self.client.get('/contact')
+		# A deploy that renames an asset, as collectstatic does on content changes
+		renamed = classmethod(lambda cls, path: f'/static/next/{path}')
+		with mock.patch('django.templatetags.static.StaticNode.handle_simple', renamed):
+			self.assertNotContains(self.client.get('/contact'), '/static/next/images/icon/024-server.png')
+			with mock.patch('leumas.views.home.deploy_version', return_value='next-deploy'):
+				self.assertContains(self.client.get('/contact'), '/static/next/images/icon/024-server.png')
+
+	def test_deploy_version_follows_templates_with_debug(self):
+		with override_settings(DEBUG=True), mock.patch('leumas.cache.site_digest', return_value='abc'):
+			self.assertEqual(deploy_version(), 'abc')
+
+	def test_image_format_varies_fragments(self):
+		"""A fragment with WebP srcsets is never served to other clients"""
+		tmp = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, tmp)
+		manifest = Path(tmp) / 'manifest.json'
+		manifest.write_text(json.dumps({'images/about.jpg': {'width': 320, 'height': 320, 'formats': {
+			'webp': [[320, 'images/variants/about-320.webp']],
+			'jpeg': [[320, 'images/variants/about-320.jpg']],
+		}}}))
+		get_manifest.cache_clear()
+		self.addCleanup(get_manifest.cache_clear)
+		with override_settings(IMAGE_VARIANTS_MANIFEST=manifest):
+			webp = self.client.get('/contact', HTTP_ACCEPT='image/webp,*/*')
+			plain = self.client.get('/contact', HTTP_ACCEPT='text/html')
+		self.assertContains(webp, 'about-320.webp')
+		self.assertNotContains(plain, 'about-320.webp')
+		self.assertContains(plain, 'about-320.jpg')
+
+
+class ExportSiteTests(TestCase):
+	"""Test cases for the incremental static export"""
+
+	def setUp(self):
+		cache.clear()
+		self.tmp = Path(tempfile.mkdtemp())
+		self.addCleanup(shutil.rmtree, self.tmp)
+		(self.tmp / 'static' / 'css').mkdir(parents=True)
+		(self.tmp / 'static' / 'staticfiles.json').write_text('{"paths": {}, "version": "1.1"}')
+		(self.tmp / 'static' / 'css' / 'site.css').write_text('body {}')
+		override = override_settings(STATIC_ROOT=self.tmp / 'static', MEDIA_ROOT=self.tmp / 'media')
+		override.enable()
+		self.addCleanup(override.disable)
+		self.output = self.tmp / 'site'
+		self.post = BlogPost.objects.create(
+			title="Exported Post", slug="exported-post", category="Testing",
+			excerpt="Excerpt", content="Body", is_published=True
+		)
+		self.published = BlogPost.objects.filter(is_published=True).count()
+		self.pages = 6 + len(SERVICES) + len(PORTFOLIO_PROJECTS) + self.published
+
+	def test_first_export_renders_every_page(self):
+		counts = export_site(self.output)
+		self.assertEqual((counts['rendered'], counts['unchanged'], counts['static']), (self.pages, 0, 2))
+		self.assertIn(b'Exported Post', (self.output / f'blog/{self.post.pk}/index.html').read_bytes())
+		self.assertTrue((self.output / 'about.html').exists())
+		self.assertTrue((self.output / 'static' / 'css' / 'site.css').exists())
+
+	def test_pages_use_images_every_browser_shows(self):
+		"""The static copy is served to every client, so it has no WebP or AVIF srcsets"""
+		manifest = self.tmp / 'manifest.json'
+		manifest.write_text(json.dumps({'images/about.jpg': {'width': 320, 'height': 320, 'formats': {
+			'webp': [[320, 'images/variants/about-320.webp']],
+			'jpeg': [[320, 'images/variants/about-320.jpg']],
+		}}}))
+		get_manifest.cache_clear()
+		self.addCleanup(get_manifest.cache_clear)
+		with override_settings(IMAGE_VARIANTS_MANIFEST=manifest):
+			export_site(self.output)
+		index = (self.output / 'index.html').read_bytes()
+		self.assertIn(b'about-320.jpg', index)
+		self.assertNotIn(b'.webp', index)
+
+	def test_post_forms_link_to_contact_page(self):
+		"""A static page cannot issue a CSRF token, so its forms would always get a 403"""
+		export_site(self.output)
+		for page in ['index.html', 'services.html', 'blogs.html', 'works.html', f'blog/{self.post.pk}/index.html']:
+			content = (self.output / page).read_bytes()
+			self.assertNotIn(b'name="csrfmiddlewaretoken"', content)
+			self.assertNotIn(b'id="newsletter-form"', content)
+			self.assertIn(b'href="/contact">Get in touch</a>', content)
+
+	def test_unchanged_inputs_are_not_rendered(self):
+		export_site(self.output)
+		counts = export_site(self.output)
+		self.assertEqual((counts['rendered'], counts['unchanged'], counts['static']), (0, self.pages, 0))
+
+	def test_blog_edit_renders_only_blog_pages(self):
+		export_site(self.output)
+		self.post.title = "Edited Post"
+		self.post.save()
+		counts = export_site(self.output)
+		# index, about, blog, blogs and the posts, which link to each other
+		self.assertEqual(counts['rendered'], 4 + self.published)
+		self.assertEqual(counts['unchanged'], len(SERVICES) + len(PORTFOLIO_PROJECTS) + 2)
+		self.assertIn(b'Edited Post', (self.output / 'blogs.html').read_bytes())
+
+	def test_unpublished_posts_are_removed(self):
+		export_site(self.output)
+		self.post.is_published = False
+		self.post.save()
+		self.assertEqual(export_site(self.output)['removed'], 1)
+		self.assertFalse((self.output / f'blog/{self.post.pk}/index.html').exists())
+
+
+class SitemapTests(TestCase):
+	"""Test cases for the generated, cached sitemap.xml"""
+
+	def setUp(self):
+		cache.clear()
+		self.post = BlogPost.objects.create(
+			title="Mapped Post", slug="mapped-post", category="Testing",
+			excerpt="Excerpt", content="Body", is_published=True
+		)
+
+	def test_sitemap_lists_content(self):
+		response = self.client.get('/sitemap.xml')
+		self.assertEqual(response['Content-Type'], 'application/xml')
+		self.assertContains(response, f'<loc>http://testserver/blog/{self.post.pk}/</loc>')
+		self.assertContains(response, f'<lastmod>{self.post.updated_date.date().isoformat()}</lastmod>')
+		self.assertContains(response, '<loc>http://testserver/portfolio/1/</loc>')
+		self.assertContains(response, f'<loc>http://testserver/service/{max(SERVICES)}/</loc>')
+		self.assertNotContains(response, '/portfolio</loc>')
+
+	def test_data_sections_list_only_rendered_ids(self):
+		"""Detail views only render data.py ids, so other rows are not listed"""
+		Portfolio.objects.create(
+			id=max(PORTFOLIO_PROJECTS) + 1, title="Row Only", slug="row-only", category="Web",
+			image="portfolio/p.jpg", description="Project"
+		)
+		response = self.client.get('/sitemap-portfolio.xml')
+		self.assertEqual(response.content.count(b'<url>'), len(PORTFOLIO_PROJECTS))
+		self.assertNotContains(response, f'/portfolio/{max(PORTFOLIO_PROJECTS) + 1}/</loc>')
+		self.assertNotContains(response, '<lastmod>')
+
+	def test_sitemap_is_cached_until_content_changes(self):
+		self.client.get('/sitemap.xml')
+		with self.assertNumQueries(0):
+			self.client.get('/sitemap.xml')
+		later = BlogPost.objects.create(
+			title="Later Post", slug="later-post", category="Testing",
+			excerpt="Excerpt", content="Body", is_published=True
+		)
+		self.assertContains(self.client.get('/sitemap.xml'), f'/blog/{later.pk}/</loc>')
+
+	def test_etag_revalidation(self):
+		response = self.client.get('/sitemap.xml')
+		self.assertEqual(self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+		# A title change leaves the sitemap's bytes, and so its ETag, alone
+		self.post.title = "Renamed"
+		self.post.save()
+		self.assertEqual(self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+		self.post.is_published = False
+		self.post.save()
+		self.assertEqual(self.client.get('/sitemap.xml', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+	def test_large_sitemaps_are_split_into_an_index(self):
+		published = BlogPost.objects.filter(is_published=True).count()
+		with mock.patch.object(BlogPostSitemap, 'limit', 2):
+			index = self.client.get('/sitemap.xml')
+			self.assertContains(index, '<sitemapindex')
+			self.assertContains(index, f'http://testserver/sitemap-blog.xml?p={(published + 1) // 2}')
+			page = self.client.get('/sitemap-blog.xml', {'p': 2})
+		self.assertEqual(page.content.count(b'<url>'), 2)
+		self.assertEqual(self.client.get('/sitemap-missing.xml').status_code, 404)
+
+
+class BlogFeedTests(TestCase):
+	"""Test cases for the cached RSS and Atom feeds"""
+
+	def setUp(self):
+		cache.clear()
+		self.post = BlogPost.objects.create(
+			title="Feed Post", slug="feed-post", category="Testing",
+			excerpt="Feed excerpt", content="<p>Feed body</p>", is_published=True
+		)
+		BlogPost.objects.filter(pk=self.post.pk).update(published_date=timezone.now() + timedelta(days=1))
+
+	def test_rss_lists_newest_posts(self):
+		response = self.client.get('/blog/rss.xml', {'limit': 1})
+		self.assertEqual(response['Content-Type'], 'application/rss+xml; charset=utf-8')
+		self.assertEqual(response.content.count(b'<item>'), 1)
+		self.assertContains(response, '<title>Feed Post</title>')
+		self.assertContains(response, '<description>Feed excerpt</description>')
+		self.assertNotContains(response, 'content:encoded>')
+
+	def test_content_is_optional(self):
+		rss = self.client.get('/blog/rss.xml', {'limit': 1, 'content': 1})
+		self.assertContains(rss, '<content:encoded>&lt;p&gt;Feed body&lt;/p&gt;</content:encoded>')
+		atom = self.client.get('/blog/atom.xml', {'limit': 1, 'content': 1})
+		self.assertContains(atom, '<content type="html">&lt;p&gt;Feed body&lt;/p&gt;</content>')
+
+	@override_settings(FEED_MAX_ITEMS=2)
+	def test_limit_is_capped(self):
+		response = self.client.get('/blog/atom.xml', {'limit': 1000})
+		self.assertEqual(response.content.count(b'<entry>'), 2)
+
+	def test_polling_is_answered_from_cache(self):
+		response = self.client.get('/blog/rss.xml')
+		with self.assertNumQueries(0):
+			etag = self.client.get('/blog/rss.xml', HTTP_IF_NONE_MATCH=response['ETag'])
+			since = self.client.get('/blog/rss.xml', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+		self.assertEqual((etag.status_code, since.status_code), (304, 304))
+		self.post.title = "Edited Feed Post"
+		self.post.save()
+		response = self.client.get('/blog/rss.xml', HTTP_IF_NONE_MATCH=response['ETag'])
+		self.assertContains(response, 'Edited Feed Post')
+
+
+class MetricsTests(TestCase):
+	"""Test cases for the Prometheus middleware and /metrics"""
+
+	def setUp(self):
+		cache.clear()
+
+	def sample(self, name, **labels):
+		return REGISTRY.get_sample_value(name, labels) or 0
+
+	def test_requests_are_recorded_per_url_name(self):
+		view = {'view': 'leumas:leumas-blogs'}
+		before = self.sample('leumas_http_request_duration_seconds_count', method='GET', **view)
+		hits = self.sample('leumas_cache_requests_total', cache='page', result='hit')
+		self.client.get('/blogs')
+		self.client.get('/blogs')
+		self.assertEqual(self.sample('leumas_http_request_duration_seconds_count', method='GET', **view), before + 2)
+		self.assertGreaterEqual(self.sample('leumas_http_responses_total', method='GET', status='200', **view), 2)
+		self.assertGreater(self.sample('leumas_http_response_size_bytes_sum', **view), 0)
+		self.assertEqual(self.sample('leumas_cache_requests_total', cache='page', result='hit'), hits + 1)
+
+	def test_database_queries_are_counted(self):
+		view = {'view': 'leumas:api-blogs-list'}
+		before = self.sample('leumas_db_queries_per_request_sum', **view)
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get('/api/blogs/')
+		self.assertEqual(self.sample('leumas_db_queries_per_request_sum', **view), before + len(queries))
+
+	def test_unmatched_urls_share_a_label(self):
+		before = self.sample('leumas_http_responses_total', view='unmatched', method='GET', status='404')
+		self.client.get('/no-such-page-1')
+		self.client.get('/no-such-page-2')
+		self.assertEqual(self.sample('leumas_http_responses_total', view='unmatched', method='GET', status='404'), before + 2)
+
+	def test_metrics_endpoint(self):
+		self.client.get('/blogs')
+		response = self.client.get('/metrics')
+		self.assertEqual(response['Content-Type'], CONTENT_TYPE_LATEST)
+		self.assertContains(response, 'leumas_http_request_duration_seconds_bucket{')
+		self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.0.8').status_code, 404)
+
+	def test_workers_are_aggregated(self):
+		"""Values written by separate processes are summed by /metrics"""
+		directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, directory)
+		env = {**os.environ, 'PROMETHEUS_MULTIPROC_DIR': directory}
+		script = "from leumas import metrics; metrics.observe_request('worker', 'GET', 200, 0.01, 10, 1, 0.001)"
+		for _ in range(2):
+			subprocess.run([sys.executable, '-c', script], env=env, check=True, cwd=settings.BASE_DIR)
+		with mock.patch.dict(os.environ, {'PROMETHEUS_MULTIPROC_DIR': directory}):
+			body, _ = render_latest()
+		self.assertIn(b'leumas_http_responses_total{method="GET",status="200",view="worker"} 2.0', body)
+
+
+class CVDownloadTests(TestCase):
+	"""Test cases for the cached CV download"""
+
+	def setUp(self):
+		cache_dir = tempfile.TemporaryDirectory()
+		self.addCleanup(cache_dir.cleanup)
+		settings_override = override_settings(CV_CACHE_DIR=cache_dir.name)
+		settings_override.enable()
+		self.addCleanup(settings_override.disable)
+
+	def test_download_sends_pdf_with_validators(self):
+		"""The PDF is served as an attachment with ETag and Last-Modified"""
+		response = self.client.get('/download-cv/')
+		self.assertEqual(response.status_code, 200)
+		self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+		self.assertIn('attachment', response['Content-Disposition'])
+		self.assertTrue(response.has_header('ETag'))
+		self.assertTrue(response.has_header('Last-Modified'))
+
+	def test_revalidation_returns_not_modified(self):
+		"""A matching If-None-Match gets a 304"""
+		etag = self.client.get('/download-cv/')['ETag']
+		response = self.client.get('/download-cv/', HTTP_IF_NONE_MATCH=etag)
+		self.assertEqual(response.status_code, 304)
+
+	def test_pdf_is_rendered_once_per_version(self):
+		"""Later downloads reuse the file built by the build_cv command"""
+		call_command('build_cv', stdout=StringIO())
+		with mock.patch('leumas.views.cv.render_cv_pdf') as render:
+			self.client.get('/download-cv/')
+		render.assert_not_called()
+
+	def test_failed_render_leaves_no_temp_file(self):
+		with mock.patch('leumas.views.cv.render_cv_pdf', side_effect=RuntimeError):
+			with self.assertRaises(RuntimeError):
+				build_cv()
+		self.assertEqual(list(Path(settings.CV_CACHE_DIR).iterdir()), [])
+
+
 class BlogPostModelTest(TestCase):
 	"""Test cases for BlogPost model"""
 
@@ -88,6 +769,23 @@ class BlogPostModelTest(TestCase):
 		# 500 / 200 = 2.5 → 2 minutes
 		self.assertEqual(reading_time, 2)
 
+	def test_reading_stats_stored_on_save(self):
+		"""Word count and reading time are stored columns"""
+		self.assertEqual(self.blog1.word_count, 500)
+		self.blog1.content = "word " * 1000
+		self.blog1.save(update_fields=['content'])
+		self.blog1.refresh_from_db()
+		self.assertEqual(self.blog1.word_count, 1000)
+		self.assertEqual(self.blog1.reading_time, 5)
+
+	def test_recompute_reading_stats_command(self):
+		"""The management command backfills stale rows in bulk"""
+		BlogPost.objects.filter(pk=self.blog1.pk).update(word_count=0, reading_time=1)
+		call_command('recompute_reading_stats', stdout=StringIO())
+		self.blog1.refresh_from_db()
+		self.assertEqual(self.blog1.word_count, 500)
+		self.assertEqual(self.blog1.reading_time, 2)
+
 	def test_increment_views(self):
 		"""Test view count increment"""
 		initial_views = self.blog1.views_count
@@ -100,6 +798,46 @@ class BlogPostModelTest(TestCase):
 		related = self.blog1.get_related_posts()
 		self.assertIn(self.blog2, related)
 
+	def test_related_posts_ranked_by_shared_tags(self):
+		"""Posts sharing more tags rank first"""
+		tag3 = Tag.objects.create(name="Web", slug="web")
+		blog3 = BlogPost.objects.create(
+			title="Django and Python", slug="django-python", category="Web",
+			excerpt="Both", content="Both"
+		)
+		blog3.tags.add(self.tag1, tag3)
+		self.blog1.tags.add(tag3)
+		related = list(self.blog1.get_related_posts())
+		self.assertEqual(related, [blog3, self.blog2])
+
+	def test_related_posts_follow_tag_removal(self):
+		"""Removing the shared tag drops the relation"""
+		self.blog2.tags.remove(self.tag1)
+		self.assertNotIn(self.blog2, self.blog1.get_related_posts())
+
+	def test_related_posts_skip_unpublished(self):
+		"""Unpublishing a post removes it from other posts' related lists"""
+		self.blog2.is_published = False
+		self.blog2.save()
+		self.assertNotIn(self.blog2, self.blog1.get_related_posts())
+
+	def test_rebuild_related_posts_command(self):
+		"""A full rebuild matches the incrementally maintained index"""
+		expected = set(RelatedPost.objects.values_list('post_id', 'related_id', 'shared_tags'))
+		RelatedPost.objects.all().delete()
+		call_command('rebuild_related_posts', stdout=StringIO())
+		rebuilt = set(RelatedPost.objects.values_list('post_id', 'related_id', 'shared_tags'))
+		self.assertEqual(rebuilt, expected)
+
+	def test_related_posts_migration_matches_rebuild(self):
+		"""Migration 0005 keeps its own copy of the rebuild"""
+		expected = set(RelatedPost.objects.values_list('post_id', 'related_id', 'shared_tags'))
+		RelatedPost.objects.all().delete()
+		migration = importlib.import_module('leumas.migrations.0005_relatedpost')
+		migration.build_related_posts(django_apps, None)
+		rebuilt = set(RelatedPost.objects.values_list('post_id', 'related_id', 'shared_tags'))
+		self.assertEqual(rebuilt, expected)
+
 	def test_blog_slug_unique(self):
 		"""Test that slugs are unique"""
 		with self.assertRaises(Exception):
@@ -116,6 +854,45 @@ class BlogPostModelTest(TestCase):
 		self.assertEqual(str(self.blog1), "Introduction to Django")
 
 
+class ViewCountStressTest(TransactionTestCase):
+	"""Concurrent views must never be lost"""
+
+	THREADS = 8
+	VIEWS_PER_THREAD = 200
+
+	def test_concurrent_views_are_not_lost(self):
+		cache.clear()
+		post = BlogPost.objects.create(
+			title="Popular", slug="popular", category="Testing",
+			excerpt="Excerpt", content="Content"
+		)
+		done = threading.Event()
+
+		def reader():
+			for _ in range(self.VIEWS_PER_THREAD):
+				record_view(post.pk)
+			connection.close()
+
+		def flusher():
+			while not done.is_set():
+				flush_view_counts([post.pk])
+			connection.close()
+
+		flush_thread = threading.Thread(target=flusher)
+		flush_thread.start()
+		threads = [threading.Thread(target=reader) for _ in range(self.THREADS)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		done.set()
+		flush_thread.join()
+
+		flush_view_counts([post.pk])
+		post.refresh_from_db()
+		self.assertEqual(post.views_count, self.THREADS * self.VIEWS_PER_THREAD)
+
+
 class PortfolioModelTest(TestCase):
 	"""Test cases for Portfolio model"""
 
@@ -229,6 +1006,304 @@ class NewsletterModelTest(TestCase):
 			Newsletter.objects.create(email="unique@example.com")
 
 
+class NewsletterImportExportTests(TestCase):
+	"""Test cases for the streaming subscriber CSV import and export"""
+
+	def test_import_skips_invalid_and_known_addresses(self):
+		Newsletter.objects.create(email="known@example.com")
+		with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as csv_file:
+			csv_file.write("name,email\nA,new@example.com\nB,NEW@example.com\nC,Known@Example.com\nD,not-an-email\n")
+		self.addCleanup(os.unlink, csv_file.name)
+		out = StringIO()
+		call_command('import_newsletter', csv_file.name, batch_size=2, stdout=out)
+		self.assertIn('Read 4 rows: 1 subscribed, 2 already known, 1 invalid', out.getvalue())
+		self.assertEqual(
+			sorted(Newsletter.objects.values_list('email', flat=True)),
+			['known@example.com', 'new@example.com']
+		)
+
+	def test_import_is_lazy(self):
+		"""Input is consumed one batch at a time"""
+		consumed = []
+
+		def emails():
+			for i in range(5):
+				consumed.append(i)
+				yield f"lazy{i}@example.com"
+
+		batches = []
+		bulk_create = Newsletter.objects.bulk_create
+
+		def record_batch(objs, **kwargs):
+			batches.append(len(consumed))
+			return bulk_create(objs, **kwargs)
+
+		with mock.patch.object(Newsletter.objects, 'bulk_create', side_effect=record_batch):
+			import_subscribers(emails(), batch_size=2)
+		# Rows read by the time each batch is written
+		self.assertEqual(batches, [2, 4, 5])
+
+	def test_case_insensitive_unique_index(self):
+		Newsletter.objects.create(email="Case@example.com")
+		with self.assertRaises(IntegrityError):
+			Newsletter.objects.create(email="case@EXAMPLE.com")
+
+	def test_export_command(self):
+		Newsletter.objects.create(email="a@example.com")
+		Newsletter.objects.create(email="b@example.com", is_active=False)
+		out = StringIO()
+		call_command('export_newsletter', active_only=True, stdout=out)
+		lines = out.getvalue().splitlines()
+		self.assertEqual(lines[0], 'email,subscribed_at,is_active')
+		self.assertEqual(len(lines), 2)
+		self.assertTrue(lines[1].startswith('a@example.com,'))
+
+	def test_admin_export_action_streams(self):
+		admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+		self.client.force_login(admin)
+		subscriber = Newsletter.objects.create(email="a@example.com")
+		response = self.client.post('/admin/leumas/newsletter/', {
+			'action': 'export_csv', '_selected_action': [subscriber.pk]
+		})
+		self.assertTrue(response.streaming)
+		self.assertEqual(response['Content-Type'], 'text/csv')
+		self.assertIn(b'a@example.com', b''.join(response.streaming_content))
+
+
+@override_settings(BROADCAST_RATE=0)
+class BroadcastTests(TestCase):
+	"""Test cases for batched newsletter broadcasts"""
+
+	def setUp(self):
+		Newsletter.objects.bulk_create([Newsletter(email=f"reader{i}@example.com") for i in range(7)])
+		Newsletter.objects.create(email="gone@example.com", is_active=False)
+		self.broadcast = Broadcast.objects.create(subject="Issue 1", body="<p>Hello &amp; welcome</p>")
+
+	def test_sends_to_each_active_subscriber_once(self):
+		with mock.patch('leumas.broadcast.render_broadcast', wraps=render_broadcast) as render:
+			sent, failed, _ = send_broadcast(self.broadcast, batch_size=3, connections=2)
+		self.assertEqual((sent, failed), (7, 0))
+		self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(f"reader{i}@example.com" for i in range(7)))
+		# Rendered once per batch, not once per recipient
+		self.assertEqual(render.call_count, 3)
+		self.assertIn('Hello & welcome', mail.outbox[0].body)
+		self.broadcast.refresh_from_db()
+		self.assertEqual(self.broadcast.status, Broadcast.STATUS_SENT)
+		self.assertEqual(self.broadcast.sent_count, 7)
+
+	def test_resumes_after_the_checkpoint(self):
+		"""A run interrupted after the first batch continues from there"""
+		first_batch = Newsletter.objects.filter(is_active=True).order_by('pk')[:3]
+		Broadcast.objects.filter(pk=self.broadcast.pk).update(
+			status=Broadcast.STATUS_SENDING, last_subscriber_id=first_batch[2].pk, sent_count=3
+		)
+		self.broadcast.refresh_from_db()
+		sent, _, _ = send_broadcast(self.broadcast, batch_size=3)
+		self.assertEqual(sent, 4)
+		self.assertNotIn(first_batch[0].email, [m.to[0] for m in mail.outbox])
+		self.assertEqual(self.broadcast.sent_count, 7)
+
+	def test_refused_recipients_are_counted(self):
+		refused = smtplib.SMTPRecipientsRefused({'reader@example.com': (550, b'No such user')})
+		with mock.patch('leumas.broadcast.Sender.send', side_effect=refused), \
+				self.assertLogs('leumas.broadcast', 'WARNING'):
+			sent, failed, _ = send_broadcast(self.broadcast)
+		self.assertEqual((sent, failed), (0, 7))
+		self.broadcast.refresh_from_db()
+		self.assertEqual(self.broadcast.failed_count, 7)
+		self.assertEqual(self.broadcast.status, Broadcast.STATUS_SENT)
+
+	def test_outage_stops_without_skipping_recipients(self):
+		"""When every send fails the checkpoint stays put and the run can resume"""
+		with mock.patch('leumas.broadcast.Sender.send', side_effect=ConnectionError('SMTP down')):
+			with self.assertRaises(BroadcastInterrupted):
+				send_broadcast(self.broadcast, batch_size=3, connections=2)
+		self.broadcast.refresh_from_db()
+		self.assertEqual(self.broadcast.status, Broadcast.STATUS_QUEUED)
+		self.assertEqual(self.broadcast.last_subscriber_id, 0)
+		self.assertIsNone(self.broadcast.finished_at)
+
+		with self.assertRaisesMessage(CommandError, 'resumes on the next run'), \
+				mock.patch('leumas.broadcast.Sender.send', side_effect=ConnectionError('SMTP down')):
+			call_command('send_broadcast', stdout=StringIO())
+		call_command('send_broadcast', stdout=StringIO())
+		self.assertEqual(len(mail.outbox), 7)
+		self.broadcast.refresh_from_db()
+		self.assertEqual(self.broadcast.status, Broadcast.STATUS_SENT)
+
+	def test_resumed_batch_skips_recipients_already_reached(self):
+		"""An outage mid-batch keeps who was reached, so resuming sends no duplicates"""
+		send = Sender.send
+
+		def fail_on_reader4(sender, message):
+			if message.to == ['reader4@example.com']:
+				raise ConnectionError('SMTP down')
+			send(sender, message)
+
+		with mock.patch.object(Sender, 'send', autospec=True, side_effect=fail_on_reader4):
+			with self.assertRaises(BroadcastInterrupted):
+				send_broadcast(self.broadcast, batch_size=10, connections=1)
+		self.assertEqual(len(mail.outbox), 4)
+		self.assertEqual(self.broadcast.last_subscriber_id, 0)
+		self.assertEqual(len(self.broadcast.delivered_ids), 4)
+
+		sent, _, _ = send_broadcast(self.broadcast, batch_size=10, connections=1)
+		self.assertEqual(sent, 3)
+		self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(f"reader{i}@example.com" for i in range(7)))
+		self.assertEqual((self.broadcast.sent_count, self.broadcast.delivered_ids), (7, []))
+
+	def test_admin_queues_and_command_sends(self):
+		admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+		self.client.force_login(admin)
+		self.client.post('/admin/leumas/broadcast/', {
+			'action': 'queue_for_sending', '_selected_action': [self.broadcast.pk]
+		})
+		self.assertEqual(len(mail.outbox), 0)
+		out = StringIO()
+		call_command('send_broadcast', stdout=out)
+		self.assertIn('sent 7, failed 0', out.getvalue())
+		self.assertIn('messages/s', out.getvalue())
+		self.assertEqual(len(mail.outbox), 7)
+
+
+class ResponsiveImageTests(TestCase):
+	"""Test cases for the image variant pipeline and the responsive_image tag"""
+
+	def setUp(self):
+		self.tmp = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.tmp)
+		override = override_settings(
+			IMAGE_VARIANTS_DIR=Path(self.tmp) / 'build',
+			IMAGE_VARIANTS_MANIFEST=Path(self.tmp) / 'manifest.json',
+			IMAGE_VARIANT_WIDTHS=[320, 640],
+			MEDIA_ROOT=Path(self.tmp) / 'media',
+		)
+		override.enable()
+		self.addCleanup(override.disable)
+		self.addCleanup(get_manifest.cache_clear)
+		self.source = Path(self.tmp) / 'static'
+		(self.source / 'images' / 'work').mkdir(parents=True)
+		self.photo = self.source / 'images' / 'work' / 'photo.jpg'
+		self.photo.write_bytes(self.image_bytes())
+
+	@staticmethod
+	def image_bytes(size=(800, 400)):
+		buffer = BytesIO()
+		PILImage.new('RGB', size, (200, 80, 40)).save(buffer, 'JPEG')
+		return buffer.getvalue()
+
+	def render(self, source, accept=''):
+		request = RequestFactory().get('/', HTTP_ACCEPT=accept)
+		template = Template("{% load images %}" + source)
+		return template.render(Context({'request': request, 'image': 'images/work/photo.jpg'}))
+
+	def test_build_writes_variants_and_skips_unchanged(self):
+		self.assertEqual(build_static_variants(source_root=self.source), (1, 0))
+		entry = get_manifest()['images/work/photo.jpg']
+		self.assertEqual((entry['width'], entry['height']), (800, 400))
+		self.assertEqual([width for width, _ in entry['formats']['webp']], [320, 640, 800])
+		self.assertTrue((Path(self.tmp) / 'build' / entry['formats']['jpeg'][0][1]).exists())
+		self.assertEqual(build_static_variants(source_root=self.source), (0, 1))
+
+	def test_tag_negotiates_format_from_accept(self):
+		build_static_variants(source_root=self.source)
+		webp = self.render("{% responsive_image image alt='Work' sizes='50vw' %}", 'image/webp,*/*')
+		self.assertIn('photo-320.webp 320w', webp)
+		self.assertIn('width="800" height="400"', webp)
+		self.assertIn('loading="lazy"', webp)
+		self.assertIn('sizes="50vw"', webp)
+		fallback = self.render("{% responsive_image image alt='Work' %}", 'text/html')
+		self.assertIn('photo-800.jpg 800w', fallback)
+		self.assertNotIn('.webp', fallback)
+
+	def test_tag_without_variants_renders_plain_img(self):
+		html = self.render("{% responsive_image '/media/x.jpg' alt='X' data_wow_delay='0.2s' %}")
+		self.assertEqual(html, '<img src="/media/x.jpg" alt="X" data-wow-delay="0.2s" decoding="async" loading="lazy">')
+
+	def test_uploads_are_processed_on_save(self):
+		project = Portfolio.objects.create(
+			title="Upload", slug="upload", category="Web", description="Project",
+			image=SimpleUploadedFile('shot.jpg', self.image_bytes(), content_type='image/jpeg')
+		)
+		project.refresh_from_db()
+		self.assertEqual(project.image_variants['source'], project.image.name)
+		self.assertIn('webp', project.image_variants['formats'])
+
+	def test_cached_pages_vary_on_accept(self):
+		response = self.client.get('/', HTTP_ACCEPT='image/webp')
+		self.assertIn('Accept', response['Vary'])
+
+
+class StaticBuildTests(TestCase):
+	"""Test cases for the hashed, precompressed static files storage"""
+
+	def setUp(self):
+		self.tmp = Path(tempfile.mkdtemp())
+		self.addCleanup(shutil.rmtree, self.tmp)
+		self.source = self.tmp / 'source'
+		(self.source / 'css').mkdir(parents=True)
+		(self.source / 'css' / 'dot.png').write_bytes(b'\x89PNG' + bytes(64))
+		(self.source / 'css' / 'site.css').write_text(
+			'body { background: url("dot.png"); }\n'
+			'.play { background: url("missing.png"); }\n' + '.rule { color: red; }\n' * 200
+		)
+		override = override_settings(STATIC_ROOT=self.tmp / 'static', STATIC_URL='/static/')
+		override.enable()
+		self.addCleanup(override.disable)
+
+	def build(self):
+		storage = CompressedManifestStaticFilesStorage()
+		source = FileSystemStorage(self.source)
+		paths = {name: (source, name) for name in ('css/dot.png', 'css/site.css')}
+		for name in paths:
+			with source.open(name) as content:
+				storage.save(name, content)
+		with self.assertLogs('leumas.storage', 'WARNING') as logs:
+			for name, hashed, processed in storage.post_process(paths):
+				self.assertNotIsInstance(processed, Exception)
+		self.assertIn('missing.png', logs.output[0])
+		return storage
+
+	def test_plain_names_before_collectstatic(self):
+		self.assertEqual(CompressedManifestStaticFilesStorage().url('css/site.css'), '/static/css/site.css')
+
+	def test_build_hashes_compresses_and_reports(self):
+		storage = self.build()
+		hashed = storage.url('css/site.css')
+		self.assertRegex(hashed, r'^/static/css/site\.[0-9a-f]{12}\.css$')
+		name = hashed[len('/static/'):]
+		css = (self.tmp / 'static' / name).read_text()
+		self.assertIn(storage.stored_name('css/dot.png').split('/')[-1], css)
+		self.assertIn('url("missing.png")', css)
+		self.assertTrue((self.tmp / 'static' / f'{name}.gz').exists())
+
+		rows = {row[0]: row for row in compression_report()}
+		size, encoded = rows[name][1:]
+		self.assertLess(encoded['gz'], size)
+		self.assertGreater(bytes_saved(size, encoded), 0)
+
+	def test_hashed_files_are_served_immutable(self):
+		hashed = self.build().url('css/site.css')
+		response = self.client.get(hashed, HTTP_ACCEPT_ENCODING='gzip')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response['Cache-Control'], 'max-age=315360000, public, immutable')
+		self.assertEqual(response['Content-Encoding'], 'gzip')
+
+	@override_settings(DEBUG=True)
+	def test_hashed_files_are_served_immutable_with_debug(self):
+		"""DEBUG still links to the hashed names, served by WhiteNoise rather than runserver"""
+		hashed = self.build().url('css/site.css')
+		self.assertRegex(hashed, r'^/static/css/site\.[0-9a-f]{12}\.css$')
+		self.assertLess(
+			settings.INSTALLED_APPS.index('whitenoise.runserver_nostatic'),
+			settings.INSTALLED_APPS.index('django.contrib.staticfiles'),
+		)
+		response = self.client.get(hashed, HTTP_ACCEPT_ENCODING='gzip')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response['Cache-Control'], 'max-age=315360000, public, immutable')
+		self.assertEqual(response['Content-Encoding'], 'gzip')
+
+
 class BlogPostAPITest(APITestCase):
 	"""Test cases for BlogPost REST API"""
 
@@ -252,6 +1327,13 @@ class BlogPostAPITest(APITestCase):
 		self.assertEqual(response.status_code, status.HTTP_200_OK)
 		self.assertGreater(len(response.data['results']), 0)
 
+	def test_blog_list_api_does_not_load_content(self):
+		"""Listings read reading_time without selecting the body"""
+		with CaptureQueriesContext(connection) as queries:
+			response = self.client.get('/api/blogs/')
+		self.assertIn('reading_time', response.data['results'][0])
+		self.assertFalse(any('"content"' in query['sql'] for query in queries))
+
 	def test_blog_detail_api(self):
 		"""Test blog detail endpoint"""
 		response = self.client.get(f'/api/blogs/{self.blog.id}/')
@@ -271,12 +1353,334 @@ class BlogPostAPITest(APITestCase):
 
 	def test_increment_views_action(self):
 		"""Test the increment_views custom action"""
+		cache.clear()
 		response = self.client.post(f'/api/blogs/{self.blog.id}/increment_views/')
 		self.assertEqual(response.status_code, status.HTTP_200_OK)
+		# The buffered count is returned right away and written on flush
+		self.assertEqual(response.data['views_count'], 1)
+		flush_view_counts()
 		self.blog.refresh_from_db()
 		self.assertEqual(self.blog.views_count, 1)
 
 
+class QueryBudgetTests(APITestCase):
+	"""Every API endpoint must run a fixed number of queries.
+
+	The data set has several rows with several tags each, so a serializer
+	field that reintroduces per-row queries pushes an endpoint over budget.
+	"""
+
+	# (method, url, budget); {blog} and {project} are filled in by setUp.
+	# Conditional-GET validators are computed from the fetched rows.
+	BUDGETS = [
+		('get', '/api/blogs/', 3),  # count, page, tags
+		('get', '/api/blogs/?count=false', 2),  # page, tags
+		('get', '/api/blogs/{blog}/', 4),  # post, tags, related, related tags
+		('get', '/api/blogs/{blog}/related_posts/', 3),  # post, related, related tags
+		('post', '/api/blogs/{blog}/increment_views/', 1),  # post; the view is buffered
+		('get', '/api/portfolio/', 3),
+		('get', '/api/portfolio/{project}/', 2),
+		('get', '/api/portfolio/featured/', 2),
+		('get', '/api/services/', 2),
+		('get', '/api/skills/', 2),
+	]
+
+	def setUp(self):
+		tags = [Tag.objects.create(name=f"Tag {i}", slug=f"tag-{i}") for i in range(3)]
+		for i in range(5):
+			post = BlogPost.objects.create(
+				title=f"Post {i}", slug=f"budget-post-{i}", category="Budget",
+				excerpt="Excerpt", content="Content"
+			)
+			post.tags.add(*tags)
+			project = Portfolio.objects.create(
+				title=f"Project {i}", slug=f"budget-project-{i}", category="Web",
+				image="portfolio/p.jpg", description="Project", is_featured=True
+			)
+			project.tags.add(*tags)
+			Service.objects.create(title=f"Service {i}", slug=f"budget-service-{i}", description="Service", icon="fas fa-code", order=i)
+			Skill.objects.create(name=f"Skill {i}", category="Budget")
+		self.ids = {'blog': post.id, 'project': project.id}
+
+	def test_endpoints_stay_within_query_budget(self):
+		for method, url, budget in self.BUDGETS:
+			url = url.format(**self.ids)
+			with self.subTest(url=url, method=method):
+				with self.assertNumQueries(budget):
+					response = getattr(self.client, method)(url)
+				self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class KeysetPaginationTests(APITestCase):
+	"""Test cases for cursor pagination on the list APIs"""
+
+	def setUp(self):
+		published = timezone.now()
+		# Pairs of posts share a published_date so the id breaks the tie
+		for i in range(25):
+			post = BlogPost.objects.create(
+				title=f"Post {i}", slug=f"keyset-post-{i}", category="Keyset",
+				excerpt="Excerpt", content="Content"
+			)
+			BlogPost.objects.filter(pk=post.pk).update(published_date=published - timedelta(days=i // 2))
+		BlogPost.objects.exclude(category="Keyset").delete()
+
+	def walk(self, url):
+		ids = []
+		while url:
+			response = self.client.get(url)
+			self.assertEqual(response.status_code, status.HTTP_200_OK)
+			ids += [result['id'] for result in response.data['results']]
+			url = response.data['next']
+		return ids
+
+	def test_pages_follow_the_ordering_without_gaps(self):
+		"""Walking the cursors visits every post once, in order"""
+		expected = list(BlogPost.objects.order_by('-published_date', '-id').values_list('id', flat=True))
+		self.assertEqual(self.walk('/api/blogs/'), expected)
+		self.assertEqual(self.walk('/api/blogs/?ordering=published_date'), expected[::-1])
+
+	def test_previous_link_returns_the_previous_page(self):
+		first = self.client.get('/api/blogs/')
+		second = self.client.get(first.data['next'])
+		back = self.client.get(second.data['previous'])
+		self.assertEqual(back.data['results'], first.data['results'])
+
+	def test_pages_do_not_use_offset(self):
+		first = self.client.get('/api/blogs/')
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get(first.data['next'])
+		self.assertFalse(any('OFFSET' in query['sql'] for query in queries))
+
+	def test_count_is_optional(self):
+		self.assertEqual(self.client.get('/api/blogs/').data['count'], 25)
+		self.assertNotIn('count', self.client.get('/api/blogs/?count=false').data)
+
+	def test_unindexed_ordering_falls_back_to_pages(self):
+		response = self.client.get('/api/blogs/?ordering=-views_count&page=2')
+		self.assertEqual(response.data['count'], 25)
+		self.assertEqual(len(response.data['results']), 10)
+
+	def test_invalid_cursor(self):
+		response = self.client.get('/api/blogs/?cursor=bogus')
+		self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ConditionalGetTests(APITestCase):
+	"""Test cases for ETag and Last-Modified on the read APIs"""
+
+	def setUp(self):
+		cache.clear()
+		self.blog = BlogPost.objects.create(
+			title="Validators", slug="validators", category="HTTP",
+			excerpt="Excerpt", content="Content"
+		)
+
+	def test_responses_carry_validators(self):
+		for url in ['/api/blogs/', f'/api/blogs/{self.blog.id}/', '/api/portfolio/', '/api/services/', '/api/skills/']:
+			with self.subTest(url=url):
+				response = self.client.get(url)
+				self.assertTrue(response['ETag'].startswith('W/"'))
+
+	def test_last_modified_only_where_sound(self):
+		"""Lists, and details showing view counts or tags, get no Last-Modified"""
+		self.assertNotIn('Last-Modified', self.client.get('/api/blogs/'))
+		self.assertNotIn('Last-Modified', self.client.get(f'/api/blogs/{self.blog.id}/'))
+		self.assertIn('Last-Modified', self.client.get(f'/api/blogs/{self.blog.id}/?fields=title,content'))
+
+	def test_matching_etag_returns_304_before_serializing(self):
+		url = f'/api/blogs/{self.blog.id}/'
+		etag = self.client.get(url)['ETag']
+		with mock.patch.object(BlogPostDetailSerializer, 'to_representation') as serialize:
+			with self.assertNumQueries(2):  # post, tags
+				response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+		self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+		self.assertEqual(response['ETag'], etag)
+		serialize.assert_not_called()
+
+	def test_if_modified_since(self):
+		url = f'/api/blogs/{self.blog.id}/?fields=title,content'
+		response = self.client.get(url)
+		response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+		self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+	def test_unpublishing_produces_a_new_list_etag(self):
+		"""Rows leaving the list change its ETag though no date moves forward"""
+		etag = self.client.get('/api/blogs/')['ETag']
+		BlogPost.objects.filter(pk=self.blog.pk).update(is_published=False)
+		self.assertNotEqual(self.client.get('/api/blogs/', HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+	def test_list_filters_once(self):
+		"""The search runs once per request, validators included"""
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get('/api/blogs/?search=validators&count=false')
+		self.assertEqual(sum('leumas_search' in query['sql'] for query in queries), 1)
+
+	def test_changes_produce_a_new_etag(self):
+		etag = self.client.get('/api/blogs/')['ETag']
+		self.blog.title = "Validators, revised"
+		self.blog.save()
+		self.assertNotEqual(self.client.get('/api/blogs/', HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+	def test_flushed_view_counts_produce_a_new_etag(self):
+		etag = self.client.get('/api/blogs/')['ETag']
+		record_view(self.blog.id)
+		flush_view_counts()
+		self.assertNotEqual(self.client.get('/api/blogs/')['ETag'], etag)
+
+
+class SparseFieldsetTests(APITestCase):
+	"""Test cases for ?fields= / ?omit= and the matching column projection"""
+
+	def setUp(self):
+		tag = Tag.objects.create(name="Sparse", slug="sparse")
+		self.blog = BlogPost.objects.create(
+			title="Sparse", slug="sparse", category="API",
+			excerpt="Excerpt", content="A long body"
+		)
+		self.blog.tags.add(tag)
+
+	def test_fields_limits_the_response(self):
+		response = self.client.get('/api/blogs/?fields=id,title')
+		self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
+
+	def test_omit_drops_fields(self):
+		response = self.client.get(f'/api/blogs/{self.blog.id}/?omit=content,related_posts')
+		self.assertNotIn('content', response.data)
+		self.assertNotIn('related_posts', response.data)
+		self.assertIn('title', response.data)
+
+	def test_unrequested_columns_and_relations_are_not_loaded(self):
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get('/api/blogs/?fields=id,title&count=false')
+		sql = ' '.join(query['sql'] for query in queries)
+		self.assertNotIn('"content"', sql)
+		self.assertNotIn('"excerpt"', sql)
+		self.assertNotIn('leumas_tag', sql)
+
+	def test_detail_skips_related_posts_unless_requested(self):
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get(f'/api/blogs/{self.blog.id}/?fields=id,content')
+		self.assertFalse(any('leumas_relatedpost' in query['sql'] for query in queries))
+
+	def test_fields_apply_to_every_serializer(self):
+		Skill.objects.create(name="Python", category="Languages")
+		response = self.client.get('/api/skills/?fields=name')
+		self.assertEqual(response.data['results'][0], {'name': 'Python'})
+
+
+class ORJSONRendererTests(TestCase):
+	"""The orjson renderer and parser must be interchangeable with DRF's"""
+
+	data = {
+		'published': timezone.make_aware(datetime(2024, 2, 23, 20, 0, 0, 123456)),
+		'day': date(2024, 2, 23),
+		'price': Decimal('9.99'),
+		'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+		'title': 'Caf\u00e9 \u2028 notes',
+		'tags': [1, 2, None, True],
+		7: 'int key',
+	}
+
+	def test_output_matches_the_stdlib_renderer(self):
+		self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+	def test_falls_back_without_orjson(self):
+		with mock.patch('leumas.renderers.orjson', None):
+			self.assertEqual(ORJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+	def test_indented_output_uses_the_stdlib_renderer(self):
+		media_type = 'application/json; indent=4'
+		self.assertEqual(
+			ORJSONRenderer().render(self.data, media_type),
+			JSONRenderer().render(self.data, media_type)
+		)
+
+	def test_parser_round_trip(self):
+		parsed = ORJSONParser().parse(BytesIO(b'{"email": "caf\xc3\xa9@example.com"}'))
+		self.assertEqual(parsed, {'email': 'caf\u00e9@example.com'})
+		with self.assertRaises(ParseError):
+			ORJSONParser().parse(BytesIO(b'{"email": '))
+
+	def test_api_negotiates_json(self):
+		response = self.client.get('/api/skills/', HTTP_ACCEPT='application/json')
+		self.assertEqual(response['Content-Type'], 'application/json')
+		self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+
+
+class FullTextSearchAPITest(APITestCase):
+	"""Test cases for the full-text ?search= backend"""
+
+	def setUp(self):
+		self.title_hit = BlogPost.objects.create(
+			title="Zeppelin deployment guide", slug="zeppelin-guide", category="Search",
+			excerpt="Excerpt", content="<p>Rolling out airships.</p>"
+		)
+		self.body_hit = BlogPost.objects.create(
+			title="Unrelated title", slug="zeppelin-body", category="Search",
+			excerpt="Excerpt", content="<p>A short note that mentions a zeppelin once.</p>"
+		)
+
+	def test_search_ranks_title_matches_first(self):
+		"""Title matches outrank body matches and carry a snippet"""
+		response = self.client.get('/api/blogs/?search=zeppelin')
+		ids = [result['id'] for result in response.data['results']]
+		self.assertEqual(ids, [self.title_hit.id, self.body_hit.id])
+		self.assertIn('<mark>zeppelin</mark>', response.data['results'][1]['search_snippet'])
+
+	def test_search_matches_prefixes(self):
+		"""Partial words match like the old icontains search"""
+		response = self.client.get('/api/blogs/?search=zepp')
+		self.assertEqual(len(response.data['results']), 2)
+
+	def test_search_index_follows_saves_and_deletes(self):
+		"""The index is kept in sync by signals"""
+		self.body_hit.content = "<p>Nothing to see here.</p>"
+		self.body_hit.save()
+		self.title_hit.delete()
+		response = self.client.get('/api/blogs/?search=zeppelin')
+		self.assertEqual(response.data['results'], [])
+
+	def test_unpublished_posts_are_not_indexed(self):
+		"""Unpublished posts leave the index and never use up the result cap"""
+		self.title_hit.is_published = False
+		self.title_hit.save()
+		with connection.cursor() as cursor:
+			hits = get_backend().search(cursor, 'blog', 'zeppelin', 10)
+		self.assertEqual([object_id for object_id, _ in hits], [self.body_hit.id])
+		with override_settings(SEARCH_MAX_RESULTS=1):
+			response = self.client.get('/api/blogs/?search=zeppelin')
+		self.assertEqual([result['id'] for result in response.data['results']], [self.body_hit.id])
+
+	def test_migrations_keep_their_own_copy_of_the_index(self):
+		"""0006 indexes every post as it always did; 0016 then drops the unpublished ones"""
+		BlogPost.objects.filter(pk=self.title_hit.pk).update(is_published=False)
+		editor = SimpleNamespace(connection=connection)
+		importlib.import_module('leumas.migrations.0006_search_index').create_search_index(django_apps, editor)
+		with connection.cursor() as cursor:
+			hits = get_backend().search(cursor, 'blog', 'zeppelin', 10)
+		self.assertEqual({object_id for object_id, _ in hits}, {self.title_hit.id, self.body_hit.id})
+		importlib.import_module('leumas.migrations.0016_search_index_published').drop_unpublished_posts(django_apps, editor)
+		with connection.cursor() as cursor:
+			hits = get_backend().search(cursor, 'blog', 'zeppelin', 10)
+		self.assertEqual([object_id for object_id, _ in hits], [self.body_hit.id])
+
+	def test_search_does_not_scan_content(self):
+		"""The query never runs LIKE over the post body"""
+		with CaptureQueriesContext(connection) as queries:
+			self.client.get('/api/blogs/?search=zeppelin')
+		self.assertFalse(any('LIKE' in query['sql'] for query in queries))
+
+	def test_portfolio_search(self):
+		"""Portfolio projects are searchable too"""
+		Portfolio.objects.create(
+			title="Airship tracker", slug="airship-tracker", category="Web",
+			image="portfolio/a.jpg", description="Tracks zeppelin fleets"
+		)
+		response = self.client.get('/api/portfolio/?search=zeppelin')
+		self.assertEqual(len(response.data['results']), 1)
+
+
 class PortfolioAPITest(APITestCase):
 	"""Test cases for Portfolio REST API"""
 
@@ -368,13 +1772,49 @@ class NewsletterAPITest(APITestCase):
 		self.assertTrue(Newsletter.objects.filter(email='subscriber@example.com').exists())
 
 	def test_newsletter_duplicate_email(self):
-		"""Test that duplicate emails are rejected"""
+		"""Subscribing an active address again is a no-op, not an error"""
 		email = 'subscriber@example.com'
 		Newsletter.objects.create(email=email)
 		
-		data = {'email': email}
+		data = {'email': email.upper()}
 		response = self.client.post('/api/newsletter/', data)
-		self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+		self.assertEqual(response.status_code, status.HTTP_200_OK)
+		self.assertEqual(Newsletter.objects.count(), 1)
+
+	def test_newsletter_resubscribe_reactivates(self):
+		"""An unsubscribed address is reactivated"""
+		Newsletter.objects.create(email='gone@example.com', is_active=False)
+		response = self.client.post('/api/newsletter/', {'email': 'gone@example.com'})
+		self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+		self.assertTrue(Newsletter.objects.get(email='gone@example.com').is_active)
+
+	def test_newsletter_subscribe_is_one_statement(self):
+		"""Validation runs no queries; the upsert is the only one"""
+		with self.assertNumQueries(1):
+			self.client.post('/api/newsletter/', {'email': 'fast@example.com'})
+
+	def test_newsletter_batch(self):
+		"""Partners subscribe many addresses per request with a token"""
+		Newsletter.objects.create(email='known@example.com')
+		data = {'emails': ['a@example.com', 'B@example.com', 'known@example.com', 'nope']}
+		partner = User.objects.create_user('partner')
+		partner.user_permissions.add(Permission.objects.get(codename='bulk_subscribe'))
+		# Non-browser clients send no CSRF token
+		client = APIClient(enforce_csrf_checks=True)
+		client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=partner).key}')
+		response = client.post('/api/newsletter/batch/', data, format='json')
+		self.assertEqual(response.data, {'subscribed': 2, 'already_subscribed': 1, 'invalid': ['nope']})
+		self.assertTrue(Newsletter.objects.filter(email='b@example.com').exists())
+
+	def test_newsletter_batch_is_limited_to_staff_and_partners(self):
+		"""Anonymous callers and ordinary users may not bulk-subscribe"""
+		data = {'emails': ['a@example.com']}
+		url = '/api/newsletter/batch/'
+		self.assertEqual(self.client.post(url, data, format='json').status_code, status.HTTP_401_UNAUTHORIZED)
+		self.client.force_authenticate(User.objects.create_user('visitor'))
+		self.assertEqual(self.client.post(url, data, format='json').status_code, status.HTTP_403_FORBIDDEN)
+		self.client.force_authenticate(User.objects.create_user('editor', is_staff=True))
+		self.assertEqual(self.client.post(url, data, format='json').status_code, status.HTTP_200_OK)
 
 	def test_newsletter_invalid_email(self):
 		"""Test that invalid emails are rejected"""
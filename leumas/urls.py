@@ -9,7 +9,7 @@ from leumas.views import (
     index, about, blog, blogs, blog_detail,
     portfolio_detail, works, services, service_detail,
     ContactView, ContactSuccessView, subscribe_newsletter,
-    download_cv
+    download_cv, sitemap, sitemap_section, blog_rss, blog_atom, metrics_view
 )
 
 # Register API viewsets
@@ -39,6 +39,11 @@ urlpatterns = [
     path('subscribe-newsletter/', subscribe_newsletter, name='subscribe-newsletter'),
     path('download-cv/', download_cv, name='download-cv'),
     path('pj', index, name='leumas-pj'),
+    path('sitemap.xml', sitemap, name='sitemap'),
+    path('sitemap-<slug:section>.xml', sitemap_section, name='sitemap-section'),
+    path('blog/rss.xml', blog_rss, name='blog-rss'),
+    path('blog/atom.xml', blog_atom, name='blog-atom'),
+    path('metrics', metrics_view, name='metrics'),
 
     # REST API endpoints
     *router.urls,
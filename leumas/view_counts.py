@@ -0,0 +1,85 @@
+"""Buffered blog view counting.
+
+Views are counted with an atomic cache increment instead of a write per hit.
+Pending counts are applied to BlogPost.views_count with F() updates by
+flush_view_counts(), which runs opportunistically every
+VIEW_COUNT_FLUSH_SECONDS and from the flush_view_counts management command.
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from leumas.models import BlogPost
+
+PENDING_KEY = 'leumas:views:pending:{}'
+FLUSH_LOCK_KEY = 'leumas:views:flush-lock'
+
+# Posts this process has counted views for since its last flush
+_dirty = set()
+_dirty_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def record_view(post_id):
+    """Count one view of `post_id`; returns the views not yet flushed"""
+    global _last_flush
+    key = PENDING_KEY.format(post_id)
+    cache.add(key, 0, None)
+    try:
+        pending = cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.add(key, 1, None)
+        pending = 1
+    with _dirty_lock:
+        _dirty.add(post_id)
+    if time.monotonic() - _last_flush >= settings.VIEW_COUNT_FLUSH_SECONDS:
+        _last_flush = time.monotonic()
+        flush_view_counts()
+    return pending
+
+
+def flush_view_counts(post_ids=None):
+    """Apply pending view counts to the database; returns the views written.
+
+    Without `post_ids` the posts this process counted are flushed. Only one
+    flusher runs at a time, so a pending count is never applied twice.
+    """
+    if not cache.add(FLUSH_LOCK_KEY, 1, 60):
+        return 0
+    try:
+        if post_ids is None:
+            with _dirty_lock:
+                post_ids = list(_dirty)
+                _dirty.clear()
+        keys = {PENDING_KEY.format(post_id): post_id for post_id in post_ids}
+        pending = {keys[key]: count for key, count in cache.get_many(keys).items() if count}
+
+        # One UPDATE per distinct increment instead of one per post
+        by_count = defaultdict(list)
+        for post_id, count in pending.items():
+            by_count[count].append(post_id)
+        try:
+            with transaction.atomic():
+                for count, ids in by_count.items():
+                    BlogPost.objects.filter(pk__in=ids).update(views_count=F('views_count') + count)
+        except Exception:
+            with _dirty_lock:
+                _dirty.update(pending)
+            raise
+
+        # Views recorded while the UPDATE ran stay pending for the next flush
+        for post_id, count in pending.items():
+            try:
+                cache.decr(PENDING_KEY.format(post_id), count)
+            except ValueError:
+                pass
+        return sum(pending.values())
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
@@ -7,6 +7,9 @@ This package organizes views into logical modules:
 - services.py: Services listing and detail views
 - contact.py: Contact form and newsletter subscription
 - cv.py: CV download as PDF
+- sitemap.py: Cached sitemap.xml and its index sections
+- feeds.py: Cached RSS and Atom feeds of the blog
+- metrics.py: Prometheus scrape endpoint
 - data.py: Shared data constants (PORTFOLIO_PROJECTS, SERVICES)
 """
 
@@ -16,6 +19,9 @@ from leumas.views.portfolio import portfolio_detail, works
 from leumas.views.services import services, service_detail
 from leumas.views.contact import ContactView, ContactSuccessView, subscribe_newsletter
 from leumas.views.cv import download_cv
+from leumas.views.sitemap import sitemap, sitemap_section
+from leumas.views.feeds import blog_rss, blog_atom
+from leumas.views.metrics import metrics_view
 
 __all__ = [
     # Home views
@@ -30,4 +36,10 @@ __all__ = [
     'ContactView', 'ContactSuccessView', 'subscribe_newsletter',
     # CV view
     'download_cv',
+    # Sitemap views
+    'sitemap', 'sitemap_section',
+    # Feed views
+    'blog_rss', 'blog_atom',
+    # Metrics view
+    'metrics_view',
 ]
@@ -1,28 +1,32 @@
 from django.shortcuts import render
-from leumas.blog_helpers import get_blog_posts_with_dynamic_dates
+from leumas.blog_helpers import get_published_blog_post, get_published_blog_posts
+from leumas.cache import versioned_cache_page
 
 
+@versioned_cache_page('blog')
 def blog(request):
     """Display blog listings page"""
-    blog_posts = get_blog_posts_with_dynamic_dates()
+    blog_posts = get_published_blog_posts()
     context = {'all_blogs': blog_posts, 'scroll_to': 'blog'}
     return render(request, 'leumas/blogs.html', context)
 
 
+@versioned_cache_page('blog')
 def blogs(request):
     """Alias for blog view"""
-    blog_posts = get_blog_posts_with_dynamic_dates()
+    blog_posts = get_published_blog_posts()
     context = {'all_blogs': blog_posts, 'scroll_to': 'blog'}
     return render(request, 'leumas/blogs.html', context)
 
 
+@versioned_cache_page('blog')
 def blog_detail(request, blog_id):
     """Display details for a specific blog post"""
-    blog_posts = get_blog_posts_with_dynamic_dates()
-    blog = blog_posts.get(blog_id)
-    if not blog:
-        blogs_list = list(blog_posts.values())
-        blog = blogs_list[0] if blogs_list else None
+    blog_posts = get_published_blog_posts()
+    blog = get_published_blog_post(blog_id)
+    if not blog and blog_posts:
+        blog_id = next(iter(blog_posts))
+        blog = get_published_blog_post(blog_id)
     
     context = {
         'blog': blog,
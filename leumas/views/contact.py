@@ -2,6 +2,7 @@ from django.views.generic import FormView, TemplateView
 from django.urls import reverse_lazy
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
+from django.views.decorators.vary import vary_on_headers
 from django.utils.decorators import method_decorator
 try:
     from ratelimit.decorators import ratelimit
@@ -10,14 +11,16 @@ except Exception:
         def _decorator(func):
             return func
         return _decorator
-from django.template.loader import render_to_string
-from django.core.mail import EmailMultiAlternatives
 
+from leumas.contact_buffer import submit_contact
 from leumas.forms import ContactForm, NewsletterForm
-from leumas.models import Newsletter
+from leumas.newsletter import subscribe
+from leumas.outbox import queue_email
+from leumas.views.home import index_context
 
 
 @method_decorator(ratelimit(key='ip', rate='5/m', block=True), name='dispatch')
+@method_decorator(vary_on_headers('Accept'), name='dispatch')
 class ContactView(FormView):
     """Handle contact form submission with rate limiting"""
     template_name = 'leumas/index.html'
@@ -26,21 +29,23 @@ class ContactView(FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['scroll_to'] = 'contact'
+        context.update(index_context(self.request, scroll_to='contact'))
         return context
 
     def form_valid(self, form):
-        form.send()
+        # Saved and emailed in bulk off the request path; duplicates are dropped
+        submit_contact(form.cleaned_data)
         return super().form_valid(form)
 
 
+@method_decorator(vary_on_headers('Accept'), name='dispatch')
 class ContactSuccessView(TemplateView):
     """Display success message after contact form submission"""
     template_name = 'leumas/index.html'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['scroll_to'] = 'contact'
+        context.update(index_context(self.request, scroll_to='contact'))
         return context
 
 
@@ -51,24 +56,15 @@ def subscribe_newsletter(request):
     form = NewsletterForm(request.POST)
 
     if form.is_valid():
-        newsletter = form.save()
-
-        # Send confirmation email to subscriber
-        context = {'email': newsletter.email}
-        text_body = render_to_string('leumas/emails/newsletter_confirm.txt', context)
-        html_body = render_to_string('leumas/emails/newsletter_confirm.html', context)
-
-        msg = EmailMultiAlternatives(
-            subject='Newsletter subscription confirmed',
-            body=text_body,
-            from_email=None,
-            to=[newsletter.email]
-        )
-        msg.attach_alternative(html_body, 'text/html')
-        try:
-            msg.send(fail_silently=True)
-        except Exception:
-            pass
+        # Only new or reactivated subscribers get a confirmation, which is
+        # sent by the outbox worker
+        for email in subscribe([form.cleaned_data['email']]):
+            queue_email(
+                subject='Newsletter subscription confirmed',
+                to=[email],
+                template='leumas/emails/newsletter_confirm',
+                context={'email': email},
+            )
 
         return JsonResponse({
             'success': True,
@@ -77,6 +73,6 @@ def subscribe_newsletter(request):
     else:
         return JsonResponse({
             'success': False,
-            'message': 'Email already subscribed or invalid.',
+            'message': 'Please enter a valid email address.',
             'errors': form.errors
         }, status=400)
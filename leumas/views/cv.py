@@ -1,5 +1,13 @@
-from django.shortcuts import render
-from django.http import HttpResponse
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse
+from django.views.decorators.http import condition
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -9,9 +17,91 @@ from io import BytesIO
 
 from leumas.views.data import SERVICES
 
+CV_FILENAME = 'Samuel_Adomeh_CV.pdf'
 
-def download_cv(request):
-    """Generate and download CV as PDF"""
+CONTACT_TEXT = "Wroclaw, Poland | +48 661 910 134 | <a href='mailto:hemodasam@gmail.com'>hemodasam@gmail.com</a> | <a href='https://www.linkedin.com/in/samuel-adomeh'>LinkedIn</a> | <a href='https://github.com/leumasp'>GitHub</a>"
+
+SUMMARY = """With over a decade of experience as a Senior DevOps Engineer, I specialize in transforming complex development workflows into streamlined, automated processes. Expert in cloud infrastructure, containerization, CI/CD pipelines, and enterprise-level system architecture. Proven track record of delivering 99.9% uptime solutions, reducing deployment cycles by 60%, and optimizing infrastructure costs."""
+
+EDUCATION = [
+    ['2006-2008', 'MSC in Computer Engineer', 'Envato University'],
+    ['2003-2005', 'BSC in Computer Engineer', 'Envato University'],
+    ['2000-2002', 'HSC in Computer Engineer', 'Envato University'],
+]
+
+EXPERIENCE = [
+    ['2014-2018', 'Full Stack Web Developer', 'Envato Company'],
+    ['2011-2014', 'Web Developer', 'Envato Company'],
+    ['2009-2011', 'Web Designer', 'Envato Company'],
+]
+
+TECHNICAL_SKILLS = [
+    ['Cloud Platforms', 'AWS, Azure, Google Cloud Platform (GCP)'],
+    ['Containerization', 'Docker, Kubernetes, Docker Compose, Helm'],
+    ['CI/CD Tools', 'GitLab CI/CD, GitHub Actions, Jenkins, ArgoCD'],
+    ['Infrastructure as Code', 'Terraform, CloudFormation, Ansible'],
+    ['Monitoring & Logging', 'Prometheus, ELK Stack, Datadog, New Relic'],
+    ['Scripting Languages', 'Bash/Shell, Python, PowerShell, Groovy'],
+    ['Programming Languages', 'Python, Go, Node.js, Java'],
+    ['Databases', 'PostgreSQL, MySQL, MongoDB, Redis'],
+    ['Networking & Security', 'SSL/TLS, WAF, DDoS Protection, IAM, VPC Configuration'],
+    ['Tools & Platforms', 'Git, Docker Registry, Artifactory, Jenkins, SonarQube'],
+]
+
+LANGUAGES = "English - Fluent | Polish - Professional Working Proficiency"
+
+HIGHLIGHTS = [
+    "✓ Achieved 99.9% uptime SLA compliance across multiple deployments",
+    "✓ Reduced deployment cycles by 60% through CI/CD automation",
+    "✓ Designed and implemented multi-cloud infrastructure (AWS, Azure, GCP)",
+    "✓ Led teams of 5+ engineers in DevOps transformation initiatives",
+    "✓ Successfully migrated 15+ legacy applications to cloud-native architecture",
+    "✓ Implemented monitoring solutions covering 1000+ metrics across enterprise infrastructure",
+]
+
+# Bump when the layout below changes; the data above is hashed automatically
+CV_LAYOUT_VERSION = 1
+
+
+def _content_version():
+    """Content hash of everything rendered into the CV"""
+    content = json.dumps(
+        [CV_LAYOUT_VERSION, CONTACT_TEXT, SUMMARY, SERVICES, EDUCATION,
+         EXPERIENCE, TECHNICAL_SKILLS, LANGUAGES, HIGHLIGHTS],
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+# The CV is built from module constants, so its version is fixed per process
+CV_VERSION = _content_version()
+
+
+def get_cv_path(version=None):
+    """Path of the rendered CV for `version` (default: current content)"""
+    return Path(settings.CV_CACHE_DIR) / f'cv-{version or CV_VERSION}.pdf'
+
+
+def build_cv():
+    """Render the CV to disk unless this version already exists; returns its path"""
+    path = get_cv_path()
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file first so concurrent workers never serve a partial PDF
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(render_cv_pdf())
+        os.replace(tmp_path, path)
+    finally:
+        # Only left behind if rendering failed
+        Path(tmp_path).unlink(missing_ok=True)
+    return path
+
+
+def render_cv_pdf():
+    """Render the CV document and return the PDF bytes"""
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
     story = []
@@ -58,14 +148,12 @@ def download_cv(request):
     story.append(Paragraph("Senior DevOps Engineer", styles['Normal']))
     story.append(Spacer(1, 0.1*inch))
     
-    contact_text = "Wroclaw, Poland | +48 661 910 134 | <a href='mailto:hemodasam@gmail.com'>hemodasam@gmail.com</a> | <a href='https://www.linkedin.com/in/samuel-adomeh'>LinkedIn</a> | <a href='https://github.com/leumasp'>GitHub</a>"
-    story.append(Paragraph(contact_text, small_style))
+    story.append(Paragraph(CONTACT_TEXT, small_style))
     story.append(Spacer(1, 0.15*inch))
     
     # Professional Summary
     story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-    summary = """With over a decade of experience as a Senior DevOps Engineer, I specialize in transforming complex development workflows into streamlined, automated processes. Expert in cloud infrastructure, containerization, CI/CD pipelines, and enterprise-level system architecture. Proven track record of delivering 99.9% uptime solutions, reducing deployment cycles by 60%, and optimizing infrastructure costs."""
-    story.append(Paragraph(summary, normal_style))
+    story.append(Paragraph(SUMMARY, normal_style))
     story.append(Spacer(1, 0.1*inch))
     
     # Services/Core Competencies
@@ -91,12 +179,7 @@ def download_cv(request):
     
     # Education
     story.append(Paragraph("EDUCATION", heading_style))
-    education_data = [
-        ['2006-2008', 'MSC in Computer Engineer', 'Envato University'],
-        ['2003-2005', 'BSC in Computer Engineer', 'Envato University'],
-        ['2000-2002', 'HSC in Computer Engineer', 'Envato University'],
-    ]
-    edu_table = Table(education_data, colWidths=[1*inch, 2*inch, 2.5*inch])
+    edu_table = Table(EDUCATION, colWidths=[1*inch, 2*inch, 2.5*inch])
     edu_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
         ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
@@ -112,12 +195,7 @@ def download_cv(request):
     
     # Experience
     story.append(Paragraph("EXPERIENCE", heading_style))
-    experience_data = [
-        ['2014-2018', 'Full Stack Web Developer', 'Envato Company'],
-        ['2011-2014', 'Web Developer', 'Envato Company'],
-        ['2009-2011', 'Web Designer', 'Envato Company'],
-    ]
-    exp_table = Table(experience_data, colWidths=[1*inch, 2*inch, 2.5*inch])
+    exp_table = Table(EXPERIENCE, colWidths=[1*inch, 2*inch, 2.5*inch])
     exp_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
         ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
@@ -134,20 +212,7 @@ def download_cv(request):
     # Technical Skills
     story.append(Paragraph("TECHNICAL SKILLS", heading_style))
     
-    skills_data = [
-        ['Cloud Platforms', 'AWS, Azure, Google Cloud Platform (GCP)'],
-        ['Containerization', 'Docker, Kubernetes, Docker Compose, Helm'],
-        ['CI/CD Tools', 'GitLab CI/CD, GitHub Actions, Jenkins, ArgoCD'],
-        ['Infrastructure as Code', 'Terraform, CloudFormation, Ansible'],
-        ['Monitoring & Logging', 'Prometheus, ELK Stack, Datadog, New Relic'],
-        ['Scripting Languages', 'Bash/Shell, Python, PowerShell, Groovy'],
-        ['Programming Languages', 'Python, Go, Node.js, Java'],
-        ['Databases', 'PostgreSQL, MySQL, MongoDB, Redis'],
-        ['Networking & Security', 'SSL/TLS, WAF, DDoS Protection, IAM, VPC Configuration'],
-        ['Tools & Platforms', 'Git, Docker Registry, Artifactory, Jenkins, SonarQube'],
-    ]
-    
-    skills_table = Table(skills_data, colWidths=[1.5*inch, 4.5*inch])
+    skills_table = Table(TECHNICAL_SKILLS, colWidths=[1.5*inch, 4.5*inch])
     skills_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
         ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
@@ -165,26 +230,33 @@ def download_cv(request):
     
     # Languages
     story.append(Paragraph("LANGUAGES", heading_style))
-    story.append(Paragraph("English - Fluent | Polish - Professional Working Proficiency", normal_style))
+    story.append(Paragraph(LANGUAGES, normal_style))
     story.append(Spacer(1, 0.1*inch))
     
     # Certifications/Highlights
     story.append(Paragraph("KEY HIGHLIGHTS", heading_style))
-    highlights = [
-        "✓ Achieved 99.9% uptime SLA compliance across multiple deployments",
-        "✓ Reduced deployment cycles by 60% through CI/CD automation",
-        "✓ Designed and implemented multi-cloud infrastructure (AWS, Azure, GCP)",
-        "✓ Led teams of 5+ engineers in DevOps transformation initiatives",
-        "✓ Successfully migrated 15+ legacy applications to cloud-native architecture",
-        "✓ Implemented monitoring solutions covering 1000+ metrics across enterprise infrastructure",
-    ]
-    for highlight in highlights:
+    for highlight in HIGHLIGHTS:
         story.append(Paragraph(highlight, small_style))
     
     # Build PDF
     doc.build(story)
-    buffer.seek(0)
-    
-    response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
-    response['Content-Disposition'] = 'attachment; filename="Samuel_Adomeh_CV.pdf"'
-    return response
+    return buffer.getvalue()
+
+
+def _cv_etag(request):
+    return CV_VERSION
+
+
+def _cv_last_modified(request):
+    return datetime.fromtimestamp(build_cv().stat().st_mtime, tz=timezone.utc)
+
+
+@condition(etag_func=_cv_etag, last_modified_func=_cv_last_modified)
+def download_cv(request):
+    """Download the CV as PDF, rendered once per content version"""
+    return FileResponse(
+        build_cv().open('rb'),
+        as_attachment=True,
+        filename=CV_FILENAME,
+        content_type='application/pdf',
+    )
@@ -1,6 +1,9 @@
 # Data constants for portfolio and services
 # These are separated for easier maintenance and potential database migration
 
+import hashlib
+import json
+
 PORTFOLIO_PROJECTS = {
     1: {
         'title': 'Kubernetes Multi-Cloud Orchestration',
@@ -377,3 +380,13 @@ SERVICES = {
         'technologies': ['Microservices', 'Distributed Systems', 'Cloud Architecture', 'DevOps', 'Kubernetes', 'Docker']
     },
 }
+
+
+def _data_version(data):
+    return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()[:12]
+
+
+# Content hashes of the constants above, used in the index page's fragment
+# cache keys so a deploy that edits them renders the sections afresh
+PORTFOLIO_PROJECTS_VERSION = _data_version(PORTFOLIO_PROJECTS)
+SERVICES_VERSION = _data_version(SERVICES)
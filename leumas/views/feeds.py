@@ -0,0 +1,9 @@
+from django.conf import settings
+
+from leumas.cache import versioned_conditional_cache
+from leumas.feeds import BlogPostsAtomFeed, BlogPostsFeed
+
+# Polling aggregators get the cached bytes, or a 304 when they send the
+# ETag / Last-Modified they already have
+blog_rss = versioned_conditional_cache('blog', max_age=settings.FEED_MAX_AGE)(BlogPostsFeed())
+blog_atom = versioned_conditional_cache('blog', max_age=settings.FEED_MAX_AGE)(BlogPostsAtomFeed())
@@ -1,24 +1,43 @@
+from django.conf import settings
 from django.shortcuts import render
-from leumas.blog_helpers import get_blog_posts_with_dynamic_dates
-from leumas.views.data import SERVICES, PORTFOLIO_PROJECTS
+from leumas.blog_helpers import get_published_preview_posts
+from leumas.cache import deploy_version, get_version, versioned_cache_page
+from leumas.images import negotiate_format
+from leumas.views.data import PORTFOLIO_PROJECTS, PORTFOLIO_PROJECTS_VERSION, SERVICES, SERVICES_VERSION
 
 
-def index(request):
-    """Display home page with featured content"""
-    blog_posts = get_blog_posts_with_dynamic_dates()
-    context = {
+def index_context(request, **extra):
+    """Context for the views that render index.html.
+
+    The page's sections are fragment-cached, keyed on the deploy and data
+    versions below, so index, about, contact and success all share the fragments and
+    only `scroll_to` differs between them.
+    """
+    return {
         'all_services': SERVICES,
         'all_projects': PORTFOLIO_PROJECTS,
-        'preview_blogs': {1: blog_posts.get(1), 2: blog_posts.get(2), 3: blog_posts.get(3), 4: blog_posts.get(4)},
+        # Passed uncalled: only evaluated when the blog fragment is rendered
+        'preview_blogs': get_published_preview_posts,
+        'fragment_seconds': settings.CONTENT_CACHE_SECONDS,
+        'fragment_versions': {
+            'site': deploy_version(),
+            'services': SERVICES_VERSION,
+            'projects': PORTFOLIO_PROJECTS_VERSION,
+            'blog': get_version('blog'),
+        },
+        # Fragments with <img srcset> vary on the negotiated image format
+        'image_format': negotiate_format(request),
+        **extra,
     }
-    return render(request, 'leumas/index.html', context)
 
 
+@versioned_cache_page('blog', data_versions=(SERVICES_VERSION, PORTFOLIO_PROJECTS_VERSION))
+def index(request):
+    """Display home page with featured content"""
+    return render(request, 'leumas/index.html', index_context(request))
+
+
+@versioned_cache_page('blog', data_versions=(SERVICES_VERSION, PORTFOLIO_PROJECTS_VERSION))
 def about(request):
     """Display about page"""
-    context = {
-        'all_services': SERVICES,
-        'all_projects': PORTFOLIO_PROJECTS,
-        'scroll_to': 'about'
-    }
-    return render(request, 'leumas/index.html', context)
+    return render(request, 'leumas/index.html', index_context(request, scroll_to='about'))
@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+from leumas import metrics
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint, limited to METRICS_ALLOWED_IPS"""
+    allowed = settings.METRICS_ALLOWED_IPS
+    if metrics.prometheus_client is None or ('*' not in allowed and request.META.get('REMOTE_ADDR') not in allowed):
+        raise Http404
+    body, content_type = metrics.render_latest()
+    return HttpResponse(body, content_type=content_type)
@@ -1,7 +1,9 @@
 from django.shortcuts import render
-from leumas.views.data import PORTFOLIO_PROJECTS
+from leumas.cache import versioned_cache_page
+from leumas.views.data import PORTFOLIO_PROJECTS, PORTFOLIO_PROJECTS_VERSION
 
 
+@versioned_cache_page(data_versions=(PORTFOLIO_PROJECTS_VERSION,))
 def portfolio_detail(request, project_id):
     """Display details for a specific portfolio project"""
     project = PORTFOLIO_PROJECTS.get(project_id)
@@ -17,6 +19,7 @@ def portfolio_detail(request, project_id):
     return render(request, 'leumas/portfolio-details.html', context)
 
 
+@versioned_cache_page(data_versions=(PORTFOLIO_PROJECTS_VERSION,))
 def works(request):
     """Display portfolio/works page"""
     context = {
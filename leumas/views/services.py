@@ -1,7 +1,9 @@
 from django.shortcuts import render
-from leumas.views.data import SERVICES
+from leumas.cache import versioned_cache_page
+from leumas.views.data import SERVICES, SERVICES_VERSION
 
 
+@versioned_cache_page(data_versions=(SERVICES_VERSION,))
 def services(request):
     """Display services page"""
     context = {
@@ -12,6 +14,7 @@ def services(request):
     return render(request, 'leumas/services.html', context)
 
 
+@versioned_cache_page(data_versions=(SERVICES_VERSION,))
 def service_detail(request, service_id):
     """Display details for a specific service"""
     service = SERVICES.get(service_id)
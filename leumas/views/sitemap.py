@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.contrib.sitemaps import views as sitemap_views
+
+from leumas.cache import versioned_conditional_cache
+from leumas.sitemaps import SITEMAPS
+from leumas.views.data import PORTFOLIO_PROJECTS_VERSION, SERVICES_VERSION
+
+DATA_VERSIONS = (PORTFOLIO_PROJECTS_VERSION, SERVICES_VERSION)
+
+
+@versioned_conditional_cache('blog', max_age=settings.SITEMAP_MAX_AGE, data_versions=DATA_VERSIONS)
+def sitemap(request):
+    """The whole sitemap, or a sitemap index once the URLs outgrow the
+    protocol's limit per file (Sitemap.limit, 50,000)"""
+    sitemaps = {section: sitemap_class() for section, sitemap_class in SITEMAPS.items()}
+    total = sum(site.paginator.count for site in sitemaps.values())
+    if total <= min(site.limit for site in sitemaps.values()):
+        return sitemap_views.sitemap(request, sitemaps)
+    return sitemap_views.index(request, sitemaps, sitemap_url_name='leumas:sitemap-section')
+
+
+@versioned_conditional_cache('blog', max_age=settings.SITEMAP_MAX_AGE, data_versions=DATA_VERSIONS)
+def sitemap_section(request, section):
+    """One page (?p=) of one section's sitemap, linked from the index"""
+    return sitemap_views.sitemap(request, SITEMAPS, section=section)